@@ -1,4 +1,5 @@
 import itertools
+from typing import Iterable, List
 
 # 2 to Ace
 # Maps card ranks to their numerical values (2-14, where Ace is 14)
@@ -37,30 +38,163 @@ VERBOSE_NAMES = [v[0] for v in VALID_CARDS]
 RANK_VALUES = [r[1] for r in VALID_CARD_RANKS]
 SUIT_VALUES = [s[1] for s in VALID_CARD_SUITS]
 
+# Integer card encoding: a card is its index in VALID_CARDS (0-51),
+# i.e. rank_index * 4 + suit_index with rank_index 0 (2) to 12 (Ace)
+# and suit_index following VALID_CARD_SUITS (C, D, H, S).
+# A set of cards is a 64-bit mask with bit i set for card i.
+VERBOSE_NAME_TO_INT = {name: i for i, name in enumerate(VERBOSE_NAMES)}
+RANK_VALUE_TO_INDEX = {rank: i for i, rank in enumerate(RANK_VALUES)}
+SUIT_VALUE_TO_INDEX = {suit: i for i, suit in enumerate(SUIT_VALUES)}
+
 
 class Card:
+    """
+    Immutable playing card. There is exactly one Card object per card:
+    Card(...) returns the interned instance, so decks, hands and discard piles
+    only hold references to the same 52 objects.
+    """
+
+    __slots__ = ("rank", "suit", "verbose_name", "card_int")
 
-    def __init__(self, card_name: str, card_face_rank: int, card_face_suit: str):
+    def __new__(cls, card_name: str, card_face_rank: int, card_face_suit: str):
 
-        if card_name not in VERBOSE_NAMES:
+        if card_name not in VERBOSE_NAME_TO_INT:
             raise ValueError(f"Invalid card name: {card_name}")
-        if card_face_rank not in RANK_VALUES:
+        if card_face_rank not in RANK_VALUE_TO_INDEX:
             raise ValueError(f"Invalid rank: {card_face_rank}")
-        if card_face_suit not in SUIT_VALUES:
+        if card_face_suit not in SUIT_VALUE_TO_INDEX:
             raise ValueError(f"Invalid suit: {card_face_suit}")
 
-        # Parse the card name to get suit and rank
-        self.rank, self.suit = card_face_rank, card_face_suit
-        self.verbose_name = card_name
+        card_int = (
+            RANK_VALUE_TO_INDEX[card_face_rank] * 4
+            + SUIT_VALUE_TO_INDEX[card_face_suit]
+        )
+        if VERBOSE_NAME_TO_INT[card_name] != card_int:
+            raise ValueError(
+                f"Card name {card_name} does not match rank {card_face_rank} and suit {card_face_suit}"
+            )
+        if card_int < len(_INTERNED_CARDS):
+            return _INTERNED_CARDS[card_int]
+
+        card = object.__new__(cls)
+        object.__setattr__(card, "rank", card_face_rank)
+        object.__setattr__(card, "suit", card_face_suit)
+        object.__setattr__(card, "verbose_name", card_name)
+        object.__setattr__(card, "card_int", card_int)
+        return card
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Card is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Card is immutable")
+
+    def __reduce__(self):
+        # Unpickle (and deepcopy) to the interned card instead of a copy
+        return (int_to_card, (self.card_int,))
+
+    def __copy__(self) -> "Card":
+        return self
+
+    def __deepcopy__(self, memo) -> "Card":
+        return self
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Card):
+            return NotImplemented
+        return self.card_int == other.card_int
+
+    def __hash__(self) -> int:
+        return self.card_int
+
+    # Cards order by rank, then suit (Club < Diamond < Heart < Spade)
+    def __lt__(self, other: "Card") -> bool:
+        if not isinstance(other, Card):
+            return NotImplemented
+        return self.card_int < other.card_int
+
+    def __le__(self, other: "Card") -> bool:
+        if not isinstance(other, Card):
+            return NotImplemented
+        return self.card_int <= other.card_int
+
+    def __gt__(self, other: "Card") -> bool:
+        if not isinstance(other, Card):
+            return NotImplemented
+        return self.card_int > other.card_int
+
+    def __ge__(self, other: "Card") -> bool:
+        if not isinstance(other, Card):
+            return NotImplemented
+        return self.card_int >= other.card_int
 
     def __str__(self) -> str:
         return (
             f'Card(card_name="{self.verbose_name}",rank={self.rank},suit="{self.suit}")'
         )
 
+    def __repr__(self) -> str:
+        return str(self)
+
+    def to_int(self) -> int:
+        """Return the integer encoding (0-51) of the card"""
+        return self.card_int
+
+    def to_mask(self) -> int:
+        """Return the card as a single-bit card mask"""
+        return 1 << self.card_int
+
     def to_dict(self):
         return {
             "card_name": self.verbose_name,
             "rank": self.rank,
             "suit": self.suit,
         }
+
+
+# All 52 cards, built once and indexed by their integer encoding.
+# Built in VALID_CARDS order, so each new card lands at its own index.
+_INTERNED_CARDS: List[Card] = []
+for card_name, (card_face_rank, card_face_suit) in VALID_CARDS:
+    _INTERNED_CARDS.append(Card(card_name, card_face_rank, card_face_suit))
+CARDS = tuple(_INTERNED_CARDS)
+
+
+def card_to_int(card: Card) -> int:
+    """Convert a Card to its integer encoding (0-51)"""
+    return card.card_int
+
+
+def int_to_card(card_int: int) -> Card:
+    """Convert an integer encoding (0-51) back to a Card"""
+    if not 0 <= card_int < len(CARDS):
+        raise ValueError(f"Invalid card int: {card_int}")
+    return CARDS[card_int]
+
+
+def ints_to_mask(card_ints: Iterable[int]) -> int:
+    """Convert integer cards to a card mask"""
+    mask = 0
+    for card_int in card_ints:
+        mask |= 1 << card_int
+    return mask
+
+
+def mask_to_ints(mask: int) -> List[int]:
+    """Convert a card mask to its integer cards, lowest first"""
+    card_ints = []
+    while mask:
+        low_bit = mask & -mask
+        card_ints.append(low_bit.bit_length() - 1)
+        mask ^= low_bit
+    return card_ints
+
+
+def cards_to_mask(cards: Iterable[Card]) -> int:
+    """Convert Cards to a card mask"""
+    return ints_to_mask(card.card_int for card in cards)
+
+
+def mask_to_cards(mask: int) -> List[Card]:
+    """Convert a card mask to Cards, lowest first"""
+    return [CARDS[card_int] for card_int in mask_to_ints(mask)]
@@ -1,32 +1,99 @@
 from typing import List, Optional
-from random import shuffle
-from engine.classes.Card import Card, VALID_CARDS
+import random
+from engine.classes.Card import Card, CARDS, ints_to_mask
 
 
 class Deck:
-    def __init__(self, new_deck: bool = True, do_not_shuffle: bool = False):
-        self.cards = []
-        if new_deck:
-            self.cards = [
-                Card(card_name, card_face_rank, card_face_suit)
-                for card_name, [card_face_rank, card_face_suit] in VALID_CARDS
-            ]
-        if not do_not_shuffle:
+    def __init__(
+        self,
+        new_deck: bool = True,
+        do_not_shuffle: bool = False,
+        seed: Optional[int] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Args:
+            new_deck: Start with the 52 cards, otherwise empty
+            do_not_shuffle: Keep the cards in VALID_CARDS order
+            seed: Seed of the deck's own random number generator, for replayable deals
+            rng: Random number generator to shuffle with, takes precedence over seed.
+                Without either, the global random module is used, so the deck holds
+                no generator and stays picklable.
+        """
+        if rng is not None:
+            self.rng: Optional[random.Random] = rng
+        elif seed is not None:
+            self.rng = random.Random(seed)
+        else:
+            self.rng = None
+        # Cards are dealt from the end by moving a cursor: the last _dealt entries of
+        # _cards have been dealt and are only removed when the list is read
+        self._cards: List[Card] = list(CARDS) if new_deck else []
+        self._dealt: int = 0
+        if new_deck and not do_not_shuffle:
             self._shuffle()
 
+    @property
+    def cards(self) -> List[Card]:
+        """Cards remaining in the deck, the next card to deal last"""
+        if self._dealt:
+            del self._cards[-self._dealt :]
+            self._dealt = 0
+        return self._cards
+
+    @cards.setter
+    def cards(self, cards: List[Card]):
+        self._cards = list(cards)
+        self._dealt = 0
+
     def _shuffle(self) -> None:
         """Shuffle the deck"""
-        shuffle(self.cards)
+        if self.rng is None:
+            random.shuffle(self.cards)
+        else:
+            self.rng.shuffle(self.cards)
+
+    def reset(self) -> None:
+        """Put the 52 cards back, reusing the same list, and shuffle them"""
+        self._cards[:] = CARDS
+        self._dealt = 0
+        self._shuffle()
+
+    def copy(self) -> "Deck":
+        """
+        Copy of the deck sharing its Card objects. Its own random number generator is
+        copied, so shuffling one deck leaves the other's future shuffles unchanged.
+        """
+        deck = Deck.__new__(Deck)
+        deck.rng = None
+        if self.rng is not None:
+            deck.rng = random.Random()
+            deck.rng.setstate(self.rng.getstate())
+        deck._cards = self._cards[: len(self._cards) - self._dealt]
+        deck._dealt = 0
+        return deck
+
+    def clear(self) -> None:
+        """Remove all cards"""
+        self._cards.clear()
+        self._dealt = 0
 
     def deal(self) -> Optional[Card]:
         """Deal one card from the deck"""
-        if self.get_deck_size() > 0:
-            return self.cards.pop()
+        index = len(self._cards) - self._dealt - 1
+        if index >= 0:
+            self._dealt += 1
+            return self._cards[index]
         raise ValueError("No cards remaining in the deck")
 
     def add_card(self, card: Card) -> None:
         """Add a card to the deck"""
-        self.cards.append(card)
+        if self._dealt:
+            # Reuse the slot of the last dealt card
+            self._cards[len(self._cards) - self._dealt] = card
+            self._dealt -= 1
+        else:
+            self._cards.append(card)
 
     def update_is_active(self, is_active: bool) -> None:
         """Update the is_active attribute of the deck"""
@@ -38,12 +105,20 @@ class Deck:
 
     def get_deck_size(self) -> int:
         """Return the number of cards remaining in the deck"""
-        return len(self.cards)
+        return len(self._cards) - self._dealt
 
     def get_cards(self) -> List[Card]:
         """Return the list of cards remaining in the deck"""
         return self.cards
 
+    def get_cards_as_ints(self) -> List[int]:
+        """Return the integer encoding (0-51) of the cards remaining in the deck"""
+        return [card.card_int for card in self.cards]
+
+    def get_cards_as_mask(self) -> int:
+        """Return the cards remaining in the deck as a 64-bit card mask"""
+        return ints_to_mask(card.card_int for card in self.cards)
+
     def _get_cards_as_list(self) -> List[str]:
         """use str() if not you'll get only the card address"""
         return [str(card) for card in self.cards]
@@ -58,7 +133,5 @@ class Deck:
         return f"Deck([{', '.join(self._get_cards_as_list())}])"
 
     def __eq__(self, other: "Deck") -> bool:
-        return (
-            self._get_cards_as_concatenated_string()
-            == other._get_cards_as_concatenated_string()
-        )
+        # Cards are interned, so this compares references in order
+        return self.cards == other.cards
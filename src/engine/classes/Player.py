@@ -30,12 +30,14 @@ class Player:
 
     def reset_player_for_new_single_game(self):
         """Reset the player's attributes to their initial values"""
-        self.hand = Deck(new_deck=False)
+        self.hand.clear()
         self.is_active = True
         self.is_all_in = False
         self.has_acted = False
         logger.info(
-            f"Player {self.player_id}: Reset for new single game. Current stack: {self.current_stack}"
+            "Player {}: Reset for new single game. Current stack: {}",
+            self.player_id,
+            self.current_stack,
         )
 
     def receive_card(self, card: Card):
@@ -64,9 +66,19 @@ class Player:
         self.current_stack -= amount
         self.has_acted = True
         logger.info(
-            f"Player {self.player_id}: Placed bet of {amount}. Current stack: {self.current_stack}"
+            "Player {}: Placed bet of {}. Current stack: {}",
+            self.player_id,
+            amount,
+            self.current_stack,
         )
 
+    def copy(self) -> "Player":
+        """Copy of the player with its own hand, e.g. for a cloned game"""
+        player = Player.__new__(Player)
+        player.__dict__.update(self.__dict__)
+        player.hand = self.hand.copy()
+        return player
+
     def active(self):
         self.is_active = True
 
@@ -87,7 +99,9 @@ class Player:
         self.bet(self.current_stack)
         self.is_all_in = True
         logger.info(
-            f"Player {self.player_id}: went all-in. Current stack: {self.current_stack}"
+            "Player {}: went all-in. Current stack: {}",
+            self.player_id,
+            self.current_stack,
         )
 
     def __str__(self):
@@ -96,6 +110,9 @@ class Player:
     def get_hand(self) -> Deck:
         return self.hand
 
+    def get_hand_as_ints(self) -> List[int]:
+        return self.hand.get_cards_as_ints()
+
     def _get_hand_as_list(self):
         return [str(card) for card in self.hand.cards]
 
@@ -0,0 +1,93 @@
+from typing import Dict, List, Optional
+
+
+class Pot:
+    def __init__(self, amount: int, eligible_player_ids: List[int]):
+        """
+        Main pot or side pot
+        Args:
+            amount: Chips in the pot
+            eligible_player_ids: Players who can win it, in seat order
+        """
+        self.amount = amount
+        self.eligible_player_ids = eligible_player_ids
+
+    def to_dict(self):
+        return {
+            "amount": self.amount,
+            "eligible_player_ids": self.eligible_player_ids,
+        }
+
+    def __str__(self) -> str:
+        return str(self.to_dict())
+
+    def __eq__(self, other: "Pot") -> bool:
+        return (
+            self.amount == other.amount
+            and self.eligible_player_ids == other.eligible_player_ids
+        )
+
+
+def build_pots(contributions: Dict[int, int], live_player_ids: List[int]) -> List[Pot]:
+    """
+    Split the chips put in during a hand into a main pot and side pots, in one pass
+    over the contributions sorted by amount. Each all-in amount closes a layer that
+    only the players who put in at least that much can win.
+    Args:
+        contributions: Chips put in during the hand per player_id, folded players included
+        live_player_ids: Players who have not folded, in seat order
+    Returns:
+        Pots from the main pot to the last side pot
+    """
+    amounts = dict(contributions)
+    for player_id in live_player_ids:
+        amounts.setdefault(player_id, 0)
+    ordered = sorted(amounts.items(), key=lambda item: item[1])
+    live = set(live_player_ids)
+    # Live players who have put in at least the current level, in seat order
+    eligible = list(live_player_ids)
+    pots: List[Pot] = []
+    previous_level = 0
+    i = 0
+    while i < len(ordered):
+        level = ordered[i][1]
+        if level > previous_level:
+            amount = (level - previous_level) * (len(ordered) - i)
+            if pots and (pots[-1].eligible_player_ids == eligible or not eligible):
+                # Chips from folded players, or bets nobody live matched, join the layer below
+                pots[-1].amount += amount
+            else:
+                pots.append(Pot(amount, list(eligible or live_player_ids)))
+            previous_level = level
+        while i < len(ordered) and ordered[i][1] == level:
+            if ordered[i][0] in live:
+                eligible.remove(ordered[i][0])
+            i += 1
+    return pots
+
+
+def award_pots(pots: List[Pot], strengths: Dict[int, Optional[int]]) -> Dict[int, int]:
+    """
+    Award each pot to its best eligible hand, split between ties with odd chips
+    going to the earliest seats
+    Args:
+        pots: Pots returned by build_pots()
+        strengths: Hand strength per live player_id, evaluated once per player.
+            Not needed for pots with a single eligible player.
+    Returns:
+        Dict mapping player_id to the amount won
+    """
+    winnings: Dict[int, int] = {}
+    for pot in pots:
+        winners = pot.eligible_player_ids
+        if len(winners) > 1:
+            best_strength = max(strengths[player_id] for player_id in winners)
+            winners = [
+                player_id for player_id in winners if strengths[player_id] == best_strength
+            ]
+        share, odd_chips = divmod(pot.amount, len(winners))
+        for i, player_id in enumerate(winners):
+            winnings[player_id] = (
+                winnings.get(player_id, 0) + share + (1 if i < odd_chips else 0)
+            )
+    return winnings
@@ -0,0 +1,188 @@
+from typing import List, Tuple
+
+
+class SeatRing:
+    __slots__ = (
+        "num_seats",
+        "button",
+        "in_hand",
+        "all_in",
+        "to_act",
+        "call_only",
+        "last_seat",
+    )
+
+    def __init__(self, num_seats: int = 0):
+        """
+        Fixed ring of seats with one bit per seat for the players still in the hand,
+        the all-in players, the players still to act on the current street and the
+        players who may only call or fold after a short all-in raise.
+        Next to act, street completion and button moves are bit operations.
+        Args:
+            num_seats: Number of seats, more can be added with add_seat()
+        """
+        self.num_seats = num_seats
+        # The small blind is the first seat in the hand after the button, so the
+        # first hand starts with seat 0 in the small blind
+        self.button = -1
+        self.in_hand = 0
+        self.all_in = 0
+        self.to_act = 0
+        self.call_only = 0
+        # Seat that acted last; the next to act is the first seat after it
+        self.last_seat = -1
+
+    def get_state(self) -> Tuple[int, int, int, int, int, int]:
+        """Everything but the number of seats, restored with set_state()"""
+        return (
+            self.button,
+            self.in_hand,
+            self.all_in,
+            self.to_act,
+            self.call_only,
+            self.last_seat,
+        )
+
+    def set_state(self, state: Tuple[int, int, int, int, int, int]):
+        (
+            self.button,
+            self.in_hand,
+            self.all_in,
+            self.to_act,
+            self.call_only,
+            self.last_seat,
+        ) = state
+
+    def copy(self) -> "SeatRing":
+        ring = SeatRing(self.num_seats)
+        ring.set_state(self.get_state())
+        return ring
+
+    @staticmethod
+    def next_seat(mask: int, seat: int) -> int:
+        """First seat of the mask after seat, wrapping around, -1 for an empty mask"""
+        if not mask:
+            return -1
+        after = mask >> (seat + 1)
+        if after:
+            return seat + (after & -after).bit_length()
+        return (mask & -mask).bit_length() - 1
+
+    def add_seat(self) -> int:
+        self.num_seats += 1
+        return self.num_seats - 1
+
+    def remove_seat(self, seat: int):
+        """Remove a seat between hands, the seats after it move down by one"""
+
+        def _remove_bit(mask: int) -> int:
+            return (mask & ((1 << seat) - 1)) | ((mask >> (seat + 1)) << seat)
+
+        self.in_hand = _remove_bit(self.in_hand)
+        self.all_in = _remove_bit(self.all_in)
+        self.to_act = _remove_bit(self.to_act)
+        self.call_only = _remove_bit(self.call_only)
+        self.num_seats -= 1
+        if seat <= self.button:
+            self.button -= 1
+
+    def rotate_button(self):
+        if self.num_seats:
+            self.button = (self.button + 1) % self.num_seats
+
+    def start_hand(self, in_hand: int):
+        """
+        Start a hand with the seats of the in_hand mask. Heads-up, the button moves
+        onto the first seat in the hand from it and posts the small blind, so the
+        button acts first preflop and last on the later streets.
+        Args:
+            in_hand: Mask of the seats dealt into the hand
+        """
+        self.in_hand = in_hand
+        if self.is_heads_up():
+            self.button = self.next_seat(in_hand, max(self.button, 0) - 1)
+        self.all_in = 0
+        self.to_act = 0
+        self.call_only = 0
+        self.last_seat = self.button
+
+    def start_street(self):
+        """
+        Everyone in the hand and not all-in has to act, starting after the button.
+        No one acts when fewer than two players can still bet, the board runs out.
+        """
+        can_bet = self.in_hand & ~self.all_in
+        self.to_act = can_bet if can_bet & (can_bet - 1) else 0
+        self.call_only = 0
+        self.last_seat = self.button
+
+    def is_heads_up(self) -> bool:
+        return self.count_in_hand() == 2
+
+    def get_small_blind_seat(self) -> int:
+        """Small blind of the hand just started, the button itself heads-up"""
+        if self.is_heads_up():
+            return self.button
+        return self.next_seat(self.in_hand, self.button)
+
+    def get_big_blind_seat(self) -> int:
+        return self.next_seat(self.in_hand, self.get_small_blind_seat())
+
+    def get_next_to_act(self) -> int:
+        """Seat of the next player to act, -1 once the street is complete"""
+        return self.next_seat(self.to_act, self.last_seat)
+
+    def act(self, seat: int):
+        self.to_act &= ~(1 << seat)
+        self.last_seat = seat
+
+    def fold(self, seat: int):
+        self.in_hand &= ~(1 << seat)
+        self.to_act &= ~(1 << seat)
+        self.last_seat = seat
+
+    def go_all_in(self, seat: int):
+        self.all_in |= 1 << seat
+        self.to_act &= ~(1 << seat)
+        self.last_seat = seat
+
+    def reopen(self, seat: int, is_full_raise: bool = True) -> int:
+        """
+        Give the players who already acted another turn after a raise from seat
+        Args:
+            seat: Seat of the raiser
+            is_full_raise: False for an all-in short of a full raise, the players
+                who already acted may then only call or fold
+        Returns:
+            Mask of the seats that have to act again
+        """
+        reopened = self.in_hand & ~self.all_in & ~self.to_act & ~(1 << seat)
+        self.to_act |= reopened
+        if is_full_raise:
+            self.call_only = 0
+        else:
+            self.call_only |= reopened
+        return reopened
+
+    def can_raise(self, seat: int) -> bool:
+        """False after a short all-in raise or when no one else could call a raise"""
+        bit = 1 << seat
+        return not self.call_only & bit and bool(self.in_hand & ~self.all_in & ~bit)
+
+    def is_street_complete(self) -> bool:
+        return not self.to_act
+
+    def count_in_hand(self) -> int:
+        return bin(self.in_hand).count("1")
+
+    def get_seats(self, mask: int, after: int) -> List[int]:
+        """Seats of a mask in order, starting with the first seat after `after`"""
+        seats = []
+        seat = self.next_seat(mask, after)
+        while seat != -1 and seat not in seats:
+            seats.append(seat)
+            seat = self.next_seat(mask, seat)
+        return seats
+
+    def get_seats_to_act(self) -> List[int]:
+        return self.get_seats(self.to_act, self.last_seat)
@@ -2,6 +2,9 @@ from enum import Enum
 from typing import List, Dict, Optional, Any, Tuple
 from engine.classes.Deck import Deck, Card
 from engine.classes.Player import Player
+from engine.classes.Pot import Pot, award_pots, build_pots
+from engine.classes.SeatRing import SeatRing
+from engine.utils.HandEvaluator import HandRank, IncrementalHand
 from loguru import logger
 
 
@@ -31,11 +34,78 @@ class Bet:
         return f"{self.player.player_id}: {self.amount}"
 
 
+class LegalActions:
+    __slots__ = (
+        "player",
+        "amount_to_call",
+        "can_check",
+        "can_raise",
+        "min_raise_to",
+        "max_raise_to",
+    )
+
+    def __init__(
+        self,
+        player: Player,
+        amount_to_call: int,
+        can_raise: bool,
+        min_raise_to: int,
+        max_raise_to: int,
+    ):
+        """
+        Actions open to the player next to act. Raise amounts are the player's total
+        bet on the street after the raise, as passed to process_player_action().
+        Args:
+            player: Player next to act
+            amount_to_call: Chips needed to call, capped at the player's stack
+            can_raise: False when the player can't cover more than a call, when no
+                one is left to respond, or after a short all-in that didn't reopen
+                the betting
+            min_raise_to: Smallest raise, or the player's all-in when that's less
+            max_raise_to: All-in
+        """
+        self.player = player
+        self.amount_to_call = amount_to_call
+        self.can_check = amount_to_call == 0
+        self.can_raise = can_raise
+        self.min_raise_to = min_raise_to
+        self.max_raise_to = max_raise_to
+
+    def get_actions(self) -> List[PlayerAction]:
+        actions = [PlayerAction.FOLD]
+        actions.append(PlayerAction.CHECK if self.can_check else PlayerAction.CALL)
+        if self.can_raise:
+            actions.append(PlayerAction.RAISE)
+        return actions
+
+    def is_legal(self, action: PlayerAction, amount: int = 0) -> bool:
+        """True if process_player_action() accepts the action, without raising"""
+        if action == PlayerAction.RAISE:
+            return self.can_raise and self.min_raise_to <= amount <= self.max_raise_to
+        if action == PlayerAction.CHECK:
+            return self.can_check
+        # Calling with nothing to call is accepted as a check
+        return action == PlayerAction.CALL or action == PlayerAction.FOLD
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "player_id": self.player.player_id,
+            "actions": [action.value for action in self.get_actions()],
+            "amount_to_call": self.amount_to_call,
+            "min_raise_to": self.min_raise_to if self.can_raise else None,
+            "max_raise_to": self.max_raise_to if self.can_raise else None,
+        }
+
+    def __str__(self) -> str:
+        return str(self.to_dict())
+
+
 class SingleGame:
     def __init__(
         self,
         id: int = 0,
         big_blind_bet: int = 20,
+        seed: Optional[int] = None,
     ):
         def _validate_big_blind(big_blind_bet: int):
             if big_blind_bet <= 0:
@@ -46,11 +116,15 @@ class SingleGame:
         _validate_big_blind(big_blind_bet)
         self.id = id
         self.big_blind_bet: int = big_blind_bet
-        self.small_blind_bet: int = big_blind_bet / 2
+        self.small_blind_bet: int = big_blind_bet // 2
         self.all_players: List[Player] = []
         self.active_players: List[Player] = []
-        self.current_betting_street_players: List[Player] = []
-        self.deck = Deck()
+        # all_players index of every player_id; the seat ring tracks the button,
+        # the players in the hand and the players still to act on the street
+        self.seats: Dict[int, int] = {}
+        self.seat_ring = SeatRing()
+        # With a seed, every hand dealt by this game can be replayed
+        self.deck = Deck(seed=seed)
         self.deck_order_as_list: List[str] = []
         for card in self.deck.get_cards():
             self.deck_order_as_list.append(card.verbose_name)
@@ -59,144 +133,246 @@ class SingleGame:
         self.community_cards: Deck = Deck(new_deck=False)
         self.initial_stack_sizes: List[Tuple[int, int]] = []
         self.bets: Dict[str, List[Bet]] = {}
+        # Largest total bet of a single player on the current street
         self.current_bet: int = 0
+        # Size of the last full bet or raise of the street, the smallest raise allowed
+        self.min_raise: int = big_blind_bet
         self.last_raiser_player_index: Optional[int] = None
-        self.bets_per_player: Dict[Player, int] = {}
+        # Running totals kept by place_bet(), keyed by player_id
+        self.bets_per_player: Dict[int, int] = {}
+        self.street_bets_per_player: Dict[int, int] = {}
+        self.pot: int = 0
+        # Running hand evaluation per player_id, updated as cards are dealt
+        self.hand_states: Dict[int, IncrementalHand] = {}
+        # Optional HandHistoryWriter, every resolved hand is recorded to it
+        self.hand_history_writer: Optional[Any] = None
+        # State saved by make_action(), restored by unmake_action()
+        self.action_stack: List[Tuple] = []
         logger.info("Game initialized.")
 
     # Private methods
     def _log_state_in_debug_mode(self):
-        logger.debug(f"Current betting round: {self.current_betting_round.value}")
-        logger.debug(
-            f"Active players: {[player.player_id for player in self.active_players]}"
-        )
-        logger.debug(
-            f"Betting street: {[player.player_id for player in self.current_betting_street_players]}"
-        )
-        logger.debug(f"Bets: {str(self.bets)}")
-        logger.debug(f"Pot: {self.get_pot()}")
-        logger.debug(
-            f"Stacks per player in current round: {self._stacks_per_player_in_current_round()}"
+        # Lazy arguments are only computed when a sink accepts DEBUG messages
+        lazy_logger = logger.opt(lazy=True)
+        lazy_logger.debug(
+            "Current betting round: {}", lambda: self.current_betting_round.value
         )
-
-    def _register_player(self, player: Player) -> bool:
-        def _validate_new_player(player: Player) -> bool:
-            if player.starting_stack <= 0:
-                err_msg = (
-                    f"Player {player.player_id} ({player.player_name}) has a starting stack of {player.starting_stack}. "
-                    + "Starting stack must be greater than 0."
-                )
-                logger.warning(err_msg)
-                return False
-            elif player.player_id in [p.player_id for p in self.all_players]:
-                err_msg = f"Player {player.player_id} ({player.player_name}) has a player_id that collides with an existing player."
-                logger.warning(err_msg)
-                return False
-            elif player.player_name == "":
-                err_msg = f"Player {player.player_id} ({player.player_name}) has an empty player_name."
-                logger.warning(err_msg)
-                return False
-            return True
-
-        if not _validate_new_player(player):
-            logger.error(
-                f"Player {player.player_id} ({player.player_name}) failed validation."
-            )
-            return False
-        logger.error(
-            f"Player {player.player_id} ({player.player_name}) passed validation."
+        lazy_logger.debug(
+            "Active players: {}",
+            lambda: [player.player_id for player in self.active_players],
         )
-        self.all_players.append(player)
-        logger.info(
-            f"Player {player.player_id} ({player.player_name}) has joined the game."
+        lazy_logger.debug(
+            "Betting street: {}",
+            self.get_remaining_betting_street,
         )
-        logger.debug(
-            f"All players: {[player.player_id for player in self.all_players]}"
+        lazy_logger.debug("Bets: {}", lambda: str(self.bets))
+        lazy_logger.debug("Pot: {}", self.get_pot)
+        lazy_logger.debug(
+            "Stacks per player in current round: {}",
+            self._stacks_per_player_in_current_round,
         )
-        return True
 
-    def _initialize_initial_stack_sizes(self):
-        for player in self.all_players:
-            self.initial_stack_sizes.append((player.player_id, player.starting_stack))
+    def _validate_new_player(self, player: Player) -> Optional[str]:
+        """Reason the player can't join the game, None if they can"""
+        if player.starting_stack <= 0:
+            return (
+                f"Player {player.player_id} ({player.player_name}) has a starting stack of {player.starting_stack}. "
+                + "Starting stack must be greater than 0."
+            )
+        elif player.player_id in self.seats:
+            return f"Player {player.player_id} ({player.player_name}) has a player_id that collides with an existing player."
+        elif player.player_name == "":
+            return f"Player {player.player_id} ({player.player_name}) has an empty player_name."
+        return None
 
     def _set_active_players(self):
         for player in self.all_players:
-            player.active()
+            # Players without chips left sit the hand out
+            player.update_is_active(player.current_stack > 0)
+        in_hand = 0
+        for seat, player in enumerate(self.all_players):
+            if player.is_active:
+                in_hand |= 1 << seat
+        self.seat_ring.start_hand(in_hand)
+        # Cards are dealt and listed starting with the small blind
         self.active_players = [
-            player for player in self.all_players if player.is_active
+            self.all_players[seat]
+            for seat in self.seat_ring.get_seats(
+                in_hand, self.seat_ring.get_small_blind_seat() - 1
+            )
         ]
 
     def _post_small_blind(self):
-        small_blind_player = self.get_next_actionable_player()
-        self.place_bet(small_blind_player, PlayerAction.BLIND, self.small_blind_bet)
-        small_blind_player.yet_to_act()
-        self.add_player_to_end_of_betting_street(small_blind_player)
+        small_blind_player = self.all_players[self.seat_ring.get_small_blind_seat()]
+        self.place_bet(
+            small_blind_player,
+            PlayerAction.BLIND,
+            min(self.small_blind_bet, small_blind_player.current_stack),
+        )
+        if not small_blind_player.is_all_in:
+            # The small blind still has to act, after everyone else
+            small_blind_player.yet_to_act()
 
     def _post_big_blind(self):
+        big_blind_seat = self.seat_ring.get_big_blind_seat()
+        big_blind_player = self.all_players[big_blind_seat]
         self.place_bet(
-            self.get_next_actionable_player(), PlayerAction.BLIND, self.big_blind_bet
+            big_blind_player,
+            PlayerAction.BLIND,
+            min(self.big_blind_bet, big_blind_player.current_stack),
         )
+        if not big_blind_player.is_all_in:
+            # The big blind keeps the option to check or raise a limped pot
+            big_blind_player.yet_to_act()
 
     def _deal_hole_cards(self):
+        self.hand_states = {
+            player.player_id: IncrementalHand() for player in self.active_players
+        }
         for _ in range(2):
             for player in self.active_players:
                 self.deal_card_to_player(player)
-        logger.info(f"Dealt hole cards to {len(self.active_players)} players")
-
-    def _update_betting_street_on_raise(self, player: Player, amount: int):
-        pass
+        logger.info("Dealt hole cards to {} players", len(self.active_players))
+
+    def _update_betting_street_on_raise(self, player: Player, is_full_raise: bool):
+        # Players who already acted have to act again. After a short all-in they
+        # may only call or fold, a full raise lets everyone raise again.
+        seat = self.seats[player.player_id]
+        reopened = self.seat_ring.reopen(seat, is_full_raise)
+        if reopened:
+            for reopened_seat in self.seat_ring.get_seats(reopened, seat):
+                self.all_players[reopened_seat].yet_to_act()
+        self.last_raiser_player_index = seat
 
     def _validate_player_action(
         self, player_id: int, action: PlayerAction, amount: int = 0
     ):
-        if not player_id in [
-            player.player_id for player in self.current_betting_street_players
-        ]:
+        seat = self.seats.get(player_id)
+        if seat is None:
             logger.error(
                 f"Error processing player action: Player {player_id} is not in the game."
             )
             raise ValueError(f"Player {player_id} is not in the game.")
-        if not self.betting_street_players[0].player_id == player_id:
+        if self.seat_ring.is_street_complete():
+            logger.error(
+                f"Error processing player action: Betting street is already complete."
+            )
+            raise ValueError("Betting street is already complete.")
+        if self.seat_ring.get_next_to_act() != seat:
             logger.error(
                 f"Error processing player action: Player {player_id} is not next to act."
             )
             raise ValueError(f"Player {player_id} is not next to act.")
-        if not self.betting_street_players[0].is_active:
+        if not self.all_players[seat].is_active:
             logger.error(
                 f"Error processing player action: Player {player_id} has folded."
             )
             raise ValueError(f"Player {player_id} has folded.")
 
+    def _undeal_community_cards(self, num_community_cards: int, num_discards: int):
+        """Put the community and discarded cards dealt since the given counts back on the deck"""
+        community_cards = self.community_cards.cards
+        discards = self.discard_pile.cards
+        # Every street deals a discard, then three cards on the flop or one after
+        dealt = []
+        num_cards = num_community_cards
+        for discard in discards[num_discards:]:
+            dealt.append(discard)
+            street_size = 3 if num_cards == 0 else 1
+            dealt.extend(community_cards[num_cards : num_cards + street_size])
+            num_cards += street_size
+        del community_cards[num_community_cards:]
+        del discards[num_discards:]
+        for card in reversed(dealt):
+            self.deck.add_card(card)
+        community_ints = self.community_cards.get_cards_as_ints()
+        for player_id in self.hand_states:
+            player = self.all_players[self.seats[player_id]]
+            self.hand_states[player_id] = IncrementalHand(
+                player.get_hand_as_ints() + community_ints
+            )
+
     def _stacks_per_player_in_current_round(self):
         return {
-            player.player_id: sum(
-                [
-                    bet.amount
-                    for bet in self.bets.get(self.current_betting_round.value, [])
-                    if bet.player == player
-                ]
-            )
+            player.player_id: self.street_bets_per_player.get(player.player_id, 0)
             for player in self.active_players
         }
 
     def _reset_betting_street_for_new_round(self):
         for player in self.active_players:
             player.yet_to_act()
-        self.current_betting_street_players = [
-            player for player in self.all_players if player.is_active
-        ]
+        self.seat_ring.start_street()
+        self.street_bets_per_player = {}
+        self.current_bet = 0
+        self.min_raise = self.big_blind_bet
+        self.last_raiser_player_index = None
         self._log_state_in_debug_mode()
 
     # Public methods
+    def _add_to_running_totals(self, player: Player, amount: int):
+        round_name = self.current_betting_round.value
+        current_round_bets = self.bets.get(round_name)
+        if current_round_bets is None:
+            current_round_bets = self.bets[round_name] = []
+        current_round_bets.append(Bet(player, amount))
+        player_id = player.player_id
+        self.bets_per_player[player_id] = self.bets_per_player.get(player_id, 0) + amount
+        street_bet = self.street_bets_per_player.get(player_id, 0) + amount
+        self.street_bets_per_player[player_id] = street_bet
+        if street_bet > self.current_bet:
+            self.current_bet = street_bet
+        self.pot += amount
+
+    def _apply_action(self, player: Player, action: PlayerAction, amount: int) -> int:
+        """
+        Apply an action already checked to be legal for the player next to act. The
+        core of process_player_action() and make_action(), which do the logging.
+        Args:
+            player: Player next to act
+            action: FOLD, CHECK, CALL or RAISE
+            amount: Amount to raise to for a RAISE, ignored otherwise
+        Returns:
+            Chips the player put in the pot
+        """
+        if action == PlayerAction.FOLD:
+            player.is_active = False
+            player.has_acted = True
+            self.active_players.remove(player)
+            self.update_betting_street_on_bet(player, action)
+            return 0
+        is_full_raise = False
+        if action == PlayerAction.RAISE:
+            raise_size = amount - self.current_bet
+            # A short all-in raise doesn't change the minimum raise
+            is_full_raise = raise_size >= self.min_raise
+            if is_full_raise:
+                self.min_raise = raise_size
+            amount -= self.street_bets_per_player.get(player.player_id, 0)
+        elif action == PlayerAction.CALL:
+            # Calling more than the player's stack puts them all-in for less
+            amount = min(self.get_amount_to_call(player), player.current_stack)
+        else:
+            amount = 0
+        player.current_stack -= amount
+        player.has_acted = True
+        if player.current_stack == 0:
+            player.is_all_in = True
+        if amount:
+            self._add_to_running_totals(player, amount)
+        self.update_betting_street_on_bet(player, action)
+        if action == PlayerAction.RAISE:
+            self._update_betting_street_on_raise(player, is_full_raise)
+        return amount
+
     def place_bet(self, player: Player, action: PlayerAction, amount: int):
         player.bet(amount)
+        if player.current_stack == 0:
+            player.is_all_in = True
         if 0 < amount:
-            current_round_bets = self.bets.get(self.current_betting_round.value, [])
-            current_round_bets.append(Bet(player, amount))
-            self.bets[self.current_betting_round.value] = current_round_bets
-            logger.info(f"Player {player.player_id} has placed a bet of {amount}.")
+            self._add_to_running_totals(player, amount)
+            logger.info("Player {} has placed a bet of {}.", player.player_id, amount)
         else:
-            logger.info(f"Player {player.player_id} has checked.")
+            logger.info("Player {} has checked.", player.player_id)
         self.update_betting_street_on_bet(player, action)
 
     def _post_blinds(self):
@@ -209,42 +385,60 @@ class SingleGame:
         logger.info("Small and big blinds have been posted.")
 
     def deal_card_to_player(self, player: Player):
-        player.receive_card(self.deck.deal())
-        logger.info(f"Dealt 1 card to Player {player.player_id}")
+        card = self.deck.deal()
+        if player.get_hand().get_deck_size() < 2:
+            self.hand_states.setdefault(player.player_id, IncrementalHand()).add_card(
+                card.card_int
+            )
+        player.receive_card(card)
+        logger.info("Dealt 1 card to Player {}", player.player_id)
 
     def discard_card(self):
         self.discard_pile.add_card(self.deck.deal())
-        logger.info(f"Discarded 1 card")
+        logger.info("Discarded 1 card")
 
     def deal_community_card(self):
-        self.community_cards.add_card(self.deck.deal())
-        logger.info(f"Dealt 1 community card")
+        card = self.deck.deal()
+        self.community_cards.add_card(card)
+        for hand_state in self.hand_states.values():
+            hand_state.add_card(card.card_int)
+        logger.info("Dealt 1 community card")
 
     def process_player_action(
         self, player_id: int, action: PlayerAction, amount: int = 0
     ):
-        logger.info(f"Processing player action: {action} for player {player_id}")
-        logger.debug(f"Next player to act: {self.betting_street_players[0].player_id}")
+        logger.info("Processing player action: {} for player {}", action, player_id)
         self._validate_player_action(player_id, action, amount)
+        logger.debug("Next player to act: {}", player_id)
         player = self.get_next_actionable_player()
         if action == PlayerAction.CHECK:
-            if self.current_bet_amount > 0:
+            amount_to_call = self.get_amount_to_call(player)
+            if amount_to_call > 0:
                 logger.error(
-                    f"Cannot check when there's an active bet. Current bet: {self.current_bet_amount}"
+                    f"Cannot check when there's an active bet. Amount to call: {amount_to_call}"
                 )
                 raise ValueError("Cannot check when there's an active bet")
-        elif action == PlayerAction.CALL:
-            max_stack_in_current_betting_round = max(
-                self._stacks_per_player_in_current_round().values()
-            )
-            player_stack_in_current_round = self._stacks_per_player_in_current_round()[
-                player.player_id
-            ]
-            player_topup_needed_to_call = (
-                max_stack_in_current_betting_round - player_stack_in_current_round
-            )
-            self.place_bet(player, action, player_topup_needed_to_call)
-
+        elif action == PlayerAction.RAISE:
+            legal_actions = self.get_legal_actions()
+            if not legal_actions.is_legal(action, amount):
+                logger.error(
+                    f"Cannot raise to {amount}. Raises must be between {legal_actions.min_raise_to} "
+                    + f"and {legal_actions.max_raise_to}."
+                    if legal_actions.can_raise
+                    else f"Player {player_id} cannot raise."
+                )
+                raise ValueError(f"Illegal raise to {amount}")
+        elif action not in (PlayerAction.CALL, PlayerAction.FOLD):
+            logger.error(f"Error processing player action: {action} is not supported.")
+            raise ValueError(f"Unsupported action: {action}")
+
+        chips = self._apply_action(player, action, amount)
+        if action == PlayerAction.FOLD:
+            logger.info("Player {} has folded.", player.player_id)
+        elif chips:
+            logger.info("Player {} has placed a bet of {}.", player.player_id, chips)
+        else:
+            logger.info("Player {} has checked.", player.player_id)
         self._log_state_in_debug_mode()
 
     def deal_community_cards(self):
@@ -274,39 +468,38 @@ class SingleGame:
             self.discard_card()
             self.deal_community_card()
 
-    def add_player_to_end_of_betting_street(self, player: Player):
-        self.betting_street_players.append(player)
-
     def update_betting_street_on_bet(self, player: Player, action: PlayerAction):
-        if (
-            action == PlayerAction.BLIND
-            or action == PlayerAction.CHECK
-            or action == PlayerAction.CALL
-        ):
-            self.betting_street_players = [
-                player
-                for player in self.current_betting_street_players
-                if (player.is_active and not player.has_acted)
-            ]
+        seat = self.seats[player.player_id]
+        if action == PlayerAction.FOLD:
+            self.seat_ring.fold(seat)
+        elif player.is_all_in:
+            self.seat_ring.go_all_in(seat)
+        elif action == PlayerAction.BLIND:
+            # Posting a blind is not the player's turn on the street
+            self.seat_ring.last_seat = seat
+        else:
+            self.seat_ring.act(seat)
 
     def advance_betting_round(self):
         if self.current_betting_round == BettingRound.NOTSTARTED:
             if len(self.all_players) < 2:
                 raise ValueError("Not enough players to start a round")
             self.current_betting_round = BettingRound.PREFLOP
-            logger.debug(f"Advancing betting round to {BettingRound.PREFLOP.value}.")
+            logger.debug("Advancing betting round to {}.", BettingRound.PREFLOP.value)
             self._set_active_players()
+            if len(self.active_players) < 2:
+                raise ValueError("Not enough players with chips to start a round")
             self._deal_hole_cards()
             self._reset_betting_street_for_new_round()
             self._post_blinds()
         elif self.current_betting_round == BettingRound.PREFLOP:
             self.current_betting_round = BettingRound.FLOP
-            logger.debug(f"Advancing betting round to {BettingRound.FLOP.value}.")
+            logger.debug("Advancing betting round to {}.", BettingRound.FLOP.value)
             self.deal_community_cards()
             self._reset_betting_street_for_new_round()
         elif self.current_betting_round == BettingRound.FLOP:
             self.current_betting_round = BettingRound.TURN
-            logger.debug(f"Advancing betting round to {BettingRound.TURN.value}.")
+            logger.debug("Advancing betting round to {}.", BettingRound.TURN.value)
             self.deal_community_cards()
             self._reset_betting_street_for_new_round()
         elif self.current_betting_round == BettingRound.TURN:
@@ -315,32 +508,298 @@ class SingleGame:
             self._reset_betting_street_for_new_round()
         elif self.current_betting_round == BettingRound.RIVER:
             self.current_betting_round = BettingRound.ENDED
-            logger.debug(f"Advancing betting round to {BettingRound.ENDED.value}.")
+            logger.debug("Advancing betting round to {}.", BettingRound.ENDED.value)
         else:
             raise ValueError(
                 f"Invalid call to advance_betting_round(). Current betting round is {self.current_betting_round.value}."
             )
 
-    def get_next_actionable_player(self):
-        return self.current_betting_street_players[0]
+    def get_next_actionable_player(self) -> Optional[Player]:
+        seat = self.seat_ring.get_next_to_act()
+        return self.all_players[seat] if seat != -1 else None
+
+    @property
+    def betting_street_players(self) -> List[Player]:
+        """Players still to act on the current street, next to act first"""
+        return [self.all_players[seat] for seat in self.seat_ring.get_seats_to_act()]
+
+    def get_amount_to_call(self, player: Player) -> int:
+        """Chips the player has to add to match the largest bet of the street"""
+        return self.current_bet - self.street_bets_per_player.get(player.player_id, 0)
+
+    def get_legal_actions(self) -> Optional[LegalActions]:
+        """
+        Actions and amounts open to the player next to act, None once the betting
+        street is complete. Computed in constant time from the running street totals.
+        """
+        seat = self.seat_ring.get_next_to_act()
+        if seat == -1:
+            return None
+        player = self.all_players[seat]
+        stack = player.current_stack
+        street_bet = self.street_bets_per_player.get(player.player_id, 0)
+        amount_to_call = self.current_bet - street_bet
+        max_raise_to = street_bet + stack
+        return LegalActions(
+            player,
+            min(amount_to_call, stack),
+            stack > amount_to_call and self.seat_ring.can_raise(seat),
+            min(self.current_bet + self.min_raise, max_raise_to),
+            max_raise_to,
+        )
 
-    def get_remaining_betting_street(self) -> List[int]:
-        return [
-            player.player_id
-            for player in self.players
-            if player.is_active and not player.has_acted
+    def is_betting_street_complete(self) -> bool:
+        return self.seat_ring.is_street_complete()
+
+    def is_hand_over(self) -> bool:
+        """True once a single player is left or the river has been played"""
+        return (
+            len(self.active_players) < 2
+            or self.current_betting_round == BettingRound.ENDED
+        )
+
+    def advance_to_next_decision(self) -> Optional[Player]:
+        """
+        Advance through completed betting streets until a player has to act
+        Returns:
+            The player next to act, or None once the hand is ready for resolve_winner()
+        """
+        while True:
+            if len(self.active_players) < 2:
+                return None
+            if not self.seat_ring.is_street_complete():
+                return self.get_next_actionable_player()
+            if self.current_betting_round == BettingRound.RIVER:
+                return None
+            self.advance_betting_round()
+
+    def make_action(
+        self, player_id: int, action: PlayerAction, amount: int = 0
+    ) -> Optional[Player]:
+        """
+        Process a player action and advance to the next decision, saving the state
+        unmake_action() needs to take it back, e.g. to walk a search tree. Only what
+        the action can change is saved, not a copy of the game. The action itself is
+        not logged, the streets and cards dealt after it are, as by
+        advance_betting_round().
+        Returns:
+            The player next to act, or None once the hand is ready for resolve_winner()
+        """
+        legal_actions = self.get_legal_actions()
+        if (
+            legal_actions is None
+            or legal_actions.player.player_id != player_id
+            or not legal_actions.is_legal(action, amount)
+        ):
+            # Raises the same ValueError with its log message
+            self.process_player_action(player_id, action, amount)
+        player = legal_actions.player
+        seat_ring = self.seat_ring
+        seat_ring_state = seat_ring.get_state()
+        round_bets = self.bets.get(self.current_betting_round.value)
+        record = [
+            self.current_betting_round,
+            self.current_bet,
+            self.min_raise,
+            self.pot,
+            self.last_raiser_player_index,
+            seat_ring_state,
+            player,
+            (player.current_stack, player.is_active, player.is_all_in, player.has_acted),
+            self.bets_per_player.get(player_id),
+            self.street_bets_per_player,
+            self.street_bets_per_player.get(player_id),
+            self.active_players.index(player) if action == PlayerAction.FOLD else -1,
+            None if round_bets is None else len(round_bets),
+            self.community_cards.get_deck_size(),
+            self.discard_pile.get_deck_size(),
+            # Seats reopened by a raise, flags of every player before a new street,
+            # stacks before resolve_winner()
+            0,
+            None,
+            None,
         ]
+        self.action_stack.append(record)
+        self._apply_action(player, action, amount)
+        if action == PlayerAction.RAISE:
+            record[15] = seat_ring.to_act & ~seat_ring_state[3]
+        if seat_ring.is_street_complete() or len(self.active_players) < 2:
+            record[16] = [other.has_acted for other in self.all_players]
+        next_player = self.advance_to_next_decision()
+        if next_player is None:
+            record[17] = [other.current_stack for other in self.all_players]
+        return next_player
+
+    def unmake_action(self):
+        """
+        Take back the last make_action(), including the streets it dealt and a
+        resolve_winner() called after it
+        """
+        if not self.action_stack:
+            raise ValueError("No action to take back")
+        (
+            betting_round,
+            self.current_bet,
+            self.min_raise,
+            self.pot,
+            self.last_raiser_player_index,
+            seat_ring_state,
+            player,
+            player_state,
+            total_bet,
+            self.street_bets_per_player,
+            street_bet,
+            fold_index,
+            num_round_bets,
+            num_community_cards,
+            num_discards,
+            reopened,
+            has_acted,
+            stacks,
+        ) = self.action_stack.pop()
+        all_players = self.all_players
+        if stacks is not None:
+            for other, stack in zip(all_players, stacks):
+                other.current_stack = stack
+        if has_acted is not None:
+            for other, other_has_acted in zip(all_players, has_acted):
+                other.has_acted = other_has_acted
+        if reopened:
+            # Only players who had acted are reopened
+            for seat in self.seat_ring.get_seats(reopened, -1):
+                all_players[seat].has_acted = True
+        (
+            player.current_stack,
+            player.is_active,
+            player.is_all_in,
+            player.has_acted,
+        ) = player_state
+        if fold_index >= 0:
+            self.active_players.insert(fold_index, player)
+        player_id = player.player_id
+        if total_bet is None:
+            self.bets_per_player.pop(player_id, None)
+        else:
+            self.bets_per_player[player_id] = total_bet
+        if street_bet is None:
+            self.street_bets_per_player.pop(player_id, None)
+        else:
+            self.street_bets_per_player[player_id] = street_bet
+        self.current_betting_round = betting_round
+        self.seat_ring.set_state(seat_ring_state)
+        if num_round_bets is None:
+            self.bets.pop(betting_round.value, None)
+        else:
+            del self.bets[betting_round.value][num_round_bets:]
+        if self.community_cards.get_deck_size() != num_community_cards:
+            self._undeal_community_cards(num_community_cards, num_discards)
+
+    def clone(self) -> "SingleGame":
+        """
+        Copy of the game, e.g. to branch a search from a hand in progress. Players,
+        decks with their random number generator, running totals and hand states are
+        copied; Card objects are shared. The clone records no hand history.
+        """
+        game = SingleGame.__new__(SingleGame)
+        game.__dict__.update(self.__dict__)
+        players = {player.player_id: player.copy() for player in self.all_players}
+        game.all_players = list(players.values())
+        game.active_players = [players[player.player_id] for player in self.active_players]
+        game.seats = dict(self.seats)
+        game.seat_ring = self.seat_ring.copy()
+        game.deck = self.deck.copy()
+        game.discard_pile = self.discard_pile.copy()
+        game.community_cards = self.community_cards.copy()
+        game.initial_stack_sizes = list(self.initial_stack_sizes)
+        game.bets = {
+            round_name: [Bet(players[bet.player.player_id], bet.amount) for bet in round_bets]
+            for round_name, round_bets in self.bets.items()
+        }
+        game.bets_per_player = dict(self.bets_per_player)
+        game.street_bets_per_player = dict(self.street_bets_per_player)
+        game.hand_states = {
+            player_id: hand_state.copy()
+            for player_id, hand_state in self.hand_states.items()
+        }
+        game.hand_history_writer = None
+        game.action_stack = []
+        return game
+
+    def start_new_hand(self, rotate_button: bool = True):
+        """
+        Reset the game to NOTSTARTED so the same players and deck can play another hand
+        Args:
+            rotate_button: Move the button, and so the blinds, one seat to the left
+        """
+        if rotate_button:
+            self.seat_ring.rotate_button()
+        for player in self.all_players:
+            player.reset_player_for_new_single_game()
+        self.deck.reset()
+        self.deck_order_as_list = [card.verbose_name for card in self.deck.cards]
+        self.discard_pile.clear()
+        self.community_cards.clear()
+        self.active_players = []
+        self.seat_ring.start_hand(0)
+        self.bets = {}
+        self.bets_per_player = {}
+        self.street_bets_per_player = {}
+        self.current_bet = 0
+        self.min_raise = self.big_blind_bet
+        self.last_raiser_player_index = None
+        self.pot = 0
+        self.hand_states = {}
+        self.action_stack = []
+        self.current_betting_round = BettingRound.NOTSTARTED
 
-    def register_players(self, *players: Player):
-        logger.info(f"Registering {len(players)} players to the game.")
-        r = 0
+    def get_remaining_betting_street(self) -> List[int]:
+        return [player.player_id for player in self.betting_street_players]
+
+    def register_players(self, *players: Player) -> List[Player]:
+        """
+        Seat a batch of players in one pass. Players failing validation, including
+        a player_id already taken earlier in the batch, are skipped.
+        Returns:
+            The players that joined the game
+        """
+        registered = []
         for player in players:
-            self._register_player(player)
-            r += 1
-        logger.info(f"Registered {r} players to the game.")
-        self._initialize_initial_stack_sizes()
-        logger.info(f"Initial stack sizes: {self.initial_stack_sizes}")
+            err_msg = self._validate_new_player(player)
+            if err_msg is not None:
+                logger.warning(err_msg)
+                logger.error(
+                    f"Player {player.player_id} ({player.player_name}) failed validation."
+                )
+                continue
+            self.seats[player.player_id] = self.seat_ring.add_seat()
+            self.all_players.append(player)
+            self.initial_stack_sizes.append((player.player_id, player.starting_stack))
+            registered.append(player)
+        logger.info(
+            "Registered {} of {} players to the game.", len(registered), len(players)
+        )
+        logger.opt(lazy=True).debug(
+            "Initial stack sizes: {}", lambda: self.initial_stack_sizes
+        )
         self._log_state_in_debug_mode()
+        return registered
+
+    def unregister_player(self, player_id: int) -> Player:
+        """Remove a player between hands, e.g. to move them to another table"""
+        if self.current_betting_round not in (
+            BettingRound.NOTSTARTED,
+            BettingRound.ENDED,
+        ):
+            raise ValueError("Players can only leave between hands")
+        seat = self.seats.get(player_id)
+        if seat is None:
+            raise ValueError(f"Player {player_id} is not in the game.")
+        player = self.all_players.pop(seat)
+        self.seat_ring.remove_seat(seat)
+        self.seats = {p.player_id: i for i, p in enumerate(self.all_players)}
+        self.hand_states.pop(player_id, None)
+        logger.info("Player {} ({}) has left the game.", player_id, player.player_name)
+        return player
 
     # Getter methods
 
@@ -377,19 +836,40 @@ class SingleGame:
     def get_community_cards(self) -> Deck:
         return self.community_cards
 
-    def get_pot(self):
-        if len(self.bets) == 0:
-            return 0
-        return sum(
-            [bet.amount for bet in self.bets.get(self.current_betting_round.value, [])]
-        )
+    def get_pot(self) -> int:
+        return self.pot
+
+    def get_current_bet(self) -> int:
+        return self.current_bet
+
+    def get_player_street_bet(self, player_id: int) -> int:
+        """Chips the player has put in on the current street"""
+        return self.street_bets_per_player.get(player_id, 0)
+
+    def get_player_total_bet(self, player_id: int) -> int:
+        """Chips the player has put in during the whole hand"""
+        return self.bets_per_player.get(player_id, 0)
+
+    def get_player_hand_strength(self, player_id: int) -> Optional[int]:
+        """Strength of the player's best hand so far, None before the flop"""
+        return self.hand_states[player_id].get_strength()
+
+    def get_player_hand_rank(self, player_id: int) -> Optional[HandRank]:
+        """HandRank of the player's best hand so far, None before the flop"""
+        return self.hand_states[player_id].get_hand_rank()
+
+    def get_hand_ranks(self) -> Dict[int, Optional[HandRank]]:
+        return {
+            player_id: hand_state.get_hand_rank()
+            for player_id, hand_state in self.hand_states.items()
+        }
 
     def get_bets(self):
         return self.bets
 
     def get_last_raiser_index(self):
-        for i in range(len(self.players) - 1, -1, -1):
-            if self.players[i].has_acted:
+        for i in range(len(self.all_players) - 1, -1, -1):
+            if self.all_players[i].has_acted:
                 return i
         return 0
 
@@ -399,13 +879,46 @@ class SingleGame:
     def get_current_state(self) -> Dict[str, Any]:
         return {
             "current_betting_round": self.current_betting_round.value,
-            "players": [str(player) for player in self.players],
-            "community_cards": [str(card) for card in self.community_cards],
+            "players": [str(player) for player in self.all_players],
+            "community_cards": self.community_cards._get_cards_as_list(),
             "pot": self.get_pot(),
+            "current_bet": self.current_bet,
+            "betting_street": self.get_remaining_betting_street(),
         }
 
-    def resolve_winner(self):
-        pass
+    def set_hand_history_writer(self, hand_history_writer: Optional[Any]):
+        """Record every resolved hand to a HandHistoryWriter, None to stop"""
+        self.hand_history_writer = hand_history_writer
+
+    def get_pots(self) -> List[Pot]:
+        """Main pot and side pots of the chips put in so far"""
+        return build_pots(
+            self.bets_per_player,
+            [player.player_id for player in self.all_players if player.is_active],
+        )
+
+    def resolve_winner(self) -> Dict[int, int]:
+        """
+        Award the main pot and side pots at showdown, or everything to the last player
+        left after everyone else folded. Each remaining player's hand is evaluated once.
+        Returns:
+            Dict mapping player_id to the amount won
+        """
+        pots = self.get_pots()
+        strengths = {}
+        if len(self.active_players) > 1:
+            strengths = {
+                player.player_id: self.get_player_hand_strength(player.player_id)
+                for player in self.active_players
+            }
+        winnings = award_pots(pots, strengths)
+        for player in self.all_players:
+            player.current_stack += winnings.get(player.player_id, 0)
+        logger.info("Pots {} awarded: {}", [pot.amount for pot in pots], winnings)
+        self.current_betting_round = BettingRound.ENDED
+        if self.hand_history_writer is not None:
+            self.hand_history_writer.record_hand(self, winnings)
+        return winnings
 
     def __str__(self) -> str:
         return str(self.get_current_state())
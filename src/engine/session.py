@@ -0,0 +1,356 @@
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+import math
+import time
+
+from engine.classes.Player import Player
+from engine.utils.HandSimulator import HandSimulator, Policy
+from engine.utils.LoggingPolicy import LoggingPolicy
+
+DEFAULT_TABLE_SIZE = 9
+
+# Seat change sent to the worker process owning a table: (table_id, player_id,
+# player), seating the player when given and unseating player_id otherwise
+SeatChange = Tuple[int, int, Optional[Player]]
+
+
+class TableStats:
+    def __init__(self):
+        self.hands: int = 0
+        self.seconds: float = 0.0
+        self.max_latency: float = 0.0
+
+    def record_hand(self, latency: float):
+        self.hands += 1
+        self.seconds += latency
+        self.max_latency = max(self.max_latency, latency)
+
+    @property
+    def hands_per_second(self) -> float:
+        return self.hands / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        return self.seconds / self.hands if self.hands else 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "hands": self.hands,
+            "seconds": self.seconds,
+            "hands_per_second": self.hands_per_second,
+            "mean_latency": self.mean_latency,
+            "max_latency": self.max_latency,
+        }
+
+
+class Table:
+    def __init__(
+        self,
+        table_id: int,
+        players: List[Player],
+        policies: Dict[int, Policy],
+        big_blind_bet: int = 20,
+        seed: Optional[int] = None,
+    ):
+        """
+        One SingleGame whose players keep their stacks from hand to hand. The button
+        moves one seat after every hand.
+        Args:
+            table_id: Id of the table
+            players: Players in seat order
+            policies: Policy per player_id, shared with the other tables so moved
+                players keep theirs
+            big_blind_bet: Big blind of every hand
+            seed: Seed of the table's deck
+        """
+        self.table_id = table_id
+        self.simulator = HandSimulator(
+            players, policies, big_blind_bet=big_blind_bet, reset_stacks=False, seed=seed
+        )
+        self.game = self.simulator.game
+        self.stats = TableStats()
+
+    def get_players(self) -> List[Player]:
+        return self.game.get_players()
+
+    def count_players(self) -> int:
+        return self.game.count_players()
+
+    def seat_player(self, player: Player):
+        self.game.register_players(player)
+
+    def unseat_player(self, player_id: int) -> Player:
+        return self.game.unregister_player(player_id)
+
+    def play_hand(self) -> Dict[int, int]:
+        """Play one hand and record its latency"""
+        start = time.perf_counter()
+        winnings = self.simulator.play_hand()
+        self.stats.record_hand(time.perf_counter() - start)
+        return winnings
+
+
+# Tables owned by this worker process, by table_id
+_worker_tables: Dict[int, Table] = {}
+
+
+def _start_worker(tables: List[Table]):
+    """Hand the tables to the worker process, which plays them from then on"""
+    LoggingPolicy.disable_engine_logs()
+    _worker_tables.clear()
+    for table in tables:
+        _worker_tables[table.table_id] = table
+
+
+def _play_worker_round(
+    seat_changes: List[SeatChange], table_ids: List[int]
+) -> Dict[int, Tuple[Dict[int, int], float]]:
+    """
+    Apply the seat changes since the last round, then play one hand on each table.
+    Module level so that it can be sent to worker processes.
+    Returns:
+        Stack per player_id and hand latency, per table_id
+    """
+    for table_id, player_id, player in seat_changes:
+        table = _worker_tables[table_id]
+        if player is None:
+            table.unseat_player(player_id)
+        else:
+            table.seat_player(player)
+    results = {}
+    for table_id in table_ids:
+        table = _worker_tables[table_id]
+        seconds = table.stats.seconds
+        table.play_hand()
+        results[table_id] = (
+            {player.player_id: player.current_stack for player in table.get_players()},
+            table.stats.seconds - seconds,
+        )
+    return results
+
+
+class TournamentResult:
+    def __init__(
+        self,
+        rounds: int,
+        seconds: float,
+        standings: List[int],
+        table_stats: Dict[int, Dict],
+    ):
+        self.rounds = rounds
+        self.seconds = seconds
+        # player_ids from first to last place
+        self.standings = standings
+        self.table_stats = table_stats
+
+    @property
+    def hands(self) -> int:
+        return sum(stats["hands"] for stats in self.table_stats.values())
+
+    @property
+    def hands_per_second(self) -> float:
+        return self.hands / self.seconds if self.seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "rounds": self.rounds,
+            "seconds": self.seconds,
+            "hands": self.hands,
+            "hands_per_second": self.hands_per_second,
+            "standings": self.standings,
+            "table_stats": self.table_stats,
+        }
+
+
+class Tournament:
+    def __init__(
+        self,
+        players: List[Player],
+        policies: Dict[int, Policy],
+        table_size: int = DEFAULT_TABLE_SIZE,
+        big_blind_bet: int = 20,
+        max_workers: Optional[int] = None,
+        seed: Optional[int] = None,
+        processes: int = 1,
+    ):
+        """
+        Multi-table tournament. Every round plays one hand on each table concurrently,
+        then knocks out busted players and rebalances the tables.
+        With processes > 1 the tables are sharded across worker processes, which use
+        one core each. Every worker owns its tables for the whole run. Only seat changes
+        and the stacks after each hand cross the process boundary, and the stacks are
+        copied back onto the entrants' Player objects. Policies must then be picklable,
+        and every worker plays with its own copy of a policy shared by several players.
+        Otherwise a thread pool drives the tables. That only overlaps policies waiting
+        on I/O, e.g. remote agents; engine code holds the GIL and uses a single core.
+        Args:
+            players: Entrants, seated round-robin across the tables
+            policies: Policy per player_id
+            table_size: Maximum number of players per table
+            big_blind_bet: Big blind of every hand
+            max_workers: Threads driving the tables when processes is 1
+            seed: Table i deals with seed + i, for replayable tournaments
+            processes: Worker processes the tables are sharded across, table i going
+                to worker i % processes
+        """
+        if len(players) < 2:
+            raise ValueError("A tournament needs at least 2 players")
+        if table_size < 2:
+            raise ValueError("Table size must be at least 2")
+        if processes < 1:
+            raise ValueError("Number of processes must be at least 1")
+        self.processes = processes
+        # Seat changes not yet sent to the worker processes, per worker
+        self._seat_changes: List[List[SeatChange]] = [[] for _ in range(processes)]
+        self.policies = policies
+        self.table_size = table_size
+        self.big_blind_bet = big_blind_bet
+        self.max_workers = max_workers
+        self.rounds = 0
+        # player_ids in the order they were knocked out
+        self.eliminated: List[int] = []
+        num_tables = math.ceil(len(players) / table_size)
+        self.tables: List[Table] = [
+            Table(
+                table_id,
+                players[table_id::num_tables],
+                policies,
+                big_blind_bet,
+                None if seed is None else seed + table_id,
+            )
+            for table_id in range(num_tables)
+        ]
+        self._finished_tables: List[Table] = []
+
+    def count_remaining_players(self) -> int:
+        return sum(table.count_players() for table in self.tables)
+
+    def is_finished(self) -> bool:
+        return self.count_remaining_players() < 2
+
+    def _eliminate_busted_players(self):
+        for table in self.tables:
+            busted = [
+                player for player in table.get_players() if player.current_stack == 0
+            ]
+            for player in busted:
+                self._unseat_player(table, player.player_id)
+                self.eliminated.append(player.player_id)
+
+    def _unseat_player(self, table: Table, player_id: int) -> Player:
+        if self.processes > 1:
+            self._seat_changes[table.table_id % self.processes].append(
+                (table.table_id, player_id, None)
+            )
+        return table.unseat_player(player_id)
+
+    def _move_player(self, source: Table, destination: Table):
+        player = self._unseat_player(source, source.get_players()[-1].player_id)
+        destination.seat_player(player)
+        if self.processes > 1:
+            self._seat_changes[destination.table_id % self.processes].append(
+                (destination.table_id, player.player_id, player)
+            )
+
+    def rebalance(self):
+        """
+        Break a table when the others have room for its players, then move players
+        from the fullest to the emptiest table until they differ by at most one
+        """
+        num_players = self.count_remaining_players()
+        while len(self.tables) > 1 and num_players <= (len(self.tables) - 1) * self.table_size:
+            smallest = min(self.tables, key=lambda table: table.count_players())
+            self.tables.remove(smallest)
+            self._finished_tables.append(smallest)
+            while smallest.count_players():
+                emptiest = min(self.tables, key=lambda table: table.count_players())
+                self._move_player(smallest, emptiest)
+        while True:
+            fullest = max(self.tables, key=lambda table: table.count_players())
+            emptiest = min(self.tables, key=lambda table: table.count_players())
+            if fullest.count_players() - emptiest.count_players() <= 1:
+                break
+            self._move_player(fullest, emptiest)
+
+    def play_round(self, executor: ThreadPoolExecutor):
+        """Play one hand on every table with at least 2 players, then rebalance"""
+        tables = [table for table in self.tables if table.count_players() >= 2]
+        for future in [executor.submit(table.play_hand) for table in tables]:
+            future.result()
+        self._finish_round()
+
+    def _play_round_in_workers(self, workers: List[ProcessPoolExecutor]):
+        """play_round() with the tables sharded across single-process executors"""
+        tables = {
+            table.table_id: table for table in self.tables if table.count_players() >= 2
+        }
+        futures: List[Future] = []
+        for worker, executor in enumerate(workers):
+            table_ids = [table_id for table_id in tables if table_id % self.processes == worker]
+            futures.append(
+                executor.submit(_play_worker_round, self._seat_changes[worker], table_ids)
+            )
+            self._seat_changes[worker] = []
+        for future in futures:
+            for table_id, (stacks, latency) in future.result().items():
+                table = tables[table_id]
+                for player in table.get_players():
+                    player.current_stack = stacks[player.player_id]
+                table.stats.record_hand(latency)
+        self._finish_round()
+
+    def _finish_round(self):
+        self.rounds += 1
+        self._eliminate_busted_players()
+        self.rebalance()
+
+    def _run_rounds_in_workers(self, max_rounds: Optional[int]):
+        # One process per executor, so each table always goes back to the same worker
+        workers = [ProcessPoolExecutor(max_workers=1) for _ in range(self.processes)]
+        try:
+            for worker, executor in enumerate(workers):
+                executor.submit(
+                    _start_worker,
+                    [table for table in self.tables if table.table_id % self.processes == worker],
+                ).result()
+            while not self.is_finished() and (max_rounds is None or self.rounds < max_rounds):
+                self._play_round_in_workers(workers)
+        finally:
+            for executor in workers:
+                executor.shutdown()
+
+    def run(self, max_rounds: Optional[int] = None) -> TournamentResult:
+        """
+        Play rounds until one player has all the chips or max_rounds is reached
+        Returns:
+            TournamentResult with standings and throughput/latency per table
+        """
+        with LoggingPolicy.engine_logs_disabled():
+            start = time.perf_counter()
+            if self.processes > 1:
+                self._run_rounds_in_workers(max_rounds)
+            else:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    while not self.is_finished() and (
+                        max_rounds is None or self.rounds < max_rounds
+                    ):
+                        self.play_round(executor)
+            seconds = time.perf_counter() - start
+        return TournamentResult(
+            self.rounds, seconds, self.get_standings(), self.get_table_stats()
+        )
+
+    def get_standings(self) -> List[int]:
+        """player_ids still playing by stack size, followed by the knocked out ones"""
+        remaining = sorted(
+            [player for table in self.tables for player in table.get_players()],
+            key=lambda player: player.current_stack,
+            reverse=True,
+        )
+        return [player.player_id for player in remaining] + self.eliminated[::-1]
+
+    def get_table_stats(self) -> Dict[int, Dict]:
+        tables = sorted(
+            self.tables + self._finished_tables, key=lambda table: table.table_id
+        )
+        return {table.table_id: table.stats.to_dict() for table in tables}
@@ -0,0 +1,171 @@
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Union
+import asyncio
+import time
+
+from engine.classes.Player import Player
+from engine.classes.SingleGame import BettingRound, PlayerAction, SingleGame
+from engine.utils.HandSimulator import SimulationResult
+from loguru import logger
+
+# An agent awaits the decision of the player next to act, e.g. from a network client
+AsyncPolicy = Callable[[SingleGame, Player], Awaitable[Tuple[PlayerAction, int]]]
+
+DEFAULT_ACTION_TIMEOUT = 15.0
+DEFAULT_TIME_BANK = 30.0
+
+
+class _AgentTimeoutError(Exception):
+    """A TimeoutError raised inside an agent, e.g. by its socket, not the decision deadline"""
+
+
+class TimeBank:
+    def __init__(self, seconds: float = DEFAULT_TIME_BANK):
+        """Extra thinking time a player can spend over the per-action timeout"""
+        self.seconds = seconds
+
+    def consume(self, seconds_used: float, action_timeout: float):
+        """Take the time used over the action timeout out of the bank"""
+        self.seconds = max(0.0, self.seconds - max(0.0, seconds_used - action_timeout))
+
+
+class AsyncTableRunner:
+    def __init__(
+        self,
+        players: List[Player],
+        agents: Dict[int, AsyncPolicy],
+        big_blind_bet: int = 20,
+        action_timeout: float = DEFAULT_ACTION_TIMEOUT,
+        time_bank: float = DEFAULT_TIME_BANK,
+        reset_stacks: bool = False,
+        rotate_button: bool = True,
+        seed: Optional[int] = None,
+    ):
+        """
+        Drive a SingleGame from an event loop, awaiting each decision from its agent.
+        A player gets action_timeout seconds plus whatever is left in their time bank;
+        when both run out, or the agent raises or returns an illegal action, the player
+        checks if they can and folds otherwise.
+        Args:
+            players: Players in seat order, the first one posts the small blind
+            agents: Async policy per player_id
+            big_blind_bet: Big blind of every hand
+            action_timeout: Seconds per decision before the time bank is used
+            time_bank: Seconds of time bank per player, kept across hands
+            reset_stacks: Give every player their starting stack back before each hand
+            rotate_button: Move the blinds one seat along after each hand
+            seed: Seed of the deck
+        """
+        missing = [player.player_id for player in players if player.player_id not in agents]
+        if missing:
+            raise ValueError(f"No agent for players: {missing}")
+        if action_timeout <= 0:
+            raise ValueError("Action timeout must be greater than 0")
+        self.agents = agents
+        self.action_timeout = action_timeout
+        self.reset_stacks = reset_stacks
+        self.rotate_button = rotate_button
+        self.time_banks: Dict[int, TimeBank] = {
+            player.player_id: TimeBank(time_bank) for player in players
+        }
+        # Number of decisions taken automatically per player_id
+        self.auto_actions: Dict[int, int] = {player.player_id: 0 for player in players}
+        self.game = SingleGame(big_blind_bet=big_blind_bet, seed=seed)
+        self.game.register_players(*players)
+
+    @staticmethod
+    def get_auto_action(game: SingleGame, player: Player) -> Tuple[PlayerAction, int]:
+        """Check when there is nothing to call, fold otherwise"""
+        if game.get_amount_to_call(player) == 0:
+            return PlayerAction.CHECK, 0
+        return PlayerAction.FOLD, 0
+
+    async def _call_agent(self, player: Player) -> Tuple[PlayerAction, int]:
+        try:
+            return await self.agents[player.player_id](self.game, player)
+        except (asyncio.TimeoutError, TimeoutError) as error:
+            # Only wait_for() expiring is the decision deadline
+            raise _AgentTimeoutError(f"Agent of player {player.player_id} timed out") from error
+
+    async def _await_decision(self, player: Player) -> Tuple[PlayerAction, int]:
+        time_bank = self.time_banks[player.player_id]
+        start = time.perf_counter()
+        try:
+            action, amount = await asyncio.wait_for(
+                self._call_agent(player), self.action_timeout + time_bank.seconds
+            )
+        except asyncio.TimeoutError:
+            time_bank.seconds = 0.0
+            self.auto_actions[player.player_id] += 1
+            logger.warning("Player {} timed out.", player.player_id)
+            return self.get_auto_action(self.game, player)
+        except Exception:
+            # A failing agent loses the decision, not the hand for everyone else
+            time_bank.consume(time.perf_counter() - start, self.action_timeout)
+            self.auto_actions[player.player_id] += 1
+            logger.exception("Agent of player {} raised an error.", player.player_id)
+            return self.get_auto_action(self.game, player)
+        time_bank.consume(time.perf_counter() - start, self.action_timeout)
+        return action, amount
+
+    async def play_hand(self) -> Dict[int, int]:
+        """
+        Play one hand from the blinds to the showdown
+        Returns:
+            Dict mapping player_id to the amount won from the pot
+        """
+        game = self.game
+        if game.current_betting_round != BettingRound.NOTSTARTED:
+            game.start_new_hand(self.rotate_button)
+        if self.reset_stacks:
+            for player in game.all_players:
+                player.current_stack = player.starting_stack
+        game.advance_betting_round()
+        player = game.advance_to_next_decision()
+        while player is not None:
+            action, amount = await self._await_decision(player)
+            if not game.get_legal_actions().is_legal(action, amount):
+                self.auto_actions[player.player_id] += 1
+                logger.warning(
+                    "Player {} sent an illegal action: {} {}", player.player_id, action, amount
+                )
+                action, amount = self.get_auto_action(game, player)
+            game.process_player_action(player.player_id, action, amount)
+            player = game.advance_to_next_decision()
+        return game.resolve_winner()
+
+    async def run(self, num_hands: int) -> SimulationResult:
+        """Play num_hands hands in a row"""
+        players = self.game.all_players
+        net_winnings = {player.player_id: 0 for player in players}
+        start = time.perf_counter()
+        for _ in range(num_hands):
+            stacks_before = {
+                player.player_id: (
+                    player.starting_stack if self.reset_stacks else player.current_stack
+                )
+                for player in players
+            }
+            await self.play_hand()
+            for player in players:
+                net_winnings[player.player_id] += (
+                    player.current_stack - stacks_before[player.player_id]
+                )
+        return SimulationResult(num_hands, time.perf_counter() - start, net_winnings)
+
+
+async def run_tables(
+    runners: List[AsyncTableRunner], num_hands: int
+) -> List[Union[SimulationResult, Exception]]:
+    """
+    Run many tables concurrently on the current event loop. A table that fails
+    stops on its own, the others play on.
+    Returns:
+        The SimulationResult of every table, or the exception that stopped it
+    """
+    results = await asyncio.gather(
+        *[runner.run(num_hands) for runner in runners], return_exceptions=True
+    )
+    for table, result in enumerate(results):
+        if isinstance(result, Exception):
+            logger.opt(exception=result).error("Table {} stopped with an error.", table)
+    return results
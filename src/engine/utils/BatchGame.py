@@ -0,0 +1,475 @@
+from typing import Optional, Sequence, Union
+import argparse
+import random
+import time
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "BatchGame requires numpy. Install it with `pip install numpy`."
+    ) from e
+
+from engine.classes.SingleGame import BettingRound, PlayerAction
+from engine.utils.BatchHandEvaluator import BatchHandEvaluator
+
+# Action codes of BatchGame.step(), index into ACTIONS
+FOLD, CHECK, CALL, RAISE = range(4)
+ACTIONS = [PlayerAction.FOLD, PlayerAction.CHECK, PlayerAction.CALL, PlayerAction.RAISE]
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+
+# Betting round codes of BatchGame.betting_rounds, index into BETTING_ROUNDS
+PREFLOP, FLOP, TURN, RIVER, ENDED = range(1, 6)
+BETTING_ROUNDS = list(BettingRound)
+
+NO_SEAT = -1
+NO_CARD = -1
+
+
+class BatchLegalActions:
+    def __init__(self, seats, amount_to_call, can_raise, min_raise_to, max_raise_to):
+        """
+        Same as SingleGame's LegalActions, one entry per game. Games without a player
+        to act have seat NO_SEAT and no legal actions.
+        """
+        self.seats = seats
+        self.amount_to_call = amount_to_call
+        self.can_check = amount_to_call == 0
+        self.can_raise = can_raise
+        self.min_raise_to = min_raise_to
+        self.max_raise_to = max_raise_to
+
+    def is_legal(self, actions, amounts) -> np.ndarray:
+        """Bool array, True for games where process_player_action() would accept the action"""
+        actions = np.asarray(actions)
+        amounts = np.asarray(amounts)
+        return (self.seats != NO_SEAT) & np.select(
+            [actions == RAISE, actions == CHECK, (actions == CALL) | (actions == FOLD)],
+            [
+                self.can_raise
+                & (self.min_raise_to <= amounts)
+                & (amounts <= self.max_raise_to),
+                self.can_check,
+                True,
+            ],
+            False,
+        )
+
+
+class BatchGame:
+    def __init__(
+        self,
+        num_games: int,
+        num_players: int,
+        starting_stack: Union[int, Sequence[int]] = 1000,
+        big_blind_bet: int = 20,
+        seeds: Optional[Sequence[int]] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        Lockstep engine for many games of num_players each, with the same rules as
+        SingleGame. Game state is kept in NumPy arrays of shape (num_games,) or
+        (num_games, num_players) and every step acts in all games at once.
+        Args:
+            num_games: Number of games played side by side
+            num_players: Players per game, seat 0 posts the small blind of the first hand
+            starting_stack: Starting stack of every player, or one per seat
+            big_blind_bet: Big blind of every game
+            seeds: One deck seed per game. Game i then deals the same cards as
+                SingleGame(seed=seeds[i]) with the players in the same seats.
+            seed: Seed of the vectorized shuffle used without seeds
+        """
+        if big_blind_bet <= 0 or big_blind_bet % 2 != 0:
+            raise ValueError("Big blind bet must be even and greater than 0")
+        if num_players < 2:
+            raise ValueError("Not enough players to start a round")
+        if seeds is not None and len(seeds) != num_games:
+            raise ValueError(f"Expected {num_games} seeds, got {len(seeds)}")
+        self.num_games = num_games
+        self.num_players = num_players
+        self.big_blind_bet = big_blind_bet
+        self.small_blind_bet = big_blind_bet // 2
+        self.rngs = None if seeds is None else [random.Random(s) for s in seeds]
+        self.np_rng = np.random.default_rng(seed)
+
+        shape = (num_games, num_players)
+        self.stacks = np.empty(shape, dtype=np.int64)
+        self.stacks[:] = starting_stack
+        self.street_bets = np.zeros(shape, dtype=np.int64)
+        self.total_bets = np.zeros(shape, dtype=np.int64)
+        self.winnings = np.zeros(shape, dtype=np.int64)
+        # Players still in the hand, all-in, still to act on the street, and players
+        # who may only call or fold after a short all-in raise
+        self.in_hand = np.zeros(shape, dtype=bool)
+        self.all_in = np.zeros(shape, dtype=bool)
+        self.to_act = np.zeros(shape, dtype=bool)
+        self.call_only = np.zeros(shape, dtype=bool)
+        self.hole_cards = np.full(shape + (2,), NO_CARD, dtype=np.int8)
+
+        self.decks = np.zeros((num_games, 52), dtype=np.int8)
+        # Cards are dealt from the end of each deck, like Deck.deal()
+        self.dealt = np.zeros(num_games, dtype=np.int64)
+        self.boards = np.full((num_games, 5), NO_CARD, dtype=np.int8)
+        self.num_board_cards = np.zeros(num_games, dtype=np.int64)
+        self.betting_rounds = np.zeros(num_games, dtype=np.int8)
+        self.current_bet = np.zeros(num_games, dtype=np.int64)
+        self.min_raise = np.full(num_games, big_blind_bet, dtype=np.int64)
+        # The small blind is the first seat in the hand after the button
+        self.button = np.full(num_games, NO_SEAT, dtype=np.int64)
+        self.last_seat = np.full(num_games, NO_SEAT, dtype=np.int64)
+        self.hands_started = 0
+        self._rows = np.arange(num_games)
+        self._seats = np.arange(num_players)
+
+    # Private methods
+    def _next_seats(self, mask: np.ndarray, after: np.ndarray) -> np.ndarray:
+        """First seat of each row of mask after the seat in after, wrapping around"""
+        seats = (after[:, None] + 1 + self._seats) % self.num_players
+        candidates = np.take_along_axis(mask, seats, axis=1)
+        first = candidates.argmax(axis=1)
+        return np.where(
+            candidates.any(axis=1), seats[self._rows[: len(after)], first], NO_SEAT
+        )
+
+    def _shuffle(self):
+        if self.rngs is None:
+            self.decks[:] = self.np_rng.permuted(
+                np.broadcast_to(np.arange(52, dtype=np.int8), self.decks.shape), axis=1
+            )
+            return
+        order = list(range(52))
+        for i, rng in enumerate(self.rngs):
+            order.sort()
+            # Same draws as Deck.reset(), which shuffles the 52 cards in Card order
+            rng.shuffle(order)
+            self.decks[i] = order
+
+    def _deal(self, rows: np.ndarray) -> np.ndarray:
+        cards = self.decks[rows, 51 - self.dealt[rows]]
+        self.dealt[rows] += 1
+        return cards
+
+    def _post_blind(self, seats: np.ndarray, blind: int):
+        rows = self._rows
+        amounts = np.minimum(blind, self.stacks[rows, seats])
+        self._put_chips(rows, seats, amounts)
+
+    def _put_chips(self, rows: np.ndarray, seats: np.ndarray, amounts: np.ndarray):
+        self.stacks[rows, seats] -= amounts
+        self.street_bets[rows, seats] += amounts
+        self.total_bets[rows, seats] += amounts
+        self.current_bet[rows] = np.maximum(
+            self.current_bet[rows], self.street_bets[rows, seats]
+        )
+        went_all_in = self.stacks[rows, seats] == 0
+        self.all_in[rows, seats] |= went_all_in
+        self.to_act[rows[went_all_in], seats[went_all_in]] = False
+        self.last_seat[rows] = seats
+
+    def _start_street(self, rows: np.ndarray):
+        self.street_bets[rows] = 0
+        self.current_bet[rows] = 0
+        self.min_raise[rows] = self.big_blind_bet
+        can_bet = self.in_hand[rows] & ~self.all_in[rows]
+        # No one acts when fewer than two players can still bet, the board runs out
+        self.to_act[rows] = can_bet & (can_bet.sum(axis=1) >= 2)[:, None]
+        self.call_only[rows] = False
+        self.last_seat[rows] = self.button[rows]
+
+    def _next_street(self, rows: np.ndarray):
+        self.betting_rounds[rows] += 1
+        self.dealt[rows] += 1  # Burn card
+        flop = rows[self.betting_rounds[rows] == FLOP]
+        if flop.size:
+            self.boards[flop, :3] = np.stack([self._deal(flop) for _ in range(3)], axis=1)
+            self.num_board_cards[flop] = 3
+        turn_or_river = rows[self.betting_rounds[rows] != FLOP]
+        if turn_or_river.size:
+            self.boards[turn_or_river, self.num_board_cards[turn_or_river]] = self._deal(
+                turn_or_river
+            )
+            self.num_board_cards[turn_or_river] += 1
+        self._start_street(rows)
+
+    def _get_strengths(self, rows: np.ndarray) -> np.ndarray:
+        """Hand strength of every player in the hand, -1 for folded seats"""
+        strengths = np.full((rows.size, self.num_players), -1, dtype=np.int64)
+        showdown = self.in_hand[rows].sum(axis=1) > 1
+        if showdown.any():
+            showdown_rows = rows[showdown]
+            cards = np.concatenate(
+                [
+                    self.hole_cards[showdown_rows],
+                    np.broadcast_to(
+                        self.boards[showdown_rows, None, :],
+                        (showdown_rows.size, self.num_players, 5),
+                    ),
+                ],
+                axis=2,
+            )
+            in_hand = self.in_hand[showdown_rows]
+            # Only the players in the hand, folded seats have no cards to evaluate
+            showdown_strengths = np.full(in_hand.shape, -1, dtype=np.int64)
+            showdown_strengths[in_hand] = BatchHandEvaluator.evaluate_strengths(
+                cards[in_hand]
+            )
+            strengths[showdown] = showdown_strengths
+        return strengths
+
+    def _resolve(self, rows: np.ndarray):
+        """
+        Award the pots of the finished games, with the layers of build_pots(): one pot
+        per distinct contribution of a live player, folded chips above the largest
+        one going to the last pot, and odd chips to the earliest seats.
+        """
+        contributions = self.total_bets[rows]
+        live = self.in_hand[rows]
+        strengths = self._get_strengths(rows)
+        winnings = np.zeros_like(contributions)
+        big = np.iinfo(np.int64).max
+        levels = np.sort(np.where(live, contributions, big), axis=1)
+        top_level = np.where(live, contributions, 0).max(axis=1)
+        previous_level = np.zeros(rows.size, dtype=np.int64)
+        for k in range(self.num_players):
+            level = levels[:, k]
+            is_pot = (level != big) & (level > previous_level)
+            if not is_pot.any():
+                continue
+            level = np.where(is_pot, level, previous_level)
+            upper = np.where(level == top_level, big, level)
+            amounts = (
+                np.minimum(contributions, upper[:, None])
+                - np.minimum(contributions, previous_level[:, None])
+            ).sum(axis=1)
+            eligible = live & (contributions >= level[:, None]) & is_pot[:, None]
+            best = np.where(eligible, strengths, -2).max(axis=1)
+            winners = eligible & (strengths == best[:, None])
+            num_winners = np.maximum(winners.sum(axis=1), 1)
+            shares, odd_chips = np.divmod(amounts, num_winners)
+            order = winners.cumsum(axis=1) - 1
+            winnings += winners * (
+                shares[:, None] + (order < odd_chips[:, None])
+            )
+            previous_level = level
+        self.winnings[rows] = winnings
+        self.stacks[rows] += winnings
+        self.betting_rounds[rows] = ENDED
+        self.to_act[rows] = False
+
+    def _advance(self):
+        """Advance through completed betting streets and resolve finished hands"""
+        while True:
+            playing = self.betting_rounds != ENDED
+            street_complete = playing & ~self.to_act.any(axis=1)
+            finished = playing & (
+                (self.in_hand.sum(axis=1) < 2)
+                | (street_complete & (self.betting_rounds == RIVER))
+            )
+            if finished.any():
+                self._resolve(np.nonzero(finished)[0])
+            advancing = np.nonzero(street_complete & ~finished)[0]
+            if not advancing.size:
+                return
+            self._next_street(advancing)
+
+    # Public methods
+    def start_hands(self, rotate_button: bool = True):
+        """
+        Shuffle and deal a new hand in every game, post the blinds and advance to the
+        first decision. Stacks carry over from the previous hand.
+        Args:
+            rotate_button: Move the button one seat along, from the second hand on
+        """
+        if rotate_button and self.hands_started:
+            self.button = (self.button + 1) % self.num_players
+        self.hands_started += 1
+        self.in_hand = self.stacks > 0
+        if (self.in_hand.sum(axis=1) < 2).any():
+            raise ValueError("Not enough players with chips to start a round")
+        self._shuffle()
+        self.dealt[:] = 0
+        self.boards[:] = NO_CARD
+        self.num_board_cards[:] = 0
+        self.total_bets[:] = 0
+        self.winnings[:] = 0
+        self.all_in[:] = False
+        self.betting_rounds[:] = PREFLOP
+
+        # Heads-up the button moves onto the first seat in the hand from it and posts
+        # the small blind, like SeatRing.start_hand()
+        heads_up = self.in_hand.sum(axis=1) == 2
+        self.button = np.where(
+            heads_up,
+            self._next_seats(self.in_hand, np.maximum(self.button, 0) - 1),
+            self.button,
+        )
+        small_blind = np.where(
+            heads_up, self.button, self._next_seats(self.in_hand, self.button)
+        )
+        big_blind = self._next_seats(self.in_hand, small_blind)
+        # Hole cards go one at a time to every player in the hand, from the small blind
+        rotated = (self._seats - small_blind[:, None]) % self.num_players
+        order = np.take_along_axis(
+            np.take_along_axis(
+                self.in_hand, (small_blind[:, None] + self._seats) % self.num_players, 1
+            ).cumsum(axis=1)
+            - 1,
+            rotated,
+            axis=1,
+        )
+        num_in_hand = self.in_hand.sum(axis=1)
+        for card in range(2):
+            positions = 51 - (card * num_in_hand[:, None] + order)
+            self.hole_cards[:, :, card] = np.where(
+                self.in_hand,
+                np.take_along_axis(self.decks, np.clip(positions, 0, 51), axis=1),
+                NO_CARD,
+            )
+        self.dealt[:] = 2 * num_in_hand
+
+        self._start_street(self._rows)
+        self._post_blind(small_blind, self.small_blind_bet)
+        self._post_blind(big_blind, self.big_blind_bet)
+        self._advance()
+
+    def get_next_seats(self) -> np.ndarray:
+        """Seat next to act in every game, NO_SEAT where the hand is over"""
+        return self._next_seats(self.to_act, self.last_seat)
+
+    def get_legal_actions(self) -> BatchLegalActions:
+        seats = self.get_next_seats()
+        acting = seats != NO_SEAT
+        safe_seats = np.where(acting, seats, 0)
+        rows = self._rows
+        stacks = self.stacks[rows, safe_seats]
+        street_bets = self.street_bets[rows, safe_seats]
+        to_call = self.current_bet - street_bets
+        max_raise_to = street_bets + stacks
+        others_can_act = (
+            (self.in_hand & ~self.all_in).sum(axis=1)
+            - (self.in_hand & ~self.all_in)[rows, safe_seats]
+        ) > 0
+        return BatchLegalActions(
+            seats,
+            np.where(acting, np.minimum(to_call, stacks), 0),
+            acting
+            & (stacks > to_call)
+            & ~self.call_only[rows, safe_seats]
+            & others_can_act,
+            np.minimum(self.current_bet + self.min_raise, max_raise_to),
+            max_raise_to,
+        )
+
+    def step(self, actions, amounts=None):
+        """
+        Apply one action in every game with a player to act, then deal the next
+        streets and resolve the hands that are over
+        Args:
+            actions: Action code (FOLD, CHECK, CALL or RAISE) per game, ignored in
+                games where the hand is over
+            amounts: Raise-to amount per game, as in SingleGame.process_player_action()
+        """
+        actions = np.asarray(actions)
+        if amounts is None:
+            amounts = np.zeros(self.num_games, dtype=np.int64)
+        amounts = np.asarray(amounts, dtype=np.int64)
+        legal_actions = self.get_legal_actions()
+        seats = legal_actions.seats
+        acting = seats != NO_SEAT
+        illegal = acting & ~legal_actions.is_legal(actions, amounts)
+        if illegal.any():
+            raise ValueError(f"Illegal actions in games {np.nonzero(illegal)[0].tolist()}")
+
+        rows = np.nonzero(acting)[0]
+        seats = seats[rows]
+        actions = actions[rows]
+        self.to_act[rows, seats] = False
+        self.last_seat[rows] = seats
+
+        folding = actions == FOLD
+        self.in_hand[rows[folding], seats[folding]] = False
+
+        raising = actions == RAISE
+        raise_sizes = amounts[rows] - self.current_bet[rows]
+        # A short all-in raise doesn't change the minimum raise
+        full_raise = raising & (raise_sizes >= self.min_raise[rows])
+        self.min_raise[rows] = np.where(full_raise, raise_sizes, self.min_raise[rows])
+        chips = np.select(
+            [actions == CALL, raising],
+            [
+                legal_actions.amount_to_call[rows],
+                amounts[rows] - self.street_bets[rows, seats],
+            ],
+            0,
+        )
+        self._put_chips(rows, seats, chips)
+
+        raise_rows, raise_seats = rows[raising], seats[raising]
+        if raise_rows.size:
+            # Everyone who already acted acts again, only calling or folding after a
+            # short all-in
+            reopened = (
+                self.in_hand[raise_rows]
+                & ~self.all_in[raise_rows]
+                & ~self.to_act[raise_rows]
+            )
+            reopened[np.arange(raise_rows.size), raise_seats] = False
+            self.to_act[raise_rows] |= reopened
+            self.call_only[raise_rows] = np.where(
+                full_raise[raising][:, None],
+                False,
+                self.call_only[raise_rows] | reopened,
+            )
+        self._advance()
+
+    def is_done(self) -> np.ndarray:
+        return self.betting_rounds == ENDED
+
+    def get_pots(self) -> np.ndarray:
+        return self.total_bets.sum(axis=1)
+
+    def get_betting_rounds(self):
+        return [BETTING_ROUNDS[betting_round] for betting_round in self.betting_rounds]
+
+
+def random_actions(
+    legal_actions: BatchLegalActions,
+    rng: np.random.Generator,
+    fold_probability: float = 0.2,
+    raise_probability: float = 0.1,
+):
+    """
+    Vectorized counterpart of RandomPolicy: raise the minimum, fold facing a bet,
+    otherwise check or call
+    Returns:
+        Tuple of action codes and amounts, ready for BatchGame.step()
+    """
+    draws = rng.random(legal_actions.seats.shape)
+    actions = np.where(legal_actions.can_check, CHECK, CALL)
+    actions = np.where(
+        ~legal_actions.can_check & (draws < fold_probability), FOLD, actions
+    )
+    raising = legal_actions.can_raise & (draws >= 1 - raise_probability)
+    actions = np.where(raising, RAISE, actions)
+    return actions, np.where(raising, legal_actions.min_raise_to, 0)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play random hands in lockstep")
+    parser.add_argument("--games", type=int, default=10_000)
+    parser.add_argument("--players", type=int, default=6)
+    parser.add_argument("--hands", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    batch = BatchGame(args.games, args.players, seed=args.seed)
+    rng = np.random.default_rng(args.seed)
+    start = time.perf_counter()
+    for _ in range(args.hands):
+        batch.stacks[:] = 1000
+        batch.start_hands()
+        while not batch.is_done().all():
+            batch.step(*random_actions(batch.get_legal_actions(), rng))
+    seconds = time.perf_counter() - start
+    hands = args.games * args.hands
+    print(f"{hands} hands in {seconds:.2f}s ({hands / seconds:.0f} hands/s)")
@@ -0,0 +1,99 @@
+from typing import List, Tuple
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "BatchHandEvaluator requires numpy. Install it with `pip install numpy`."
+    ) from e
+
+from engine.utils.HandEvaluator import (
+    CARD_KEYS,
+    CATEGORY_SHIFT,
+    FLUSH_CHECK_MASK,
+    FLUSH_TABLE,
+    NUM_SUITS,
+    RANK_TABLE,
+    SUIT_BITS,
+    SUIT_COUNT_BIAS,
+    HandRank,
+)
+
+# NumPy copies of the HandEvaluator tables. The rank table is a dict in the scalar
+# evaluator, here it is a sorted key array searched with np.searchsorted.
+CARD_KEYS_ARRAY = np.array(CARD_KEYS, dtype=np.int64)
+FLUSH_TABLE_ARRAY = np.array(FLUSH_TABLE, dtype=np.int64)
+_rank_table_keys = sorted(RANK_TABLE)
+RANK_TABLE_KEYS = np.array(_rank_table_keys, dtype=np.int64)
+RANK_TABLE_STRENGTHS = np.array(
+    [RANK_TABLE[key] for key in _rank_table_keys], dtype=np.int64
+)
+
+
+class BatchHandEvaluator:
+
+    @staticmethod
+    def evaluate(cards) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate many hands at once with vectorized table lookups
+        Args:
+            cards: (N, 5), (N, 6) or (N, 7) array of integer cards (see engine.classes.Card)
+        Returns:
+            Tuple of an N-length int64 array of hand strengths, identical to
+            HandEvaluator.evaluate() per row, and an N-length int8 array of HandRank values
+        """
+        strengths = BatchHandEvaluator.evaluate_strengths(cards)
+        return strengths, (strengths >> CATEGORY_SHIFT).astype(np.int8)
+
+    @staticmethod
+    def evaluate_strengths(cards) -> np.ndarray:
+        """Same as evaluate(), without the HandRank categories"""
+        cards = np.asarray(cards, dtype=np.int64)
+        if cards.ndim != 2 or not 5 <= cards.shape[1] <= 7:
+            raise ValueError(
+                f"Cards must be an (N, 5), (N, 6) or (N, 7) array, got shape {cards.shape}"
+            )
+        out_of_range = ((cards < 0) | (cards >= len(CARD_KEYS))).any(axis=1)
+        if out_of_range.any():
+            raise ValueError(
+                "Cards must be integers between 0 and 51, "
+                + f"rows {np.nonzero(out_of_range)[0].tolist()} are not"
+            )
+        sorted_cards = np.sort(cards, axis=1)
+        duplicates = (sorted_cards[:, 1:] == sorted_cards[:, :-1]).any(axis=1)
+        if duplicates.any():
+            raise ValueError(
+                f"Rows {np.nonzero(duplicates)[0].tolist()} hold the same card twice"
+            )
+
+        keys = CARD_KEYS_ARRAY[cards].sum(axis=1) + SUIT_COUNT_BIAS
+        rank_keys = keys >> SUIT_BITS
+        # Every multiset of ranks is in the table, so flush hands get a (discarded) match too
+        indexes = np.minimum(
+            np.searchsorted(RANK_TABLE_KEYS, rank_keys), len(RANK_TABLE_KEYS) - 1
+        )
+        unknown = RANK_TABLE_KEYS[indexes] != rank_keys
+        if unknown.any():
+            raise ValueError(
+                f"Rows {np.nonzero(unknown)[0].tolist()} are not valid hands"
+            )
+        strengths = RANK_TABLE_STRENGTHS[indexes]
+
+        flush_rows = np.nonzero(keys & FLUSH_CHECK_MASK)[0]
+        if flush_rows.size:
+            flush_cards = cards[flush_rows]
+            flush_bits = keys[flush_rows] & FLUSH_CHECK_MASK
+            # Bit 3 of suit nibble s is set for the flush suit
+            flush_suits = np.zeros(flush_rows.size, dtype=np.int64)
+            for suit in range(1, NUM_SUITS):
+                flush_suits[(flush_bits >> (4 * suit + 3)) & 1 == 1] = suit
+            in_flush_suit = (flush_cards & 3) == flush_suits[:, None]
+            # One card per rank in a suit, so summing rank bits is the same as or-ing them
+            rank_masks = ((1 << (flush_cards >> 2)) * in_flush_suit).sum(axis=1)
+            strengths[flush_rows] = FLUSH_TABLE_ARRAY[rank_masks]
+        return strengths
+
+    @staticmethod
+    def to_hand_ranks(categories) -> List[HandRank]:
+        """Convert an array of HandRank values returned by evaluate() to HandRanks"""
+        return [HandRank(int(category)) for category in categories]
@@ -0,0 +1,91 @@
+from typing import Dict, List, Tuple
+import functools
+import itertools
+
+from engine.utils.WinningHandProbability import EquityResult, WinningHandProbability
+from engine.utils.WinningHandSelector import (
+    INT_TO_SHORT_NAME,
+    SHORT_NAME_TO_INT,
+    WinningHandSelector,
+)
+
+# (sorted board, sorted hole cards of player 1, sorted hole cards of player 2, ...)
+CanonicalKey = Tuple[Tuple[int, ...], ...]
+
+SUIT_PERMUTATIONS = list(itertools.permutations(range(4)))
+DEFAULT_CACHE_SIZE = 10_000
+
+
+def canonicalize(hole_cards: List[List[int]], board: List[int]) -> CanonicalKey:
+    """
+    Canonical form of a spot under suit permutation. Spots that only differ by
+    relabeling suits (e.g. AhKh vs QsQd on 2h7c9s and AsKs vs QhQc on 2s7d9h) have
+    the same equities and the same canonical key. Player order is kept.
+    Args:
+        hole_cards: Integer hole cards per player
+        board: Integer community cards
+    Returns:
+        The smallest key over all 24 suit permutations
+    """
+    best = None
+    for permutation in SUIT_PERMUTATIONS:
+        key = (tuple(sorted([(c & ~3) | permutation[c & 3] for c in board])),) + tuple(
+            tuple(sorted([(c & ~3) | permutation[c & 3] for c in hole]))
+            for hole in hole_cards
+        )
+        if best is None or key < best:
+            best = key
+    return best
+
+
+class EquityCache:
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE, **probability_kwargs):
+        """
+        LRU cache of equities keyed on the suit-canonical form of each spot
+        Args:
+            maxsize: Maximum number of canonical spots kept
+            probability_kwargs: Passed on to WinningHandProbability, e.g. num_samples
+        """
+        self.probability_kwargs = probability_kwargs
+        self._calculate = functools.lru_cache(maxsize=maxsize)(
+            self._calculate_canonical
+        )
+
+    def _calculate_canonical(self, key: CanonicalKey) -> Tuple[EquityResult, ...]:
+        board, *hole_cards = key
+        player_hands = {
+            str(i): [INT_TO_SHORT_NAME[card] for card in hole]
+            for i, hole in enumerate(hole_cards)
+        }
+        equities = WinningHandProbability(
+            player_hands,
+            [INT_TO_SHORT_NAME[card] for card in board],
+            **self.probability_kwargs,
+        ).calculate_equities()
+        return tuple(equities[str(i)] for i in range(len(hole_cards)))
+
+    def calculate_equities(
+        self, player_hands: Dict[str, List[str]], community_cards: List[str]
+    ) -> Dict[str, EquityResult]:
+        """
+        Same as WinningHandProbability(player_hands, community_cards).calculate_equities(),
+        computed once per suit-isomorphic spot
+        """
+        WinningHandSelector.validate_hands(player_hands, community_cards)
+        key = canonicalize(
+            [[SHORT_NAME_TO_INT[card] for card in hole] for hole in player_hands.values()],
+            [SHORT_NAME_TO_INT[card] for card in community_cards],
+        )
+        return dict(zip(player_hands.keys(), self._calculate(key)))
+
+    def cache_info(self):
+        """hits, misses, maxsize and currsize of the cache"""
+        return self._calculate.cache_info()
+
+    def get_hit_rate(self) -> float:
+        info = self._calculate.cache_info()
+        lookups = info.hits + info.misses
+        return info.hits / lookups if lookups else 0.0
+
+    def clear(self):
+        self._calculate.cache_clear()
@@ -0,0 +1,258 @@
+from typing import Dict, List, Optional, Tuple
+import random
+import struct
+
+from engine.classes.Card import CARDS, VERBOSE_NAME_TO_INT
+from engine.classes.Deck import Deck
+from engine.classes.Player import Player
+from engine.classes.SeatRing import SeatRing
+from engine.classes.SingleGame import Bet, BettingRound, SingleGame
+from engine.utils.HandEvaluator import IncrementalHand
+
+SNAPSHOT_MAGIC = b"SGS"
+SNAPSHOT_VERSION = 4
+BETTING_ROUNDS = list(BettingRound)
+BETTING_ROUND_INDEX = {betting_round: i for i, betting_round in enumerate(BETTING_ROUNDS)}
+
+# Little-endian layouts. Ids are 64-bit, chip amounts 32-bit, cards and seats 1 byte.
+_HEADER = struct.Struct("<3sBqIBIIIb")  # magic, version, id, big blind, round, current bet, min raise, pot, last raiser
+_PLAYER = struct.Struct("<qIIIIBH")  # id, starting stack, stack, hand total, street total, flags, name length
+_COUNT = struct.Struct("<H")
+_BET = struct.Struct("<BI")  # seat, amount
+_RING = struct.Struct("<hh")  # button, last seat to act
+_RNG_STATE = struct.Struct("<625I")  # Mersenne Twister key and position
+_RNG_GAUSS = struct.Struct("<?d")  # has a cached gauss value, the value
+
+_IS_ACTIVE = 1
+_IS_ALL_IN = 2
+_HAS_ACTED = 4
+_HAS_HAND_STATE = 8
+_NO_LAST_RAISER = -1
+
+
+def _pack_cards(cards) -> bytes:
+    return bytes([len(cards)]) + bytes(card.card_int for card in cards)
+
+
+def _pack_rng(rng: Optional[random.Random]) -> bytes:
+    """Generator state of a seeded deck, a single 0 byte for the global random module"""
+    if rng is None:
+        return b"\x00"
+    version, internal_state, gauss_next = rng.getstate()
+    return (
+        bytes([version])
+        + _RNG_STATE.pack(*internal_state)
+        + _RNG_GAUSS.pack(gauss_next is not None, gauss_next or 0.0)
+    )
+
+
+def _pack_seats(players: List[Player], seats: Dict[int, int]) -> bytes:
+    return bytes([len(players)]) + bytes(seats[player.player_id] for player in players)
+
+
+class GameSnapshot:
+
+    @staticmethod
+    def dump(game: SingleGame) -> bytes:
+        """
+        Serialize a SingleGame, including a hand in progress, to compact bytes.
+        Cards are stored as 1-byte integers and players as seat indexes.
+        Args:
+            game: Game to serialize
+        Returns:
+            Snapshot bytes, restored with GameSnapshot.load()
+        """
+        seats = {player.player_id: i for i, player in enumerate(game.all_players)}
+        parts = [
+            _HEADER.pack(
+                SNAPSHOT_MAGIC,
+                SNAPSHOT_VERSION,
+                game.id,
+                game.big_blind_bet,
+                BETTING_ROUND_INDEX[game.current_betting_round],
+                game.current_bet,
+                game.min_raise,
+                game.pot,
+                _NO_LAST_RAISER
+                if game.last_raiser_player_index is None
+                else game.last_raiser_player_index,
+            ),
+            bytes([len(game.deck_order_as_list)])
+            + bytes(VERBOSE_NAME_TO_INT[name] for name in game.deck_order_as_list),
+            _pack_cards(game.deck.cards),
+            _pack_rng(game.deck.rng),
+            _pack_cards(game.discard_pile.cards),
+            _pack_cards(game.community_cards.cards),
+            bytes([len(game.all_players)]),
+        ]
+        for player in game.all_players:
+            player_id = player.player_id
+            name = player.player_name.encode()
+            flags = (
+                (_IS_ACTIVE if player.is_active else 0)
+                | (_IS_ALL_IN if player.is_all_in else 0)
+                | (_HAS_ACTED if player.has_acted else 0)
+                | (_HAS_HAND_STATE if player_id in game.hand_states else 0)
+            )
+            parts.append(
+                _PLAYER.pack(
+                    player_id,
+                    player.starting_stack,
+                    player.current_stack,
+                    game.bets_per_player.get(player_id, 0),
+                    game.street_bets_per_player.get(player_id, 0),
+                    flags,
+                    len(name),
+                )
+            )
+            parts.append(name)
+            parts.append(_pack_cards(player.hand.cards))
+        parts.append(_pack_seats(game.active_players, seats))
+        ring = game.seat_ring
+        mask_size = (ring.num_seats + 7) // 8
+        parts.append(_RING.pack(ring.button, ring.last_seat))
+        for mask in (ring.in_hand, ring.all_in, ring.to_act, ring.call_only):
+            parts.append(mask.to_bytes(mask_size, "little"))
+        parts.append(bytes([len(game.bets)]))
+        for round_name, round_bets in game.bets.items():
+            parts.append(bytes([BETTING_ROUND_INDEX[BettingRound(round_name)]]))
+            parts.append(_COUNT.pack(len(round_bets)))
+            parts.extend(
+                _BET.pack(seats[bet.player.player_id], bet.amount) for bet in round_bets
+            )
+        return b"".join(parts)
+
+    @staticmethod
+    def load(data: bytes) -> SingleGame:
+        """
+        Restore a SingleGame written by GameSnapshot.dump(). The game gets new Player
+        objects; cards are the interned Card instances.
+        """
+        (
+            magic,
+            version,
+            game_id,
+            big_blind_bet,
+            round_index,
+            current_bet,
+            min_raise,
+            pot,
+            last_raiser,
+        ) = _HEADER.unpack_from(data, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("Not a SingleGame snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"Snapshot version {version} does not match {SNAPSHOT_VERSION}"
+            )
+        offset = _HEADER.size
+
+        def read_ints() -> Tuple[int, ...]:
+            nonlocal offset
+            count = data[offset]
+            ints = tuple(data[offset + 1 : offset + 1 + count])
+            offset += 1 + count
+            return ints
+
+        def read_deck() -> Deck:
+            deck = Deck(new_deck=False, do_not_shuffle=True)
+            deck.cards = [CARDS[card] for card in read_ints()]
+            return deck
+
+        def read_rng() -> Optional[random.Random]:
+            nonlocal offset
+            rng_version = data[offset]
+            offset += 1
+            if not rng_version:
+                return None
+            internal_state = _RNG_STATE.unpack_from(data, offset)
+            offset += _RNG_STATE.size
+            has_gauss, gauss_next = _RNG_GAUSS.unpack_from(data, offset)
+            offset += _RNG_GAUSS.size
+            rng = random.Random()
+            rng.setstate((rng_version, internal_state, gauss_next if has_gauss else None))
+            return rng
+
+        # Skip __init__, which builds and shuffles a new deck
+        game = SingleGame.__new__(SingleGame)
+        game.id = game_id
+        game.big_blind_bet = big_blind_bet
+        game.small_blind_bet = big_blind_bet // 2
+        game.current_betting_round = BETTING_ROUNDS[round_index]
+        game.current_bet = current_bet
+        game.min_raise = min_raise
+        game.pot = pot
+        game.last_raiser_player_index = None if last_raiser == _NO_LAST_RAISER else last_raiser
+        game.deck_order_as_list = [CARDS[card].verbose_name for card in read_ints()]
+        game.deck = read_deck()
+        # The next hands shuffle the same as they would have in the dumped game
+        game.deck.rng = read_rng()
+        game.discard_pile = read_deck()
+        game.community_cards = read_deck()
+        community_ints = game.community_cards.get_cards_as_ints()
+
+        game.all_players = []
+        game.bets_per_player = {}
+        game.street_bets_per_player = {}
+        game.hand_states = {}
+        num_players = data[offset]
+        offset += 1
+        for _ in range(num_players):
+            (
+                player_id,
+                starting_stack,
+                current_stack,
+                hand_total,
+                street_total,
+                flags,
+                name_length,
+            ) = _PLAYER.unpack_from(data, offset)
+            offset += _PLAYER.size
+            name = data[offset : offset + name_length].decode()
+            offset += name_length
+            player = Player(player_id, name, starting_stack)
+            player.current_stack = current_stack
+            player.is_active = bool(flags & _IS_ACTIVE)
+            player.is_all_in = bool(flags & _IS_ALL_IN)
+            player.has_acted = bool(flags & _HAS_ACTED)
+            hole_cards = read_ints()
+            player.hand.cards = [CARDS[card] for card in hole_cards]
+            if hand_total:
+                game.bets_per_player[player_id] = hand_total
+            if street_total:
+                game.street_bets_per_player[player_id] = street_total
+            if flags & _HAS_HAND_STATE:
+                game.hand_states[player_id] = IncrementalHand(hole_cards + tuple(community_ints))
+            game.all_players.append(player)
+
+        game.active_players = [game.all_players[seat] for seat in read_ints()]
+        game.seats = {player.player_id: i for i, player in enumerate(game.all_players)}
+        ring = SeatRing(num_players)
+        ring.button, ring.last_seat = _RING.unpack_from(data, offset)
+        offset += _RING.size
+        mask_size = (num_players + 7) // 8
+        masks = []
+        for _ in range(4):
+            masks.append(int.from_bytes(data[offset : offset + mask_size], "little"))
+            offset += mask_size
+        ring.in_hand, ring.all_in, ring.to_act, ring.call_only = masks
+        game.seat_ring = ring
+        game.bets = {}
+        num_rounds = data[offset]
+        offset += 1
+        for _ in range(num_rounds):
+            round_name = BETTING_ROUNDS[data[offset]].value
+            (num_bets,) = _COUNT.unpack_from(data, offset + 1)
+            offset += 1 + _COUNT.size
+            round_bets = []
+            for _ in range(num_bets):
+                seat, amount = _BET.unpack_from(data, offset)
+                offset += _BET.size
+                round_bets.append(Bet(game.all_players[seat], amount))
+            game.bets[round_name] = round_bets
+        game.hand_history_writer = None
+        game.action_stack = []
+        game.initial_stack_sizes = [
+            (player.player_id, player.starting_stack) for player in game.all_players
+        ]
+        return game
@@ -0,0 +1,296 @@
+import itertools
+from typing import Dict, Iterable, List, Optional
+from enum import Enum, auto
+
+from engine.classes.Card import VALID_CARDS, mask_to_ints
+
+
+class HandRank(Enum):
+    HIGH_CARD = auto()
+    PAIR = auto()
+    TWO_PAIR = auto()
+    THREE_OF_A_KIND = auto()
+    STRAIGHT = auto()
+    FLUSH = auto()
+    FULL_HOUSE = auto()
+    FOUR_OF_A_KIND = auto()
+    STRAIGHT_FLUSH = auto()
+    ROYAL_FLUSH = auto()
+
+
+# Cards use the integer encoding of engine.classes.Card (rank_index * 4 + suit_index)
+NUM_RANKS = 13
+NUM_SUITS = 4
+NUM_CARDS = len(VALID_CARDS)
+
+# Hand strength layout: HandRank.value in the high bits, then up to 5 card values
+# (2-14) as 4-bit nibbles, most significant first. Higher strength wins.
+CATEGORY_SHIFT = 20
+
+# Per-rank keys whose sums are unique for every multiset of up to 7 cards
+# (at most 4 of each rank) with the same number of cards
+RANK_KEYS = (0, 1, 5, 22, 98, 453, 2031, 8698, 22854, 83661, 262349, 636345, 1479181)
+# Number of cards is kept above the rank key sum so 5, 6 and 7 card hands never collide
+CARD_COUNT_SHIFT = 23
+# Suits are counted in 4-bit nibbles in the low 16 bits of a hand key. Every nibble starts
+# at 3 so that bit 3 of a nibble is set exactly when a suit has 5 or more cards
+SUIT_BITS = 16
+SUIT_COUNT_BIAS = 0x3333
+FLUSH_CHECK_MASK = 0x8888
+FLUSH_BIT_TO_SUIT = {0x8: 0, 0x80: 1, 0x800: 2, 0x8000: 3}
+
+CARD_KEYS = tuple(
+    (((1 << CARD_COUNT_SHIFT) + RANK_KEYS[card >> 2]) << SUIT_BITS)
+    | (1 << (4 * (card & 3)))
+    for card in range(NUM_CARDS)
+)
+CARD_RANK_BITS = tuple(1 << (card >> 2) for card in range(NUM_CARDS))
+
+# Rank bitmasks of every straight, best first. Bit 12 is the Ace, wheel is A-2-3-4-5
+STRAIGHT_MASKS = tuple(
+    (0b11111 << low, low + 6) for low in range(NUM_RANKS - 5, -1, -1)
+) + ((0b1000000001111, 5),)
+
+
+def _strength(hand_rank: HandRank, values: List[int]) -> int:
+    strength = hand_rank.value
+    for i in range(5):
+        strength = (strength << 4) | (values[i] if i < len(values) else 0)
+    return strength
+
+
+def _find_straight(rank_mask: int) -> int:
+    """Return the high card value of the best straight in rank_mask, or 0"""
+    for straight_mask, high in STRAIGHT_MASKS:
+        if rank_mask & straight_mask == straight_mask:
+            return high
+    return 0
+
+
+def _flush_strength(rank_mask: int) -> int:
+    """Strength of the best hand made from the ranks of a single suit"""
+    straight_high = _find_straight(rank_mask)
+    if straight_high == 14:
+        return _strength(HandRank.ROYAL_FLUSH, [14])
+    if straight_high:
+        return _strength(HandRank.STRAIGHT_FLUSH, [straight_high])
+    values = [r + 2 for r in range(NUM_RANKS - 1, -1, -1) if rank_mask >> r & 1]
+    return _strength(HandRank.FLUSH, values[:5])
+
+
+def _rank_counts_strength(counts: List[int]) -> int:
+    """Strength of the best non-flush hand for the given count of each rank"""
+    by_rank = [(counts[r], r + 2) for r in range(NUM_RANKS - 1, -1, -1) if counts[r]]
+    values = [value for _, value in by_rank]
+    quads = [value for count, value in by_rank if count == 4]
+    trips = [value for count, value in by_rank if count == 3]
+    pairs = [value for count, value in by_rank if count == 2]
+
+    if quads:
+        kicker = [v for v in values if v != quads[0]][:1]
+        return _strength(HandRank.FOUR_OF_A_KIND, [quads[0]] + kicker)
+    if trips and (len(trips) > 1 or pairs):
+        pair = max(trips[1:] + pairs)
+        return _strength(HandRank.FULL_HOUSE, [trips[0], pair])
+
+    rank_mask = 0
+    for value in values:
+        rank_mask |= 1 << (value - 2)
+    straight_high = _find_straight(rank_mask)
+    if straight_high:
+        return _strength(HandRank.STRAIGHT, [straight_high])
+
+    if trips:
+        kickers = [v for v in values if v != trips[0]][:2]
+        return _strength(HandRank.THREE_OF_A_KIND, [trips[0]] + kickers)
+    if len(pairs) >= 2:
+        kicker = [v for v in values if v not in pairs[:2]][:1]
+        return _strength(HandRank.TWO_PAIR, pairs[:2] + kicker)
+    if pairs:
+        kickers = [v for v in values if v != pairs[0]][:3]
+        return _strength(HandRank.PAIR, [pairs[0]] + kickers)
+    return _strength(HandRank.HIGH_CARD, values[:5])
+
+
+def _build_rank_table() -> Dict[int, int]:
+    """Map the rank part of a hand key to its strength for every 5, 6 and 7 card multiset"""
+    table = {}
+    for num_cards in range(5, 8):
+        card_count_key = num_cards << CARD_COUNT_SHIFT
+        for ranks in itertools.combinations_with_replacement(range(NUM_RANKS), num_cards):
+            # Sorted ranks, so 5 of a kind shows up as equal ranks 4 positions apart
+            if any(ranks[i] == ranks[i + 4] for i in range(num_cards - 4)):
+                continue
+            key = card_count_key + sum([RANK_KEYS[rank] for rank in ranks])
+            if num_cards == 5:
+                counts = [0] * NUM_RANKS
+                for rank in ranks:
+                    counts[rank] += 1
+                table[key] = _rank_counts_strength(counts)
+            else:
+                # Best hand of n cards is the best hand of one of its (n - 1)-card subsets
+                sub_key = key - (1 << CARD_COUNT_SHIFT)
+                table[key] = max(
+                    [table[sub_key - RANK_KEYS[rank]] for rank in set(ranks)]
+                )
+    return table
+
+
+def _build_flush_table() -> List[int]:
+    """Strength for every 13-bit rank mask with at least 5 ranks, 0 otherwise"""
+    return [
+        _flush_strength(mask) if bin(mask).count("1") >= 5 else 0
+        for mask in range(1 << NUM_RANKS)
+    ]
+
+
+RANK_TABLE: Dict[int, int] = _build_rank_table()
+FLUSH_TABLE: List[int] = _build_flush_table()
+
+
+def hand_key(cards: Iterable[int]) -> int:
+    """Additive key of a set of integer cards, see evaluate_key()"""
+    key = SUIT_COUNT_BIAS
+    for card in cards:
+        key += CARD_KEYS[card]
+    return key
+
+
+def evaluate_key(key: int, cards: Iterable[int]) -> int:
+    """
+    Strength of a hand from its additive key
+    Args:
+        key: SUIT_COUNT_BIAS plus the sum of CARD_KEYS of the cards
+        cards: The same cards, only read when the hand holds a flush
+    Returns:
+        Comparable integer hand strength
+    """
+    flush_bits = key & FLUSH_CHECK_MASK
+    if not flush_bits:
+        return RANK_TABLE[key >> SUIT_BITS]
+    suit = FLUSH_BIT_TO_SUIT[flush_bits]
+    rank_mask = 0
+    for card in cards:
+        if card & 3 == suit:
+            rank_mask |= CARD_RANK_BITS[card]
+    return FLUSH_TABLE[rank_mask]
+
+
+def evaluate(cards: List[int]) -> int:
+    """Strength of the best 5-card hand in 5, 6 or 7 integer cards"""
+    key = SUIT_COUNT_BIAS
+    for card in cards:
+        key += CARD_KEYS[card]
+    flush_bits = key & FLUSH_CHECK_MASK
+    if not flush_bits:
+        return RANK_TABLE[key >> SUIT_BITS]
+    suit = FLUSH_BIT_TO_SUIT[flush_bits]
+    rank_mask = 0
+    for card in cards:
+        if card & 3 == suit:
+            rank_mask |= CARD_RANK_BITS[card]
+    return FLUSH_TABLE[rank_mask]
+
+
+def evaluate_mask(mask: int) -> int:
+    """Strength of the best 5-card hand in a card mask of 5, 6 or 7 cards"""
+    return evaluate(mask_to_ints(mask))
+
+
+def get_hand_rank(strength: int) -> HandRank:
+    """HandRank category of a hand strength"""
+    return HandRank(strength >> CATEGORY_SHIFT)
+
+
+def get_hand_values(strength: int) -> List[int]:
+    """Card values (2-14) used for tie-breaking, most significant first"""
+    values = [(strength >> shift) & 0xF for shift in range(16, -1, -4)]
+    return [v for v in values if v]
+
+
+class HandEvaluator:
+
+    @staticmethod
+    def evaluate(cards: List[int]) -> int:
+        """
+        Evaluate 5, 6 or 7 cards encoded as integers (see engine.classes.Card)
+        Args:
+            cards: List of integer cards
+        Returns:
+            Comparable integer strength of the best 5-card hand
+        """
+        if not 5 <= len(cards) <= 7:
+            raise ValueError(f"Can only evaluate 5 to 7 cards, got {len(cards)}")
+        return evaluate(cards)
+
+    @staticmethod
+    def evaluate_mask(mask: int) -> int:
+        """Same as evaluate() for a 64-bit card mask"""
+        num_cards = bin(mask).count("1")
+        if not 5 <= num_cards <= 7:
+            raise ValueError(f"Can only evaluate 5 to 7 cards, got {num_cards}")
+        return evaluate_mask(mask)
+
+    @staticmethod
+    def get_hand_rank(strength: int) -> HandRank:
+        return get_hand_rank(strength)
+
+    @staticmethod
+    def get_hand_values(strength: int) -> List[int]:
+        return get_hand_values(strength)
+
+
+class IncrementalHand:
+    __slots__ = ("num_cards", "key", "suit_rank_masks", "strength")
+
+    def __init__(self, cards: Iterable[int] = ()):
+        """
+        Running evaluation of a hand that only grows, e.g. hole cards followed by the
+        flop, turn and river. Adding a card and reading the strength are O(1).
+        Args:
+            cards: Initial integer cards
+        """
+        self.reset()
+        for card in cards:
+            self.add_card(card)
+
+    def reset(self):
+        self.num_cards = 0
+        self.key = SUIT_COUNT_BIAS
+        # Rank bits per suit, so the flush lookup does not need to scan the cards
+        self.suit_rank_masks = [0] * NUM_SUITS
+        self.strength = None
+
+    def add_card(self, card: int):
+        if self.num_cards == 7:
+            raise ValueError("Can only evaluate up to 7 cards")
+        self.num_cards += 1
+        self.key += CARD_KEYS[card]
+        self.suit_rank_masks[card & 3] |= CARD_RANK_BITS[card]
+        if self.num_cards < 5:
+            return
+        flush_bits = self.key & FLUSH_CHECK_MASK
+        if flush_bits:
+            self.strength = FLUSH_TABLE[
+                self.suit_rank_masks[FLUSH_BIT_TO_SUIT[flush_bits]]
+            ]
+        else:
+            self.strength = RANK_TABLE[self.key >> SUIT_BITS]
+
+    def copy(self) -> "IncrementalHand":
+        hand = IncrementalHand.__new__(IncrementalHand)
+        hand.num_cards = self.num_cards
+        hand.key = self.key
+        hand.suit_rank_masks = list(self.suit_rank_masks)
+        hand.strength = self.strength
+        return hand
+
+    def get_strength(self) -> Optional[int]:
+        """Strength of the best 5-card hand, None with fewer than 5 cards"""
+        return self.strength
+
+    def get_hand_rank(self) -> Optional[HandRank]:
+        """HandRank of the best 5-card hand, None with fewer than 5 cards"""
+        if self.strength is None:
+            return None
+        return HandRank(self.strength >> CATEGORY_SHIFT)
@@ -0,0 +1,246 @@
+from typing import BinaryIO, Dict, Iterator, List, Tuple
+import mmap
+import os
+import struct
+import time
+
+from engine.classes.Card import CARDS, VERBOSE_NAME_TO_INT
+
+# File layout: FILE_MAGIC, then records of a 4-byte little-endian payload length
+# followed by the payload. Records are only ever appended.
+FILE_MAGIC = b"HHL1"
+DEFAULT_BUFFER_SIZE = 1 << 16
+BETTING_ROUND_NAMES = ["notstarted", "preflop", "flop", "turn", "river", "ended"]
+BETTING_ROUND_INDEX = {name: i for i, name in enumerate(BETTING_ROUND_NAMES)}
+
+_LENGTH = struct.Struct("<I")
+_HAND = struct.Struct("<qdIB")  # game id, timestamp, big blind, number of players
+_PLAYER = struct.Struct("<qIIIH")  # id, stack after the hand, total bet, winnings, name length
+_STREET = struct.Struct("<BH")  # round, number of bets
+_BET = struct.Struct("<BI")  # seat, amount
+
+
+class HandRecord:
+    def __init__(
+        self,
+        game_id: int,
+        timestamp: float,
+        big_blind_bet: int,
+        deck_order: List[str],
+        community_cards: List[str],
+        players: List[Dict],
+        bets: Dict[str, List[Tuple[int, int]]],
+    ):
+        """
+        One hand read back from a hand-history log
+        Args:
+            deck_order: Verbose card names of the shuffled deck, dealt from the end
+            players: Dicts with player_id, player_name, hole_cards, total_bet,
+                winnings and final_stack, in seat order
+            bets: (player_id, amount) per betting round name, in betting order
+        """
+        self.game_id = game_id
+        self.timestamp = timestamp
+        self.big_blind_bet = big_blind_bet
+        self.deck_order = deck_order
+        self.community_cards = community_cards
+        self.players = players
+        self.bets = bets
+
+    def get_winnings(self) -> Dict[int, int]:
+        return {
+            player["player_id"]: player["winnings"]
+            for player in self.players
+            if player["winnings"]
+        }
+
+    def to_dict(self) -> Dict:
+        return {
+            "game_id": self.game_id,
+            "timestamp": self.timestamp,
+            "big_blind_bet": self.big_blind_bet,
+            "deck_order": self.deck_order,
+            "community_cards": self.community_cards,
+            "players": self.players,
+            "bets": self.bets,
+        }
+
+    def __str__(self) -> str:
+        return str(self.to_dict())
+
+
+def encode_hand(game, winnings: Dict[int, int]) -> bytes:
+    """
+    Binary record of a finished SingleGame hand
+    Args:
+        game: SingleGame after resolve_winner()
+        winnings: Amount won per player_id, as returned by resolve_winner()
+    """
+    seats = {player.player_id: i for i, player in enumerate(game.all_players)}
+    parts = [
+        _HAND.pack(game.id, time.time(), game.big_blind_bet, len(game.all_players)),
+        bytes([len(game.deck_order_as_list)]),
+        bytes(VERBOSE_NAME_TO_INT[name] for name in game.deck_order_as_list),
+        bytes([game.community_cards.get_deck_size()]),
+        bytes(card.card_int for card in game.community_cards.cards),
+    ]
+    for player in game.all_players:
+        name = player.player_name.encode()
+        parts.append(
+            _PLAYER.pack(
+                player.player_id,
+                player.current_stack,
+                game.bets_per_player.get(player.player_id, 0),
+                winnings.get(player.player_id, 0),
+                len(name),
+            )
+        )
+        parts.append(name)
+        parts.append(bytes([player.hand.get_deck_size()]))
+        parts.append(bytes(card.card_int for card in player.hand.cards))
+    parts.append(bytes([len(game.bets)]))
+    for round_name, round_bets in game.bets.items():
+        parts.append(_STREET.pack(BETTING_ROUND_INDEX[round_name], len(round_bets)))
+        parts.extend(
+            _BET.pack(seats[bet.player.player_id], bet.amount) for bet in round_bets
+        )
+    return b"".join(parts)
+
+
+def decode_hand(payload) -> HandRecord:
+    """Decode a record written by encode_hand(), from bytes or a memoryview"""
+    game_id, timestamp, big_blind_bet, num_players = _HAND.unpack_from(payload, 0)
+    offset = _HAND.size
+
+    def read_cards() -> List[str]:
+        nonlocal offset
+        count = payload[offset]
+        cards = [CARDS[card].verbose_name for card in payload[offset + 1 : offset + 1 + count]]
+        offset += 1 + count
+        return cards
+
+    deck_order = read_cards()
+    community_cards = read_cards()
+    players = []
+    for _ in range(num_players):
+        player_id, final_stack, total_bet, won, name_length = _PLAYER.unpack_from(
+            payload, offset
+        )
+        offset += _PLAYER.size
+        name = bytes(payload[offset : offset + name_length]).decode()
+        offset += name_length
+        players.append(
+            {
+                "player_id": player_id,
+                "player_name": name,
+                "hole_cards": read_cards(),
+                "total_bet": total_bet,
+                "winnings": won,
+                "final_stack": final_stack,
+            }
+        )
+    bets = {}
+    num_streets = payload[offset]
+    offset += 1
+    for _ in range(num_streets):
+        round_index, num_bets = _STREET.unpack_from(payload, offset)
+        offset += _STREET.size
+        street_bets = []
+        for _ in range(num_bets):
+            seat, amount = _BET.unpack_from(payload, offset)
+            offset += _BET.size
+            street_bets.append((players[seat]["player_id"], amount))
+        bets[BETTING_ROUND_NAMES[round_index]] = street_bets
+    return HandRecord(
+        game_id, timestamp, big_blind_bet, deck_order, community_cards, players, bets
+    )
+
+
+def _find_end_of_records(f: BinaryIO, size: int) -> int:
+    """Offset just past the last complete record of a log, read from its length prefixes"""
+    offset = len(FILE_MAGIC)
+    while offset + _LENGTH.size <= size:
+        f.seek(offset)
+        (length,) = _LENGTH.unpack(f.read(_LENGTH.size))
+        if offset + _LENGTH.size + length > size:
+            break
+        offset += _LENGTH.size + length
+    return offset
+
+
+class HandHistoryWriter:
+    def __init__(self, path: str, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        """
+        Append-only hand-history log. Records are buffered in memory and written in
+        batches of about buffer_size bytes. A partial record left at the end of an
+        existing log by a crash is cut off before appending.
+        Args:
+            path: Log file, created if needed and appended to otherwise
+            buffer_size: Bytes buffered before a write
+        """
+        self.path = path
+        self.buffer_size = buffer_size
+        self._buffer = bytearray()
+        # Appends always go to the end, reading and truncating work anywhere
+        self._file: BinaryIO = open(path, "a+b")
+        size = self._file.seek(0, os.SEEK_END)
+        if size < len(FILE_MAGIC):
+            self._file.truncate(0)
+            self._file.write(FILE_MAGIC)
+            return
+        self._file.seek(0)
+        if self._file.read(len(FILE_MAGIC)) != FILE_MAGIC:
+            self._file.close()
+            raise ValueError(f"{path} is not a hand-history log")
+        end = _find_end_of_records(self._file, size)
+        if end < size:
+            self._file.truncate(end)
+
+    def write(self, payload: bytes):
+        self._buffer += _LENGTH.pack(len(payload))
+        self._buffer += payload
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def record_hand(self, game, winnings: Dict[int, int]):
+        """Called by SingleGame.resolve_winner() when the writer is attached to the game"""
+        self.write(encode_hand(game, winnings))
+
+    def flush(self):
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> "HandHistoryWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_hand_history(path: str) -> Iterator[HandRecord]:
+    """
+    Stream the hands of a log through mmap, so files larger than memory can be
+    scanned. A partially written last record is skipped.
+    """
+    if os.path.getsize(path) <= len(FILE_MAGIC):
+        return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        if data[: len(FILE_MAGIC)] != FILE_MAGIC:
+            raise ValueError(f"{path} is not a hand-history log")
+        offset = len(FILE_MAGIC)
+        end = len(data)
+        while offset + _LENGTH.size <= end:
+            (length,) = _LENGTH.unpack_from(data, offset)
+            offset += _LENGTH.size
+            if offset + length > end:
+                break
+            # A copy of the record, so no view of the mmap outlives it
+            yield decode_hand(data[offset : offset + length])
+            offset += length
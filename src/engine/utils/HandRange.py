@@ -0,0 +1,232 @@
+from typing import Dict, Iterable, List, Tuple
+
+from engine.utils.WinningHandSelector import VALID_CARD_FACES, VALID_CARD_SUITS
+
+# A combo is a pair of integer cards (see engine.classes.Card), highest card first
+Combo = Tuple[int, int]
+
+RANDOM_RANGE_NAMES = ("random", "any")
+
+
+def _make_combo(card1: int, card2: int) -> Combo:
+    return (card1, card2) if card1 > card2 else (card2, card1)
+
+
+def _face_index(face: str) -> int:
+    if face not in VALID_CARD_FACES:
+        raise ValueError(f"Invalid card face: {face}. Must be one of: {VALID_CARD_FACES}")
+    return VALID_CARD_FACES.index(face)
+
+
+def pair_combos(rank_index: int) -> List[Combo]:
+    """The 6 combos of a pocket pair"""
+    return [
+        _make_combo(rank_index * 4 + suit1, rank_index * 4 + suit2)
+        for suit1 in range(4)
+        for suit2 in range(suit1 + 1, 4)
+    ]
+
+
+def suited_combos(high_rank_index: int, low_rank_index: int) -> List[Combo]:
+    """The 4 suited combos of two different ranks"""
+    return [
+        _make_combo(high_rank_index * 4 + suit, low_rank_index * 4 + suit)
+        for suit in range(4)
+    ]
+
+
+def offsuit_combos(high_rank_index: int, low_rank_index: int) -> List[Combo]:
+    """The 12 offsuit combos of two different ranks"""
+    return [
+        _make_combo(high_rank_index * 4 + suit1, low_rank_index * 4 + suit2)
+        for suit1 in range(4)
+        for suit2 in range(4)
+        if suit1 != suit2
+    ]
+
+
+def hand_class_combos(hand_class: str) -> List[Combo]:
+    """
+    Combos of one of the 169 starting hand classes
+    Args:
+        hand_class: e.g. "AA", "AKs", "72o"
+    Returns:
+        List of combos (6 for pairs, 4 for suited and 12 for offsuit hands)
+    """
+    high, low = _face_index(hand_class[0]), _face_index(hand_class[1])
+    if high == low:
+        if len(hand_class) != 2:
+            raise ValueError(f"Invalid hand class: {hand_class}")
+        return pair_combos(high)
+    if len(hand_class) != 3 or hand_class[2] not in "so":
+        raise ValueError(f"Invalid hand class: {hand_class}")
+    high, low = max(high, low), min(high, low)
+    if hand_class[2] == "s":
+        return suited_combos(high, low)
+    return offsuit_combos(high, low)
+
+
+def all_combos() -> List[Combo]:
+    """All 1326 two-card combos"""
+    return [_make_combo(c1, c2) for c1 in range(52) for c2 in range(c1)]
+
+
+def _parse_weight(weight: str) -> float:
+    weight = weight.strip()
+    if weight.endswith("%"):
+        value = float(weight[:-1]) / 100
+    else:
+        value = float(weight)
+    if not 0 <= value <= 1:
+        raise ValueError(f"Invalid weight: {weight}. Must be between 0 and 1 (0% and 100%)")
+    return value
+
+
+def _parse_card(card: str) -> int:
+    face, suit = card[0], card[1].upper()
+    if suit not in VALID_CARD_SUITS:
+        raise ValueError(f"Invalid card suit: {card[1]}. Must be one of: {VALID_CARD_SUITS}")
+    return _face_index(face) * 4 + VALID_CARD_SUITS.index(suit)
+
+
+def _non_pair_combos(high: int, low: int, suitedness: str) -> List[Combo]:
+    combos = []
+    if suitedness in ("", "s"):
+        combos.extend(suited_combos(high, low))
+    if suitedness in ("", "o"):
+        combos.extend(offsuit_combos(high, low))
+    return combos
+
+
+def _parse_hand(hand: str) -> List[Combo]:
+    """Parse one range element such as "QQ+", "22-55", "ATs+", "KQo-K9o", "AK" or "AsKs" """
+    if hand.lower() in RANDOM_RANGE_NAMES:
+        return all_combos()
+
+    if "-" in hand:
+        start, end = hand.split("-")
+        start_class, end_class = start.strip(), end.strip()
+        high1, low1 = _face_index(start_class[0]), _face_index(start_class[1])
+        high2, low2 = _face_index(end_class[0]), _face_index(end_class[1])
+        suitedness = start_class[2:]
+        if suitedness != end_class[2:]:
+            raise ValueError(f"Invalid range: {hand}. Both ends must have the same suitedness")
+        if high1 == low1 and high2 == low2 and suitedness == "":
+            return [
+                combo
+                for rank in range(min(high1, high2), max(high1, high2) + 1)
+                for combo in pair_combos(rank)
+            ]
+        if high1 != high2 or high1 == low1 or high2 == low2:
+            raise ValueError(f"Invalid range: {hand}. Kicker ranges need the same top card")
+        return [
+            combo
+            for low in range(min(low1, low2), max(low1, low2) + 1)
+            if low != high1
+            for combo in _non_pair_combos(high1, low, suitedness)
+        ]
+
+    if (
+        len(hand) == 4
+        and hand[1].upper() in VALID_CARD_SUITS
+        and hand[3].upper() in VALID_CARD_SUITS
+    ):
+        card1, card2 = _parse_card(hand[:2]), _parse_card(hand[2:])
+        if card1 == card2:
+            raise ValueError(f"Invalid combo: {hand}. Cards must be different")
+        return [_make_combo(card1, card2)]
+
+    plus = hand.endswith("+")
+    if plus:
+        hand = hand[:-1]
+    if len(hand) not in (2, 3):
+        raise ValueError(f"Invalid hand: {hand}")
+    high, low = _face_index(hand[0]), _face_index(hand[1])
+    suitedness = hand[2:]
+    if suitedness not in ("", "s", "o"):
+        raise ValueError(f"Invalid suitedness: {suitedness}. Must be 's' or 'o'")
+
+    if high == low:
+        if suitedness:
+            raise ValueError(f"Invalid hand: {hand}. Pairs cannot be suited or offsuit")
+        if plus:
+            return [
+                combo
+                for rank in range(high, len(VALID_CARD_FACES))
+                for combo in pair_combos(rank)
+            ]
+        return pair_combos(high)
+
+    high, low = max(high, low), min(high, low)
+    if plus:
+        # Raise the kicker up to one below the top card, e.g. ATs+ is ATs, AJs, AQs, AKs
+        return [
+            combo
+            for kicker in range(low, high)
+            for combo in _non_pair_combos(high, kicker, suitedness)
+        ]
+    return _non_pair_combos(high, low, suitedness)
+
+
+class HandRange:
+    def __init__(self, range_string: str):
+        """
+        Weighted range of starting hands
+        Args:
+            range_string: Comma separated hands with optional weights,
+                e.g. "QQ+, AKs 50%, ATo-AJo:0.25, AsKd, random"
+        """
+        self.range_string = range_string
+        self.combos: Dict[Combo, float] = self._parse(range_string)
+        if not self.combos:
+            raise ValueError(f"Range {range_string} has no combos")
+
+    @staticmethod
+    def _parse(range_string: str) -> Dict[Combo, float]:
+        combos: Dict[Combo, float] = {}
+        for part in range_string.split(","):
+            part = part.strip()
+            if not part:
+                continue
+            weight = 1.0
+            if ":" in part:
+                part, weight_string = part.split(":")
+                weight = _parse_weight(weight_string)
+            elif " " in part:
+                part, weight_string = part.split(None, 1)
+                weight = _parse_weight(weight_string)
+            # Later entries override earlier ones, e.g. "AA-22, 22 50%"
+            for combo in _parse_hand(part.strip()):
+                if weight > 0:
+                    combos[combo] = weight
+                else:
+                    combos.pop(combo, None)
+        return combos
+
+    def get_combos(self, dead_cards: Iterable[int] = ()) -> Dict[Combo, float]:
+        """
+        Weighted combos that don't use any of the dead cards
+        Args:
+            dead_cards: Integer cards already in play, e.g. the community cards
+        Returns:
+            Dict mapping combos to their weight
+        """
+        dead_mask = 0
+        for card in dead_cards:
+            dead_mask |= 1 << card
+        if not dead_mask:
+            return dict(self.combos)
+        return {
+            combo: weight
+            for combo, weight in self.combos.items()
+            if not (dead_mask >> combo[0] & 1 or dead_mask >> combo[1] & 1)
+        }
+
+    def count_combos(self) -> int:
+        return len(self.combos)
+
+    def __len__(self) -> int:
+        return len(self.combos)
+
+    def __str__(self) -> str:
+        return f"HandRange({self.range_string})"
@@ -0,0 +1,176 @@
+from typing import Callable, Dict, List, Optional, Tuple, Union
+import argparse
+import random
+import time
+
+from engine.classes.Player import Player
+from engine.classes.SingleGame import BettingRound, PlayerAction, SingleGame
+from engine.utils.LoggingPolicy import LoggingPolicy
+
+# A policy picks the action (and amount) of the player next to act
+Policy = Callable[[SingleGame, Player], Tuple[PlayerAction, int]]
+
+
+def check_or_call_policy(game: SingleGame, player: Player) -> Tuple[PlayerAction, int]:
+    """Never folds: checks when possible, calls otherwise"""
+    if game.get_amount_to_call(player) == 0:
+        return PlayerAction.CHECK, 0
+    return PlayerAction.CALL, 0
+
+
+class RandomPolicy:
+    def __init__(
+        self,
+        fold_probability: float = 0.2,
+        seed: Optional[int] = None,
+        raise_probability: float = 0.0,
+    ):
+        """
+        Raises the minimum with the given probability when allowed. Otherwise checks
+        when possible, or folds with the given probability and calls.
+        Args:
+            fold_probability: Probability of folding when facing a bet
+            seed: Seed of the policy's random number generator
+            raise_probability: Probability of a minimum raise
+        """
+        if not 0 <= fold_probability <= 1:
+            raise ValueError("Fold probability must be between 0 and 1")
+        if not 0 <= raise_probability <= 1:
+            raise ValueError("Raise probability must be between 0 and 1")
+        self.fold_probability = fold_probability
+        self.raise_probability = raise_probability
+        self.rng = random.Random(seed)
+
+    def __call__(self, game: SingleGame, player: Player) -> Tuple[PlayerAction, int]:
+        legal_actions = game.get_legal_actions()
+        if (
+            self.raise_probability
+            and legal_actions.can_raise
+            and self.rng.random() < self.raise_probability
+        ):
+            return PlayerAction.RAISE, legal_actions.min_raise_to
+        if legal_actions.can_check:
+            return PlayerAction.CHECK, 0
+        if self.rng.random() < self.fold_probability:
+            return PlayerAction.FOLD, 0
+        return PlayerAction.CALL, 0
+
+
+class SimulationResult:
+    def __init__(self, hands: int, seconds: float, net_winnings: Dict[int, int]):
+        self.hands = hands
+        self.seconds = seconds
+        self.net_winnings = net_winnings
+
+    @property
+    def hands_per_second(self) -> float:
+        return self.hands / self.seconds if self.seconds > 0 else float("inf")
+
+    def to_dict(self) -> Dict:
+        return {
+            "hands": self.hands,
+            "seconds": self.seconds,
+            "hands_per_second": self.hands_per_second,
+            "net_winnings": self.net_winnings,
+        }
+
+    def __str__(self) -> str:
+        return str(self.to_dict())
+
+
+class HandSimulator:
+    def __init__(
+        self,
+        players: List[Player],
+        policies: Union[Policy, Dict[int, Policy]] = check_or_call_policy,
+        big_blind_bet: int = 20,
+        reset_stacks: bool = True,
+        rotate_button: bool = True,
+        seed: Optional[int] = None,
+    ):
+        """
+        Headless driver playing full hands of SingleGame between policies. The same
+        SingleGame, players and deck are reused from one hand to the next.
+        Args:
+            players: Players in seat order, the first one posts the small blind
+            policies: One policy for everyone, or a dict mapping player_id to its policy
+            big_blind_bet: Big blind of every hand
+            reset_stacks: Give every player their starting stack back before each hand
+            rotate_button: Move the blinds one seat along after each hand
+            seed: Seed of the deck, so the same policies replay the same hands
+        """
+        if callable(policies):
+            policies = {player.player_id: policies for player in players}
+        missing = [player.player_id for player in players if player.player_id not in policies]
+        if missing:
+            raise ValueError(f"No policy for players: {missing}")
+        self.policies: Dict[int, Policy] = policies
+        self.reset_stacks = reset_stacks
+        self.rotate_button = rotate_button
+        with LoggingPolicy.engine_logs_disabled():
+            self.game = SingleGame(big_blind_bet=big_blind_bet, seed=seed)
+            self.game.register_players(*players)
+
+    def play_hand(self) -> Dict[int, int]:
+        """
+        Play one hand from the blinds to the showdown
+        Returns:
+            Dict mapping player_id to the amount won from the pot
+        """
+        game = self.game
+        if game.current_betting_round != BettingRound.NOTSTARTED:
+            game.start_new_hand(self.rotate_button)
+        if self.reset_stacks:
+            for player in game.all_players:
+                player.current_stack = player.starting_stack
+        game.advance_betting_round()
+        player = game.advance_to_next_decision()
+        while player is not None:
+            action, amount = self.policies[player.player_id](game, player)
+            game.process_player_action(player.player_id, action, amount)
+            player = game.advance_to_next_decision()
+        return game.resolve_winner()
+
+    def run(self, num_hands: int) -> SimulationResult:
+        """
+        Play num_hands hands with engine logging disabled
+        Returns:
+            SimulationResult with the number of hands per second and each player's
+            net winnings over the run
+        """
+        players = self.game.all_players
+        net_winnings = {player.player_id: 0 for player in players}
+        with LoggingPolicy.engine_logs_disabled():
+            start = time.perf_counter()
+            for _ in range(num_hands):
+                stacks_before = {
+                    player.player_id: (
+                        player.starting_stack
+                        if self.reset_stacks
+                        else player.current_stack
+                    )
+                    for player in players
+                }
+                self.play_hand()
+                for player in players:
+                    net_winnings[player.player_id] += (
+                        player.current_stack - stacks_before[player.player_id]
+                    )
+            seconds = time.perf_counter() - start
+        return SimulationResult(num_hands, seconds, net_winnings)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate hands between random policies")
+    parser.add_argument("--hands", type=int, default=10_000)
+    parser.add_argument("--players", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    simulator = HandSimulator(
+        [Player(i, f"Bot {i}") for i in range(1, args.players + 1)],
+        RandomPolicy(seed=args.seed),
+        seed=args.seed,
+    )
+    result = simulator.run(args.hands)
+    print(f"{result.hands} hands in {result.seconds:.2f}s ({result.hands_per_second:.0f} hands/s)")
@@ -0,0 +1,60 @@
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+import sys
+
+from loguru import logger
+
+ENGINE_LOGGER_NAME = "engine"
+DEFAULT_LOG_LEVEL = "INFO"
+
+
+class LoggingPolicy:
+    # loguru has no public way to read whether a module is enabled
+    _engine_logs_enabled = True
+
+    @staticmethod
+    def configure(
+        level: Optional[str] = DEFAULT_LOG_LEVEL, sink: Any = sys.stderr, **handler_kwargs
+    ) -> Optional[int]:
+        """
+        Replace the loguru handlers with a single sink. Engine log calls use lazy,
+        brace-style arguments, so messages below the level are never formatted.
+        Args:
+            level: Minimum level written to the sink, e.g. "DEBUG" or "WARNING".
+                None removes every handler, which makes log calls return immediately.
+            sink: Any loguru sink (stream, file path, callable)
+            handler_kwargs: Passed on to logger.add(), e.g. format or enqueue
+        Returns:
+            Id of the new handler, None when logging is turned off
+        """
+        logger.remove()
+        if level is None:
+            return None
+        return logger.add(sink, level=level, **handler_kwargs)
+
+    @staticmethod
+    def disable_engine_logs():
+        """Drop log messages from engine modules, keeping other handlers untouched"""
+        logger.disable(ENGINE_LOGGER_NAME)
+        LoggingPolicy._engine_logs_enabled = False
+
+    @staticmethod
+    def enable_engine_logs():
+        logger.enable(ENGINE_LOGGER_NAME)
+        LoggingPolicy._engine_logs_enabled = True
+
+    @staticmethod
+    def are_engine_logs_enabled() -> bool:
+        return LoggingPolicy._engine_logs_enabled
+
+    @staticmethod
+    @contextmanager
+    def engine_logs_disabled() -> Iterator[None]:
+        """Disable engine logs for a block, then put back whatever was set before it"""
+        were_enabled = LoggingPolicy._engine_logs_enabled
+        LoggingPolicy.disable_engine_logs()
+        try:
+            yield
+        finally:
+            if were_enabled:
+                LoggingPolicy.enable_engine_logs()
@@ -0,0 +1,183 @@
+from typing import Dict, List, Optional
+import argparse
+import json
+import os
+import random
+
+from engine.utils.HandEvaluator import CARD_KEYS, SUIT_COUNT_BIAS, evaluate_key
+from engine.utils.HandRange import hand_class_combos
+from engine.utils.WinningHandSelector import SHORT_NAME_TO_INT, VALID_CARD_FACES
+
+# Bump when the file layout or the way equities are computed changes
+TABLE_VERSION = 1
+TABLE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "data",
+    f"preflop_equity_v{TABLE_VERSION}.json",
+)
+MIN_PLAYERS = 2
+MAX_PLAYERS = 6
+DEFAULT_BUILD_SAMPLES = 20_000
+DEFAULT_BUILD_SEED = 169
+
+
+def get_hand_classes() -> List[str]:
+    """The 169 starting hand classes, e.g. "AA", "AKs", "AKo", strongest ranks first"""
+    hand_classes = []
+    for high in range(len(VALID_CARD_FACES) - 1, -1, -1):
+        for low in range(high, -1, -1):
+            if high == low:
+                hand_classes.append(VALID_CARD_FACES[high] * 2)
+            else:
+                hand_classes.append(f"{VALID_CARD_FACES[high]}{VALID_CARD_FACES[low]}s")
+                hand_classes.append(f"{VALID_CARD_FACES[high]}{VALID_CARD_FACES[low]}o")
+    return hand_classes
+
+
+def get_hand_class(hole_cards: List[str]) -> str:
+    """
+    Starting hand class of two hole cards
+    Args:
+        hole_cards: Two cards, e.g. ["KD", "AS"]
+    Returns:
+        Hand class, e.g. "AKo"
+    """
+    card1, card2 = (SHORT_NAME_TO_INT[card] for card in hole_cards)
+    high, low = max(card1, card2), min(card1, card2)
+    high_face, low_face = VALID_CARD_FACES[high >> 2], VALID_CARD_FACES[low >> 2]
+    if high_face == low_face:
+        return high_face + low_face
+    return f"{high_face}{low_face}{'s' if high & 3 == low & 3 else 'o'}"
+
+
+def simulate_equity_vs_random(
+    hole_cards: List[int], num_players: int, num_samples: int, rng: random.Random
+) -> float:
+    """
+    Monte Carlo pot equity of two hole cards against num_players - 1 random hands
+    Args:
+        hole_cards: Two integer cards
+        num_players: Players at showdown, including the hero
+        num_samples: Number of deals to sample
+        rng: Random number generator
+    Returns:
+        Share of the pot won on average
+    """
+    rand = rng.random
+    hero_mask = (1 << hole_cards[0]) | (1 << hole_cards[1])
+    hero_key = CARD_KEYS[hole_cards[0]] + CARD_KEYS[hole_cards[1]]
+    num_opponents = num_players - 1
+    equity = 0.0
+    for _ in range(num_samples):
+        dead_mask = hero_mask
+        dealt = []
+        while len(dealt) < 5 + 2 * num_opponents:
+            card = int(rand() * 52)
+            if not dead_mask >> card & 1:
+                dead_mask |= 1 << card
+                dealt.append(card)
+        board = dealt[:5]
+        board_key = SUIT_COUNT_BIAS + sum([CARD_KEYS[card] for card in board])
+        hero_strength = evaluate_key(board_key + hero_key, board + hole_cards)
+        num_tied = 1
+        for i in range(5, len(dealt), 2):
+            opponent = dealt[i : i + 2]
+            strength = evaluate_key(
+                board_key + CARD_KEYS[opponent[0]] + CARD_KEYS[opponent[1]],
+                board + opponent,
+            )
+            if strength > hero_strength:
+                break
+            if strength == hero_strength:
+                num_tied += 1
+        else:
+            equity += 1.0 / num_tied
+    return equity / num_samples
+
+
+def build_table(
+    num_samples: int = DEFAULT_BUILD_SAMPLES, seed: int = DEFAULT_BUILD_SEED
+) -> Dict:
+    """
+    Compute the equity of every hand class against 1 to 5 random hands. Every combo
+    of a class has the same equity against random hands, so one combo is simulated.
+    """
+    rng = random.Random(seed)
+    equities = {}
+    for hand_class in get_hand_classes():
+        hole_cards = list(hand_class_combos(hand_class)[0])
+        equities[hand_class] = {
+            str(num_players): round(
+                simulate_equity_vs_random(hole_cards, num_players, num_samples, rng), 5
+            )
+            for num_players in range(MIN_PLAYERS, MAX_PLAYERS + 1)
+        }
+    return {
+        "version": TABLE_VERSION,
+        "num_samples": num_samples,
+        "seed": seed,
+        "equities": equities,
+    }
+
+
+class PreflopEquityTable:
+    _table: Optional[Dict] = None
+
+    @staticmethod
+    def _load() -> Dict:
+        """Load the table from disk on first use"""
+        if PreflopEquityTable._table is None:
+            if not os.path.exists(TABLE_PATH):
+                raise FileNotFoundError(
+                    f"Preflop equity table not found at {TABLE_PATH}. "
+                    + "Build it with `make preflop_equity_table`."
+                )
+            with open(TABLE_PATH) as f:
+                table = json.load(f)
+            if table.get("version") != TABLE_VERSION:
+                raise ValueError(
+                    f"Preflop equity table version {table.get('version')} does not match "
+                    + f"{TABLE_VERSION}. Rebuild it with `make preflop_equity_table`."
+                )
+            PreflopEquityTable._table = table
+        return PreflopEquityTable._table
+
+    @staticmethod
+    def get_equity(hand_class: str, num_players: int = 2) -> float:
+        """
+        Pot equity of a starting hand class against random hands
+        Args:
+            hand_class: e.g. "AA", "AKs", "72o"
+            num_players: Players at showdown, including the hero (2 to 6)
+        Returns:
+            Share of the pot won on average
+        """
+        if not MIN_PLAYERS <= num_players <= MAX_PLAYERS:
+            raise ValueError(
+                f"Number of players must be between {MIN_PLAYERS} and {MAX_PLAYERS}"
+            )
+        equities = PreflopEquityTable._load()["equities"]
+        if hand_class not in equities:
+            raise ValueError(f"Invalid hand class: {hand_class}")
+        return equities[hand_class][str(num_players)]
+
+    @staticmethod
+    def get_hand_equity(hole_cards: List[str], num_players: int = 2) -> float:
+        """Same as get_equity() for two hole cards, e.g. ["AS", "KD"]"""
+        return PreflopEquityTable.get_equity(get_hand_class(hole_cards), num_players)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Build the preflop equity table of the 169 starting hand classes"
+    )
+    parser.add_argument("--samples", type=int, default=DEFAULT_BUILD_SAMPLES)
+    parser.add_argument("--seed", type=int, default=DEFAULT_BUILD_SEED)
+    parser.add_argument("--output", default=TABLE_PATH)
+    args = parser.parse_args()
+
+    table = build_table(args.samples, args.seed)
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(table, f, indent=1, sort_keys=True)
+        f.write("\n")
@@ -0,0 +1,422 @@
+from typing import Dict, List, Optional, Tuple, Union
+import functools
+import itertools
+import math
+import random
+from statistics import NormalDist
+
+from engine.utils.HandEvaluator import CARD_KEYS, SUIT_COUNT_BIAS, evaluate_key
+from engine.utils.HandRange import Combo, HandRange
+from engine.utils.WinningHandSelector import (
+    SHORT_NAME_TO_INT,
+    VALID_CARD_FACES,
+    VALID_CARD_SUITS,
+)
+from engine.utils.WinningHandProbability import (
+    DEFAULT_CONFIDENCE_LEVEL,
+    DEFAULT_NUM_SAMPLES,
+    _pot_units,
+)
+
+# Heads-up queries enumerate every runout when runouts x combos is at most this,
+# multiway queries and larger heads-up queries are sampled
+DEFAULT_MAX_EXACT_EVALUATIONS = 1_000_000
+# Sampling gives up after this many deals redealt on conflicting cards
+MAX_REJECTED_DEALS = 1_000_000
+
+
+@functools.lru_cache(maxsize=1024)
+def get_hand_range(range_string: str) -> HandRange:
+    """Parse a range string, reusing the parsed HandRange for repeated queries"""
+    return HandRange(range_string)
+
+
+def combo_to_string(combo: Combo) -> str:
+    return "".join(
+        f"{VALID_CARD_FACES[card >> 2]}{VALID_CARD_SUITS[card & 3].lower()}"
+        for card in combo
+    )
+
+
+class RangeEquityResult:
+    def __init__(
+        self,
+        win: float,
+        tie: float,
+        equity: float,
+        std_error: float,
+        matchups: int,
+        is_exact: bool,
+        confidence_level: float,
+        combo_equities: Dict[str, float],
+    ):
+        """
+        Equity of one range against the other ranges
+        Args:
+            win: Weighted probability of winning outright
+            tie: Weighted probability of splitting the pot
+            equity: Weighted share of the pot won
+            std_error: Standard error of the equity, 0 when exact
+            matchups: Combo vs combo (vs ...) runouts enumerated or sampled
+            is_exact: Whether every matchup and runout was enumerated
+            confidence_level: Confidence level of the confidence interval
+            combo_equities: Equity of each combo of the range, e.g. {"AsKs": 0.61}
+        """
+        self.win = win
+        self.tie = tie
+        self.lose = 1.0 - win - tie
+        self.equity = equity
+        self.std_error = std_error
+        self.matchups = matchups
+        self.is_exact = is_exact
+        self.confidence_level = confidence_level
+        z = NormalDist().inv_cdf((1 + confidence_level) / 2)
+        self.confidence_interval: Tuple[float, float] = (
+            max(0.0, equity - z * std_error),
+            min(1.0, equity + z * std_error),
+        )
+        self.combo_equities = combo_equities
+
+    def __str__(self) -> str:
+        return str(self.to_dict())
+
+    def to_dict(self):
+        return {
+            "win": self.win,
+            "tie": self.tie,
+            "lose": self.lose,
+            "equity": self.equity,
+            "std_error": self.std_error,
+            "confidence_interval": self.confidence_interval,
+            "confidence_level": self.confidence_level,
+            "matchups": self.matchups,
+            "is_exact": self.is_exact,
+        }
+
+
+def _combo_strengths(
+    combos: List[Tuple[Combo, float]], board: List[int], board_key: int, dead_mask: int
+) -> List[Tuple[int, int, float]]:
+    """(strength, combo index, weight) of every combo not blocked by dead cards, weakest first"""
+    strengths = []
+    for i, (combo, weight) in enumerate(combos):
+        card1, card2 = combo
+        if dead_mask >> card1 & 1 or dead_mask >> card2 & 1:
+            continue
+        key = board_key + CARD_KEYS[card1] + CARD_KEYS[card2]
+        strengths.append((evaluate_key(key, board + [card1, card2]), i, weight))
+    strengths.sort()
+    return strengths
+
+
+def _sweep(
+    hero: List[Tuple[int, int, float]],
+    hero_combos: List[Tuple[Combo, float]],
+    villain: List[Tuple[int, int, float]],
+    villain_combos: List[Tuple[Combo, float]],
+    villain_weight_by_combo: Dict[Combo, float],
+    totals: List[List[float]],
+):
+    """
+    For every hero combo, add the villain weight it beats, ties and faces on one board.
+    Villain combos sharing a card with the hero combo are removed by inclusion-exclusion
+    on per-card weight sums, so each board costs O(hero + villain) after sorting.
+    """
+    beats, ties, faced = totals
+    total_weight = 0.0
+    card_weight = [0.0] * 52
+    for _, j, weight in villain:
+        card1, card2 = villain_combos[j][0]
+        total_weight += weight
+        card_weight[card1] += weight
+        card_weight[card2] += weight
+
+    num_villain = len(villain)
+    below = below_or_equal = 0
+    below_weight = below_or_equal_weight = 0.0
+    below_card_weight = [0.0] * 52
+    below_or_equal_card_weight = [0.0] * 52
+    for strength, i, _ in hero:
+        while below < num_villain and villain[below][0] < strength:
+            _, j, weight = villain[below]
+            card1, card2 = villain_combos[j][0]
+            below_weight += weight
+            below_card_weight[card1] += weight
+            below_card_weight[card2] += weight
+            below += 1
+        while below_or_equal < num_villain and villain[below_or_equal][0] <= strength:
+            _, j, weight = villain[below_or_equal]
+            card1, card2 = villain_combos[j][0]
+            below_or_equal_weight += weight
+            below_or_equal_card_weight[card1] += weight
+            below_or_equal_card_weight[card2] += weight
+            below_or_equal += 1
+
+        combo = hero_combos[i][0]
+        card1, card2 = combo
+        # The same combo in the villain range is counted in both per-card sums, add it
+        # back once. It always has the hero's strength, so it is never strictly below.
+        same_combo_weight = villain_weight_by_combo.get(combo, 0.0)
+        beaten = below_weight - below_card_weight[card1] - below_card_weight[card2]
+        beaten_or_tied = (
+            below_or_equal_weight
+            - below_or_equal_card_weight[card1]
+            - below_or_equal_card_weight[card2]
+            + same_combo_weight
+        )
+        beats[i] += beaten
+        ties[i] += beaten_or_tied - beaten
+        faced[i] += (
+            total_weight - card_weight[card1] - card_weight[card2] + same_combo_weight
+        )
+
+
+def _has_deal_without_shared_cards(combo_lists: List[List[Combo]], dead_mask: int) -> bool:
+    """Whether one combo per range can be dealt without two ranges sharing a card"""
+    if not combo_lists:
+        return True
+    for combo in combo_lists[0]:
+        combo_mask = (1 << combo[0]) | (1 << combo[1])
+        if not dead_mask & combo_mask and _has_deal_without_shared_cards(
+            combo_lists[1:], dead_mask | combo_mask
+        ):
+            return True
+    return False
+
+
+class RangeEquity:
+    def __init__(
+        self,
+        player_ranges: Dict[str, Union[str, HandRange]],
+        community_cards: List[str],
+        num_samples: int = DEFAULT_NUM_SAMPLES,
+        max_exact_evaluations: int = DEFAULT_MAX_EXACT_EVALUATIONS,
+        confidence_level: float = DEFAULT_CONFIDENCE_LEVEL,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize the range vs range equity calculator
+        Args:
+            player_ranges: Dict mapping player names to a HandRange or range string,
+                e.g. {"Hero": "QQ+, AKs 50%", "Villain": "random"}
+            community_cards: List of community cards (flop, turn, river), e.g. ["AS", "KD", "2C"]
+            num_samples: Number of Monte Carlo samples when not enumerating exactly
+            max_exact_evaluations: Enumerate heads-up queries when runouts x combos is at most this
+            confidence_level: Confidence level of the Monte Carlo confidence intervals
+            seed: Seed for Monte Carlo sampling, for reproducible results
+        """
+        if len(player_ranges) < 2:
+            raise ValueError("At least 2 ranges are needed to calculate equity")
+        if len(community_cards) not in [0, 3, 4, 5]:
+            raise ValueError("Number of community cards must be 0, 3, 4, or 5")
+        if len(set(community_cards)) != len(community_cards):
+            raise ValueError("Duplicate cards found in the game")
+        if num_samples <= 0:
+            raise ValueError("Number of samples must be greater than 0")
+        self.player_names: List[str] = list(player_ranges.keys())
+        self.board: List[int] = []
+        for card in community_cards:
+            if card not in SHORT_NAME_TO_INT:
+                raise ValueError(f"Invalid card: {card}")
+            self.board.append(SHORT_NAME_TO_INT[card])
+        self.hand_ranges: List[HandRange] = [
+            get_hand_range(hand_range) if isinstance(hand_range, str) else hand_range
+            for hand_range in player_ranges.values()
+        ]
+        # Combos blocked by the board can never be dealt
+        self.combos: List[List[Tuple[Combo, float]]] = [
+            list(hand_range.get_combos(self.board).items())
+            for hand_range in self.hand_ranges
+        ]
+        for player, combos in zip(self.player_names, self.combos):
+            if not combos:
+                raise ValueError(f"Range of player {player} is blocked by the board")
+        self.num_samples = num_samples
+        self.max_exact_evaluations = max_exact_evaluations
+        self.confidence_level = confidence_level
+        self.rng = random.Random(seed)
+        self._results: Optional[Dict[str, RangeEquityResult]] = None
+
+    def count_runouts(self) -> int:
+        """Number of ways to complete the board, ignoring hole cards"""
+        return math.comb(52 - len(self.board), 5 - len(self.board))
+
+    def is_exact(self) -> bool:
+        """Whether equities are computed by enumerating every matchup and runout"""
+        if len(self.combos) != 2:
+            return False
+        num_combos = sum(len(combos) for combos in self.combos)
+        return self.count_runouts() * num_combos <= self.max_exact_evaluations
+
+    def calculate_equities(self) -> Dict[str, RangeEquityResult]:
+        """
+        Calculate equity of every range against the others
+        Returns:
+            Dict mapping player names to their RangeEquityResult
+        """
+        if self._results is None:
+            if self.is_exact():
+                self._results = self._calculate_heads_up_exact()
+            else:
+                self._results = self._calculate_monte_carlo()
+        return self._results
+
+    def calculate_equity(self, player_name: str) -> RangeEquityResult:
+        if player_name not in self.player_names:
+            raise ValueError(f"Player {player_name} not found in player ranges")
+        return self.calculate_equities()[player_name]
+
+    def _calculate_heads_up_exact(self) -> Dict[str, RangeEquityResult]:
+        combos_a, combos_b = self.combos
+        weight_by_combo_a, weight_by_combo_b = dict(combos_a), dict(combos_b)
+        totals_a = [[0.0] * len(combos_a) for _ in range(3)]
+        totals_b = [[0.0] * len(combos_b) for _ in range(3)]
+        deck = [card for card in range(52) if card not in self.board]
+        board_key = SUIT_COUNT_BIAS + sum([CARD_KEYS[card] for card in self.board])
+
+        num_runouts = 0
+        for runout in itertools.combinations(deck, 5 - len(self.board)):
+            num_runouts += 1
+            full_board = self.board + list(runout)
+            dead_mask = 0
+            runout_key = board_key
+            for card in runout:
+                dead_mask |= 1 << card
+                runout_key += CARD_KEYS[card]
+            # Each combo is evaluated once per runout and reused for all its matchups
+            strengths_a = _combo_strengths(combos_a, full_board, runout_key, dead_mask)
+            strengths_b = _combo_strengths(combos_b, full_board, runout_key, dead_mask)
+            _sweep(strengths_a, combos_a, strengths_b, combos_b, weight_by_combo_b, totals_a)
+            _sweep(strengths_b, combos_b, strengths_a, combos_a, weight_by_combo_a, totals_b)
+
+        return {
+            self.player_names[0]: self._exact_result(combos_a, totals_a, num_runouts),
+            self.player_names[1]: self._exact_result(combos_b, totals_b, num_runouts),
+        }
+
+    def _exact_result(
+        self, combos: List[Tuple[Combo, float]], totals: List[List[float]], num_runouts: int
+    ) -> RangeEquityResult:
+        beats, ties, faced = totals
+        weighted_beats = weighted_ties = weighted_faced = 0.0
+        combo_equities = {}
+        for i, (combo, weight) in enumerate(combos):
+            if faced[i] > 0:
+                combo_equities[combo_to_string(combo)] = (
+                    beats[i] + ties[i] / 2
+                ) / faced[i]
+            weighted_beats += weight * beats[i]
+            weighted_ties += weight * ties[i]
+            weighted_faced += weight * faced[i]
+        if weighted_faced == 0:
+            raise ValueError("Ranges have no matchup without shared cards")
+        win = weighted_beats / weighted_faced
+        tie = weighted_ties / weighted_faced
+        return RangeEquityResult(
+            win,
+            tie,
+            win + tie / 2,
+            0.0,
+            num_runouts,
+            True,
+            self.confidence_level,
+            combo_equities,
+        )
+
+    def _calculate_monte_carlo(self) -> Dict[str, RangeEquityResult]:
+        num_players = len(self.combos)
+        pot_units = _pot_units(num_players)
+        choices = self.rng.choices
+        rand = self.rng.random
+        combo_lists = [[combo for combo, _ in combos] for combos in self.combos]
+        cum_weights = [
+            list(itertools.accumulate(weight for _, weight in combos))
+            for combos in self.combos
+        ]
+        board_mask = 0
+        for card in self.board:
+            board_mask |= 1 << card
+        board_key = SUIT_COUNT_BIAS + sum([CARD_KEYS[card] for card in self.board])
+        num_runout_cards = 5 - len(self.board)
+        if not _has_deal_without_shared_cards(sorted(combo_lists, key=len), board_mask):
+            raise ValueError("Ranges have no matchup without shared cards")
+
+        wins = [0] * num_players
+        ties = [0] * num_players
+        pot_units_won = [0] * num_players
+        pot_units_won_squared = [0] * num_players
+        combo_pot_units: List[Dict[Combo, List[int]]] = [{} for _ in range(num_players)]
+
+        num_samples = 0
+        num_rejected = 0
+        while num_samples < self.num_samples:
+            # Deal one combo per range by weight, redealing on conflicting cards
+            dealt = []
+            dead_mask = board_mask
+            for combos, cum in zip(combo_lists, cum_weights):
+                combo = choices(combos, cum_weights=cum)[0]
+                combo_mask = (1 << combo[0]) | (1 << combo[1])
+                if dead_mask & combo_mask:
+                    break
+                dead_mask |= combo_mask
+                dealt.append(combo)
+            if len(dealt) != num_players:
+                num_rejected += 1
+                if num_rejected > MAX_REJECTED_DEALS:
+                    raise ValueError(
+                        f"Ranges shared cards in over {MAX_REJECTED_DEALS} deals, "
+                        + "too few matchups to sample"
+                    )
+                continue
+            num_samples += 1
+
+            runout = []
+            while len(runout) < num_runout_cards:
+                card = int(rand() * 52)
+                if not dead_mask >> card & 1:
+                    dead_mask |= 1 << card
+                    runout.append(card)
+            full_board = self.board + runout
+            runout_key = board_key + sum([CARD_KEYS[card] for card in runout])
+            strengths = [
+                evaluate_key(
+                    runout_key + CARD_KEYS[combo[0]] + CARD_KEYS[combo[1]],
+                    full_board + list(combo),
+                )
+                for combo in dealt
+            ]
+            best = max(strengths)
+            num_winners = strengths.count(best)
+            share = pot_units // num_winners
+            for i, combo in enumerate(dealt):
+                won = share if strengths[i] == best else 0
+                if won and num_winners == 1:
+                    wins[i] += 1
+                elif won:
+                    ties[i] += 1
+                pot_units_won[i] += won
+                pot_units_won_squared[i] += won * won
+                combo_totals = combo_pot_units[i].setdefault(combo, [0, 0])
+                combo_totals[0] += won
+                combo_totals[1] += 1
+
+        results = {}
+        for i, player in enumerate(self.player_names):
+            equity = pot_units_won[i] / pot_units / num_samples
+            variance = (
+                pot_units_won_squared[i] / pot_units**2 - num_samples * equity**2
+            ) / max(num_samples - 1, 1)
+            results[player] = RangeEquityResult(
+                wins[i] / num_samples,
+                ties[i] / num_samples,
+                equity,
+                math.sqrt(max(variance, 0.0) / num_samples),
+                num_samples,
+                False,
+                self.confidence_level,
+                {
+                    combo_to_string(combo): units / pot_units / count
+                    for combo, (units, count) in combo_pot_units[i].items()
+                },
+            )
+        return results
@@ -1,76 +1,453 @@
-from typing import List, Dict, Set
+from typing import List, Dict, Optional, Tuple
 import itertools
-from constants.constants import VALID_CARDS
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+from engine.utils.HandEvaluator import (
+    CARD_KEYS,
+    CARD_RANK_BITS,
+    CATEGORY_SHIFT,
+    FLUSH_BIT_TO_SUIT,
+    FLUSH_CHECK_MASK,
+    FLUSH_TABLE,
+    RANK_TABLE,
+    SUIT_BITS,
+    SUIT_COUNT_BIAS,
+    HandRank,
+)
+from engine.utils.WinningHandSelector import SHORT_NAME_TO_INT, WinningHandSelector
+from engine.utils.PreflopEquityTable import PreflopEquityTable
+from loguru import logger
+
+# Enumerate every runout when there are at most this many, sample otherwise.
+# Flop and later always enumerate (at most C(50, 2) = 1225 runouts), preflop samples.
+DEFAULT_MAX_EXACT_RUNOUTS = 100_000
+# With a process pool every query is enumerated, the most runouts being heads-up
+# preflop: C(48, 5) = 1,712,304
+DEFAULT_MAX_EXACT_RUNOUTS_IN_PROCESSES = 2_000_000
+DEFAULT_NUM_SAMPLES = 10_000
+DEFAULT_CONFIDENCE_LEVEL = 0.95
+
+HAND_TYPE_NAMES = {
+    HandRank.ROYAL_FLUSH: "Royal Flush",
+    HandRank.STRAIGHT_FLUSH: "Straight Flush",
+    HandRank.FOUR_OF_A_KIND: "Four of a Kind",
+    HandRank.FULL_HOUSE: "Full House",
+    HandRank.FLUSH: "Flush",
+    HandRank.STRAIGHT: "Straight",
+    HandRank.THREE_OF_A_KIND: "Three of a Kind",
+    HandRank.TWO_PAIR: "Two Pair",
+    HandRank.PAIR: "One Pair",
+    HandRank.HIGH_CARD: "High Card",
+}
+# Hand type counts per player are indexed by HandRank.value (1-10)
+HAND_TYPE_SLOTS = len(HandRank) + 1
+
+
+class EquityResult:
+    def __init__(
+        self,
+        wins: int,
+        ties: int,
+        equity_share: float,
+        equity_share_squared: float,
+        runouts: int,
+        is_exact: bool,
+        confidence_level: float,
+    ):
+        """
+        Equity of one player over a set of runouts
+        Args:
+            wins: Runouts won outright
+            ties: Runouts where the pot was split
+            equity_share: Sum over runouts of the fraction of the pot won
+            equity_share_squared: Sum over runouts of the squared fraction of the pot won
+            runouts: Number of runouts enumerated or sampled
+            is_exact: Whether every runout was enumerated
+            confidence_level: Confidence level of the confidence interval
+        """
+        self.runouts = runouts
+        self.is_exact = is_exact
+        self.win = wins / runouts
+        self.tie = ties / runouts
+        self.lose = 1.0 - self.win - self.tie
+        self.equity = equity_share / runouts
+        self.confidence_level = confidence_level
+        if is_exact or runouts < 2:
+            self.std_error = 0.0
+        else:
+            variance = (equity_share_squared - runouts * self.equity**2) / (runouts - 1)
+            self.std_error = math.sqrt(max(variance, 0.0) / runouts)
+        z = NormalDist().inv_cdf((1 + confidence_level) / 2)
+        self.confidence_interval: Tuple[float, float] = (
+            max(0.0, self.equity - z * self.std_error),
+            min(1.0, self.equity + z * self.std_error),
+        )
+
+    def __str__(self) -> str:
+        return str(self.to_dict())
+
+    def to_dict(self):
+        return {
+            "win": self.win,
+            "tie": self.tie,
+            "lose": self.lose,
+            "equity": self.equity,
+            "std_error": self.std_error,
+            "confidence_interval": self.confidence_interval,
+            "confidence_level": self.confidence_level,
+            "runouts": self.runouts,
+            "is_exact": self.is_exact,
+        }
+
+
+# Added to a board key (which has SUIT_COUNT_BIAS), sets bit 3 of a suit nibble
+# once the board holds 3 or more cards of that suit
+BOARD_FLUSH_DRAW_BIAS = 0x2222
+
+
+def _strength_with_flush(
+    key: int, hole: List[int], community_cards: List[int], runout
+) -> int:
+    flush_bits = key & FLUSH_CHECK_MASK
+    if not flush_bits:
+        return RANK_TABLE[key >> SUIT_BITS]
+    suit = FLUSH_BIT_TO_SUIT[flush_bits]
+    rank_mask = 0
+    for card in itertools.chain(hole, community_cards, runout):
+        if card & 3 == suit:
+            rank_mask |= CARD_RANK_BITS[card]
+    return FLUSH_TABLE[rank_mask]
+
+
+def _sample_runouts(
+    rng: random.Random, remaining_cards: List[int], num_cards: int, num_samples: int
+):
+    """Yield num_samples random runouts of num_cards distinct cards each"""
+    # Rejection sampling is much cheaper than random.sample() for 5 cards out of ~45
+    rand = rng.random
+    num_remaining = len(remaining_cards)
+    for _ in range(num_samples):
+        runout = []
+        while len(runout) < num_cards:
+            card = remaining_cards[int(rand() * num_remaining)]
+            if card not in runout:
+                runout.append(card)
+        yield runout
+
+
+def _pot_units(num_players: int) -> int:
+    """
+    Pot size in integer units that split evenly between any number of winners,
+    so tallies are exact integers and merge identically in any order
+    """
+    return math.lcm(*range(1, num_players + 1))
+
+
+def _new_tallies(num_players: int) -> List[List[int]]:
+    """
+    wins, ties, pot units won and squared pot units won per player, and the count of
+    each final hand type per player at index player * HAND_TYPE_SLOTS + HandRank.value
+    """
+    return [[0] * num_players for _ in range(4)] + [[0] * num_players * HAND_TYPE_SLOTS]
+
+
+def _tally_runouts_shard(
+    args: Tuple[List[List[int]], List[int], List[int], int, int, bool]
+) -> Tuple[List[List[int]], int]:
+    """
+    Tally the runouts whose lowest card is remaining_cards[first_card_index].
+    Module level so that it can be sent to worker processes.
+    """
+    (
+        hole_cards,
+        community_cards,
+        remaining_cards,
+        num_cards,
+        first_card_index,
+        count_hand_types,
+    ) = args
+    first_card = remaining_cards[first_card_index]
+    runouts = (
+        (first_card,) + rest
+        for rest in itertools.combinations(
+            remaining_cards[first_card_index + 1 :], num_cards - 1
+        )
+    )
+    tallies = _new_tallies(len(hole_cards))
+    num_runouts = _tally_runouts(
+        hole_cards, community_cards, runouts, tallies, count_hand_types
+    )
+    return tallies, num_runouts
+
+
+def _merge_tallies(tallies: List[List[int]], other: List[List[int]]):
+    for totals, other_totals in zip(tallies, other):
+        for i, value in enumerate(other_totals):
+            totals[i] += value
+
+
+def _tally_runouts(
+    hole_cards: List[List[int]],
+    community_cards: List[int],
+    runouts,
+    tallies: List[List[int]],
+    count_hand_types: bool = False,
+) -> int:
+    """
+    Showdown every runout and add the results to tallies
+    Args:
+        hole_cards: Integer hole cards per player
+        community_cards: Integer community cards already dealt
+        runouts: Iterable of tuples of integer cards completing the board
+        tallies: Output of _new_tallies(), updated in place
+        count_hand_types: Also count every player's final hand type, which only
+            calculate_hand_type_probability() needs
+    Returns:
+        Number of runouts tallied
+    """
+    wins, ties, pot_units_won, pot_units_won_squared, hand_type_counts = tallies
+    num_players = len(hole_cards)
+    community_key = SUIT_COUNT_BIAS + sum([CARD_KEYS[c] for c in community_cards])
+    hole_keys = [CARD_KEYS[a] + CARD_KEYS[b] for a, b in hole_cards]
+    pot_units = _pot_units(num_players)
+    share_by_num_winners = [0] + [pot_units // n for n in range(1, num_players + 1)]
+    rank_table = RANK_TABLE
+
+    count = 0
+    for runout in runouts:
+        count += 1
+        board_key = community_key
+        for card in runout:
+            board_key += CARD_KEYS[card]
+        if (board_key + BOARD_FLUSH_DRAW_BIAS) & FLUSH_CHECK_MASK:
+            # 3+ board cards of a suit, some player may hold a flush
+            strengths = [
+                _strength_with_flush(
+                    board_key + hole_key, hole, community_cards, runout
+                )
+                for hole_key, hole in zip(hole_keys, hole_cards)
+            ]
+        else:
+            strengths = [
+                rank_table[(board_key + hole_key) >> SUIT_BITS]
+                for hole_key in hole_keys
+            ]
+        if count_hand_types:
+            hand_type_index = 0
+            for strength in strengths:
+                hand_type_counts[hand_type_index + (strength >> CATEGORY_SHIFT)] += 1
+                hand_type_index += HAND_TYPE_SLOTS
+        best = max(strengths)
+        num_winners = strengths.count(best)
+        if num_winners == 1:
+            winner = strengths.index(best)
+            wins[winner] += 1
+            pot_units_won[winner] += pot_units
+            pot_units_won_squared[winner] += pot_units * pot_units
+        else:
+            share = share_by_num_winners[num_winners]
+            for winner in range(num_players):
+                if strengths[winner] == best:
+                    ties[winner] += 1
+                    pot_units_won[winner] += share
+                    pot_units_won_squared[winner] += share * share
+    return count
 
 
 class WinningHandProbability:
-    def __init__(self, player_hands: Dict[str, List[str]], community_cards: List[str]):
+    def __init__(
+        self,
+        player_hands: Dict[str, List[str]],
+        community_cards: List[str],
+        num_samples: int = DEFAULT_NUM_SAMPLES,
+        max_exact_runouts: Optional[int] = None,
+        confidence_level: float = DEFAULT_CONFIDENCE_LEVEL,
+        seed: Optional[int] = None,
+        processes: int = 1,
+    ):
         """
         Initialize the probability calculator
         Args:
-            player_hands: Dict mapping player names to their hole cards
+            player_hands: Dict mapping player names to their hole cards, e.g. ["AS", "KD"]
             community_cards: List of community cards (flop, turn, river)
+            num_samples: Number of Monte Carlo runouts when not enumerating exactly
+            max_exact_runouts: Enumerate all runouts when there are at most this many.
+                Defaults to DEFAULT_MAX_EXACT_RUNOUTS in a single process and to
+                DEFAULT_MAX_EXACT_RUNOUTS_IN_PROCESSES, which covers preflop, with
+                processes > 1.
+            confidence_level: Confidence level of the Monte Carlo confidence intervals
+            seed: Seed for Monte Carlo sampling, for reproducible results
+            processes: Worker processes used to enumerate runouts exactly. Monte Carlo
+                sampling always runs in the calling process, a query with more runouts
+                than max_exact_runouts logs a warning that the pool is not used.
         """
+        WinningHandSelector.validate_hands(player_hands, community_cards)
+        if num_samples <= 0:
+            raise ValueError("Number of samples must be greater than 0")
+        if not 0 < confidence_level < 1:
+            raise ValueError("Confidence level must be between 0 and 1")
+        if processes < 1:
+            raise ValueError("Number of processes must be at least 1")
         self.player_hands = player_hands
         self.community_cards = community_cards
+        self.num_samples = num_samples
+        if max_exact_runouts is None:
+            max_exact_runouts = (
+                DEFAULT_MAX_EXACT_RUNOUTS
+                if processes == 1
+                else DEFAULT_MAX_EXACT_RUNOUTS_IN_PROCESSES
+            )
+        self.max_exact_runouts = max_exact_runouts
+        self.confidence_level = confidence_level
+        self.rng = random.Random(seed)
+        # Every pass samples the same runouts, so hand types counted in a later pass
+        # match the equities
+        self._sampling_state = self.rng.getstate()
+        self.processes = processes
+        self.player_names: List[str] = list(player_hands.keys())
+        self.hole_cards: List[List[int]] = [
+            [SHORT_NAME_TO_INT[card] for card in player_hands[player]]
+            for player in self.player_names
+        ]
+        self.board: List[int] = [SHORT_NAME_TO_INT[card] for card in community_cards]
         self.remaining_cards = self._get_remaining_cards()
+        self._equities: Optional[Dict[str, EquityResult]] = None
+        self._hand_type_counts: Optional[Dict[str, List[int]]] = None
+        self._num_runouts = 0
 
-    def _get_remaining_cards(self) -> Set[str]:
+    def _get_remaining_cards(self) -> List[int]:
         """
         Calculate which cards are still available in the deck
         Returns:
-            Set of cards that haven't been dealt
+            Sorted list of integer cards that haven't been dealt
         """
-        used_cards = set()
-        # Add all player hole cards
-        for cards in self.player_hands.values():
+        used_cards = set(self.board)
+        for cards in self.hole_cards:
             used_cards.update(cards)
-        # Add community cards
-        used_cards.update(self.community_cards)
-        # Return remaining cards
-        return VALID_CARDS - used_cards
+        return [card for card in range(52) if card not in used_cards]
 
-    def calculate_win_probability(self, player_name: str) -> float:
+    def count_runouts(self) -> int:
+        """Number of distinct ways to complete the board"""
+        return math.comb(len(self.remaining_cards), 5 - len(self.board))
+
+    def is_exact(self) -> bool:
+        """Whether equities are computed by enumerating every runout"""
+        return self.count_runouts() <= self.max_exact_runouts
+
+    def calculate_equities(self) -> Dict[str, EquityResult]:
         """
-        Calculate the probability of a specific player winning
-        Args:
-            player_name: Name of the player to calculate for
+        Calculate win/tie/lose equity for all players in a single pass over the runouts
         Returns:
-            Float between 0 and 1 representing win probability
+            Dict mapping player names to their EquityResult
         """
-        if player_name not in self.player_hands:
-            raise ValueError(f"Player {player_name} not found in player hands")
+        if self._equities is None:
+            self._tally(count_hand_types=False)
+        return self._equities
 
-        remaining_cards_needed = 5 - len(self.community_cards)
-        if remaining_cards_needed == 0:
-            return 1.0 if self._is_winner(player_name) else 0.0
+    def _tally(self, count_hand_types: bool):
+        """Pass over the runouts that sets the equities, and the hand type counts if asked"""
+        remaining_cards_needed = 5 - len(self.board)
+        tallies = _new_tallies(len(self.player_names))
+        is_exact = self.is_exact()
+        if not is_exact and self.processes > 1:
+            logger.warning(
+                "{} runouts is over max_exact_runouts={}, sampling in a single process "
+                + "instead of using {} processes",
+                self.count_runouts(),
+                self.max_exact_runouts,
+                self.processes,
+            )
+        if is_exact and self.processes > 1 and remaining_cards_needed > 0:
+            num_runouts = self._tally_exact_runouts_in_processes(tallies, count_hand_types)
+        else:
+            if is_exact:
+                runouts = itertools.combinations(
+                    self.remaining_cards, remaining_cards_needed
+                )
+            else:
+                self.rng.setstate(self._sampling_state)
+                runouts = _sample_runouts(
+                    self.rng, self.remaining_cards, remaining_cards_needed, self.num_samples
+                )
+            num_runouts = _tally_runouts(
+                self.hole_cards, self.board, runouts, tallies, count_hand_types
+            )
 
-        total_scenarios = 0
-        winning_scenarios = 0
+        wins, ties, pot_units_won, pot_units_won_squared, hand_type_counts = tallies
+        if count_hand_types:
+            self._hand_type_counts = {
+                player: hand_type_counts[i * HAND_TYPE_SLOTS : (i + 1) * HAND_TYPE_SLOTS]
+                for i, player in enumerate(self.player_names)
+            }
+        self._num_runouts = num_runouts
+        pot_units = _pot_units(len(self.player_names))
+        self._equities = {
+            player: EquityResult(
+                wins[i],
+                ties[i],
+                pot_units_won[i] / pot_units,
+                pot_units_won_squared[i] / pot_units**2,
+                num_runouts,
+                is_exact,
+                self.confidence_level,
+            )
+            for i, player in enumerate(self.player_names)
+        }
 
-        # Generate all possible combinations of remaining community cards
-        for cards in itertools.combinations(
-            self.remaining_cards, remaining_cards_needed
-        ):
-            total_scenarios += 1
-            simulated_community = self.community_cards + list(cards)
-            if self._is_winner(player_name, simulated_community):
-                winning_scenarios += 1
+    def _tally_exact_runouts_in_processes(
+        self, tallies: List[List[int]], count_hand_types: bool
+    ) -> int:
+        """
+        Enumerate all runouts in a process pool. Runouts are sharded by their lowest
+        card, each shard is tallied in exact integers and shards are merged in order,
+        so the result is bit-identical to enumerating in a single process.
+        """
+        remaining_cards_needed = 5 - len(self.board)
+        num_shards = len(self.remaining_cards) - remaining_cards_needed + 1
+        shard_args = [
+            (
+                self.hole_cards,
+                self.board,
+                self.remaining_cards,
+                remaining_cards_needed,
+                first_card_index,
+                count_hand_types,
+            )
+            for first_card_index in range(num_shards)
+        ]
+        num_runouts = 0
+        with ProcessPoolExecutor(max_workers=self.processes) as executor:
+            for shard_tallies, shard_runouts in executor.map(
+                _tally_runouts_shard, shard_args
+            ):
+                _merge_tallies(tallies, shard_tallies)
+                num_runouts += shard_runouts
+        return num_runouts
 
-        return winning_scenarios / total_scenarios if total_scenarios > 0 else 0.0
+    def calculate_equity(self, player_name: str) -> EquityResult:
+        """
+        Calculate win/tie/lose equity of a specific player
+        Args:
+            player_name: Name of the player to calculate for
+        Returns:
+            EquityResult of the player
+        """
+        if player_name not in self.player_hands:
+            raise ValueError(f"Player {player_name} not found in player hands")
+        return self.calculate_equities()[player_name]
 
-    def _is_winner(self, player_name: str, community_cards: List[str] = None) -> bool:
+    def calculate_win_probability(self, player_name: str) -> float:
         """
-        Determine if the given player wins with the specified community cards
+        Calculate the probability of a specific player winning the pot outright
         Args:
-            player_name: Name of the player to check
-            community_cards: Optional list of community cards (uses self.community_cards if None)
+            player_name: Name of the player to calculate for
         Returns:
-            True if the player wins, False otherwise
+            Float between 0 and 1 representing win probability
         """
-        # TODO: Implement actual poker hand comparison logic
-        # This would use the HandEvaluator class to compare hands
-        pass
+        return self.calculate_equity(player_name).win
 
     def calculate_all_probabilities(self) -> Dict[str, float]:
         """
@@ -79,30 +456,38 @@ class WinningHandProbability:
             Dict mapping player names to their win probabilities
         """
         return {
-            player: self.calculate_win_probability(player)
-            for player in self.player_hands.keys()
+            player: equity.win for player, equity in self.calculate_equities().items()
         }
 
+    @staticmethod
+    def get_preflop_equity_vs_random(hole_cards: List[str], num_players: int = 2) -> float:
+        """
+        Preflop pot equity of two hole cards against random hands, looked up in the
+        precomputed table instead of simulating (the table is loaded on first use)
+        Args:
+            hole_cards: Two hole cards, e.g. ["AS", "KD"]
+            num_players: Players at showdown, including this one (2 to 6)
+        Returns:
+            Share of the pot won on average
+        """
+        return PreflopEquityTable.get_hand_equity(hole_cards, num_players)
+
     def calculate_hand_type_probability(self, player_name: str) -> Dict[str, float]:
         """
-        Calculate probabilities of achieving different hand types
+        Calculate probabilities of achieving different hand types, from the same
+        runouts as calculate_equities(). Hand types are only counted once asked for,
+        so the first call makes a pass over the runouts of its own.
         Args:
             player_name: Name of the player to calculate for
         Returns:
             Dict mapping hand types to their probabilities
         """
-        hand_types = {
-            "Royal Flush": 0.0,
-            "Straight Flush": 0.0,
-            "Four of a Kind": 0.0,
-            "Full House": 0.0,
-            "Flush": 0.0,
-            "Straight": 0.0,
-            "Three of a Kind": 0.0,
-            "Two Pair": 0.0,
-            "One Pair": 0.0,
-            "High Card": 0.0,
+        if player_name not in self.player_hands:
+            raise ValueError(f"Player {player_name} not found in player hands")
+        if self._hand_type_counts is None:
+            self._tally(count_hand_types=True)
+        counts = self._hand_type_counts[player_name]
+        return {
+            hand_type_name: counts[hand_rank.value] / self._num_runouts
+            for hand_rank, hand_type_name in HAND_TYPE_NAMES.items()
         }
-
-        # TODO: Implement probability calculations for each hand type
-        return hand_types
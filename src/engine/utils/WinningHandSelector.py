@@ -1,21 +1,22 @@
-from typing import List, Dict, Tuple
-from collections import Counter
-from enum import Enum, auto
+from typing import Any, List, Dict
 
-from engine.constants import VALID_CARD_SUITS, VALID_CARD_RANKS, VALID_CARDS
+from engine.classes.Card import VALID_CARDS, Card
+from engine.utils.HandEvaluator import HandEvaluator, HandRank, evaluate
 
+# Short card names used by the selector, e.g. "AS" for the Ace of Spades, "TD" for the 10 of Diamonds
+VALID_CARD_FACES = "23456789TJQKA"
+VALID_CARD_SUITS = "CDHS"
+# Short card name to integer card (see engine.classes.Card)
+SHORT_NAME_TO_INT: Dict[str, int] = {
+    f"{VALID_CARD_FACES[rank - 2]}{suit}": i
+    for i, (_, (rank, suit)) in enumerate(VALID_CARDS)
+}
+INT_TO_SHORT_NAME: List[str] = list(SHORT_NAME_TO_INT)
 
-class HandRank(Enum):
-    HIGH_CARD = auto()
-    PAIR = auto()
-    TWO_PAIR = auto()
-    THREE_OF_A_KIND = auto()
-    STRAIGHT = auto()
-    FLUSH = auto()
-    FULL_HOUSE = auto()
-    FOUR_OF_A_KIND = auto()
-    STRAIGHT_FLUSH = auto()
-    ROYAL_FLUSH = auto()
+
+def card_to_short_name(card: Card) -> str:
+    """Short name of a Card, e.g. "TD" for the 10 of Diamonds"""
+    return f"{VALID_CARD_FACES[card.rank - 2]}{card.suit}"
 
 
 class WinningHandSelector:
@@ -84,153 +85,56 @@ class WinningHandSelector:
         Returns:
             List of winning player names (multiple in case of tie)
         """
-        hand_rankings = {}
-
-        for player, hole_cards in player_hands.items():
-            all_cards = hole_cards + community_cards
-            hand_rank = WinningHandSelector._evaluate_single_hand(all_cards)
-            hand_rankings[player] = hand_rank
+        hand_strengths = {
+            player: WinningHandSelector._evaluate_single_hand(
+                hole_cards + community_cards
+            )
+            for player, hole_cards in player_hands.items()
+        }
 
         # Find highest ranking hand(s)
-        max_rank = max(hand_rankings.values(), key=lambda x: (x[0].value, x[1]))
-        winners = [
+        max_strength = max(hand_strengths.values())
+        return [
             player
-            for player, rank in hand_rankings.items()
-            if rank[0].value == max_rank[0].value and rank[1] == max_rank[1]
+            for player, strength in hand_strengths.items()
+            if strength == max_strength
         ]
 
-        return winners
-
     @staticmethod
-    def _evaluate_single_hand(cards: List[str]) -> Tuple[HandRank, List[int]]:
+    def evaluate_int_hands(
+        player_hands: Dict[Any, List[int]], community_cards: List[int]
+    ) -> List[Any]:
         """
-        Evaluate a single hand of 7 cards and return its rank and kickers
-        Returns tuple of (HandRank, list of relevant card values for tiebreaking)
+        Same as evaluate_hands() for integer cards (see engine.classes.Card)
+        Args:
+            player_hands: Dict of player key (name or id) to their two integer hole cards
+            community_cards: List of integer community cards
+        Returns:
+            List of winning player keys (multiple in case of tie)
         """
-        values = [card[0] for card in cards]
-        suits = [card[1] for card in cards]
-        value_counts = Counter(values)
-        suit_counts = Counter(suits)
-
-        # Convert card values to numbers
-        numeric_values = [WinningHandSelector.CARD_VALUES[val] for val in values]
-        numeric_values.sort(reverse=True)
-
-        # Check for flush
-        flush_suit = next(
-            (suit for suit, count in suit_counts.items() if count >= 5), None
-        )
-        flush_cards = (
-            [
-                WinningHandSelector.CARD_VALUES[card[0]]
-                for card in cards
-                if card[1] == flush_suit
-            ]
-            if flush_suit
-            else []
-        )
-
-        # Check for straight
-        straight_high = WinningHandSelector._find_straight(numeric_values)
-
-        # Royal Flush
-        if (
-            flush_suit
-            and straight_high == 14
-            and all(v in flush_cards for v in range(10, 15))
-        ):
-            return (HandRank.ROYAL_FLUSH, [14])
-
-        # Straight Flush
-        if (
-            flush_suit
-            and straight_high
-            and all(
-                v in flush_cards for v in range(straight_high - 4, straight_high + 1)
-            )
-        ):
-            return (HandRank.STRAIGHT_FLUSH, [straight_high])
-
-        # Four of a Kind
-        fours = [val for val, count in value_counts.items() if count == 4]
-        if fours:
-            kicker = max(
-                v
-                for v in numeric_values
-                if WinningHandSelector.CARD_VALUES[fours[0]] != v
-            )
-            return (
-                HandRank.FOUR_OF_A_KIND,
-                [WinningHandSelector.CARD_VALUES[fours[0]], kicker],
-            )
-
-        # Full House
-        threes = [val for val, count in value_counts.items() if count == 3]
-        pairs = [val for val, count in value_counts.items() if count == 2]
-        if threes and pairs:
-            return (
-                HandRank.FULL_HOUSE,
-                [
-                    WinningHandSelector.CARD_VALUES[threes[0]],
-                    WinningHandSelector.CARD_VALUES[pairs[0]],
-                ],
-            )
-
-        # Flush
-        if flush_cards:
-            return (HandRank.FLUSH, sorted(flush_cards, reverse=True)[:5])
-
-        # Straight
-        if straight_high:
-            return (HandRank.STRAIGHT, [straight_high])
-
-        # Three of a Kind
-        if threes:
-            kickers = [
-                v
-                for v in numeric_values
-                if WinningHandSelector.CARD_VALUES[threes[0]] != v
-            ][:2]
-            return (
-                HandRank.THREE_OF_A_KIND,
-                [WinningHandSelector.CARD_VALUES[threes[0]]] + kickers,
-            )
-
-        # Two Pair
-        if len(pairs) >= 2:
-            pairs_values = sorted(
-                [WinningHandSelector.CARD_VALUES[p] for p in pairs], reverse=True
-            )[:2]
-            kicker = max(v for v in numeric_values if v not in pairs_values)
-            return (HandRank.TWO_PAIR, pairs_values + [kicker])
-
-        # One Pair
-        if pairs:
-            kickers = [
-                v
-                for v in numeric_values
-                if WinningHandSelector.CARD_VALUES[pairs[0]] != v
-            ][:3]
-            return (
-                HandRank.PAIR,
-                [WinningHandSelector.CARD_VALUES[pairs[0]]] + kickers,
-            )
-
-        # High Card
-        return (HandRank.HIGH_CARD, numeric_values[:5])
+        hand_strengths = {
+            player: evaluate(hole_cards + community_cards)
+            for player, hole_cards in player_hands.items()
+        }
+        max_strength = max(hand_strengths.values())
+        return [
+            player
+            for player, strength in hand_strengths.items()
+            if strength == max_strength
+        ]
 
     @staticmethod
-    def _find_straight(values: List[int]) -> int:
-        """Find the highest straight in the values list, return highest card value or None"""
-        values = sorted(set(values), reverse=True)
-
-        # Check for Ace-low straight
-        if set([14, 2, 3, 4, 5]).issubset(set(values)):
-            return 5
-
-        # Check for regular straights
-        for i in range(len(values) - 4):
-            if values[i] - values[i + 4] == 4:
-                return values[i]
+    def get_hand_rank(cards: List[str]) -> HandRank:
+        """Return the HandRank of the best 5-card hand in 5 to 7 cards"""
+        return HandEvaluator.get_hand_rank(
+            WinningHandSelector._evaluate_single_hand(cards)
+        )
 
-        return None
+    @staticmethod
+    def _evaluate_single_hand(cards: List[str]) -> int:
+        """
+        Evaluate a single hand of 5 to 7 cards
+        Returns a comparable integer strength, see HandEvaluator.get_hand_rank()
+        and HandEvaluator.get_hand_values() to break it down into rank and kickers
+        """
+        return HandEvaluator.evaluate([SHORT_NAME_TO_INT[card] for card in cards])
@@ -0,0 +1,148 @@
+import asyncio
+
+import pytest
+from engine.classes.Player import Player
+from engine.classes.SingleGame import BettingRound, PlayerAction
+from engine.utils.AsyncTableRunner import AsyncTableRunner, TimeBank, run_tables
+from engine.utils.HandSimulator import check_or_call_policy
+
+
+def _players(num_players, starting_stack=100):
+    return [Player(i, f"Bot {i}", starting_stack) for i in range(1, num_players + 1)]
+
+
+async def check_or_call_agent(game, player):
+    await asyncio.sleep(0)
+    return check_or_call_policy(game, player)
+
+
+async def stalling_agent(game, player):
+    await asyncio.sleep(10)
+    return PlayerAction.CALL, 0
+
+
+async def failing_agent(game, player):
+    raise RuntimeError("Agent crashed")
+
+
+async def socket_timeout_agent(game, player):
+    raise TimeoutError("Socket timed out")
+
+
+async def raising_agent(game, player):
+    # More than the player's stack
+    return PlayerAction.RAISE, 1000
+
+
+def test_hand_is_played_to_showdown():
+    players = _players(3)
+    runner = AsyncTableRunner(
+        players, {player.player_id: check_or_call_agent for player in players}, big_blind_bet=2
+    )
+    winnings = asyncio.run(runner.play_hand())
+    assert runner.game.current_betting_round == BettingRound.ENDED
+    assert sum(winnings.values()) == 6
+    assert sum(player.current_stack for player in players) == 300
+    assert runner.auto_actions == {1: 0, 2: 0, 3: 0}
+
+
+def test_timeout_folds_facing_a_bet_and_empties_the_time_bank():
+    players = _players(3)
+    agents = {1: check_or_call_agent, 2: check_or_call_agent, 3: stalling_agent}
+    runner = AsyncTableRunner(
+        players, agents, big_blind_bet=2, action_timeout=0.01, time_bank=0.02
+    )
+    asyncio.run(runner.play_hand())
+    # Player 3 acts first preflop, facing the big blind
+    assert runner.auto_actions[3] == 1
+    assert runner.time_banks[3].seconds == 0
+    assert not players[2].is_active
+    assert players[2].current_stack == 100
+
+
+def test_timeout_checks_when_nothing_to_call():
+    players = _players(2)
+    agents = {1: check_or_call_agent, 2: stalling_agent}
+    runner = AsyncTableRunner(players, agents, big_blind_bet=2, action_timeout=0.01, time_bank=0)
+    asyncio.run(runner.play_hand())
+    # The big blind checks its option preflop and every street after instead of folding
+    assert runner.auto_actions[2] == 4
+    assert runner.game.count_active_players() == 2
+
+
+def test_illegal_action_is_replaced_by_auto_action():
+    players = _players(2)
+    agents = {1: raising_agent, 2: check_or_call_agent}
+    runner = AsyncTableRunner(players, agents, big_blind_bet=2)
+    winnings = asyncio.run(runner.play_hand())
+    assert runner.auto_actions[1] == 1
+    assert winnings == {2: 3}
+
+
+def test_time_bank_only_pays_for_time_over_the_action_timeout():
+    time_bank = TimeBank(10)
+    time_bank.consume(3, action_timeout=5)
+    assert time_bank.seconds == 10
+    time_bank.consume(8, action_timeout=5)
+    assert time_bank.seconds == 7
+    time_bank.consume(20, action_timeout=5)
+    assert time_bank.seconds == 0
+
+
+def test_many_tables_share_one_event_loop():
+    runners = []
+    for table in range(20):
+        players = [Player(table * 10 + i, f"Bot {i}", 100) for i in range(3)]
+        runners.append(
+            AsyncTableRunner(
+                players,
+                {player.player_id: check_or_call_agent for player in players},
+                big_blind_bet=2,
+                reset_stacks=True,
+            )
+        )
+    results = asyncio.run(run_tables(runners, 3))
+    assert [result.hands for result in results] == [3] * 20
+    assert all(sum(result.net_winnings.values()) == 0 for result in results)
+
+
+def test_agent_error_is_replaced_by_auto_action():
+    players = _players(3)
+    agents = {1: check_or_call_agent, 2: check_or_call_agent, 3: failing_agent}
+    runner = AsyncTableRunner(players, agents, big_blind_bet=2)
+    asyncio.run(runner.play_hand())
+    # Player 3 folds to the big blind instead of aborting the hand
+    assert runner.auto_actions[3] == 1
+    assert runner.game.current_betting_round == BettingRound.ENDED
+    assert sum(player.current_stack for player in players) == 300
+
+
+def test_timeout_inside_the_agent_keeps_the_time_bank():
+    players = _players(3)
+    agents = {1: check_or_call_agent, 2: check_or_call_agent, 3: socket_timeout_agent}
+    runner = AsyncTableRunner(players, agents, big_blind_bet=2, time_bank=5)
+    asyncio.run(runner.play_hand())
+    assert runner.auto_actions[3] == 1
+    assert runner.time_banks[3].seconds == 5
+
+
+def test_failing_table_does_not_stop_the_others():
+    runners = []
+    for table in range(2):
+        players = [Player(table * 10 + i, f"Bot {i}", 100) for i in range(3)]
+        runners.append(
+            AsyncTableRunner(
+                players, {player.player_id: check_or_call_agent for player in players}
+            )
+        )
+    # Not enough chips left to post the blinds
+    for player in runners[0].game.all_players[1:]:
+        player.current_stack = 0
+    results = asyncio.run(run_tables(runners, 2))
+    assert isinstance(results[0], ValueError)
+    assert results[1].hands == 2
+
+
+def test_every_player_needs_an_agent():
+    with pytest.raises(ValueError):
+        AsyncTableRunner(_players(2), {1: check_or_call_agent})
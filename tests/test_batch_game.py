@@ -0,0 +1,140 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from engine.classes.Player import Player
+from engine.classes.SingleGame import BettingRound, PlayerAction, SingleGame
+from engine.utils.BatchGame import (
+    ACTION_CODES,
+    CALL,
+    FOLD,
+    NO_SEAT,
+    RAISE,
+    BatchGame,
+    random_actions,
+)
+
+STACKS = [60, 100, 25, 200]
+HEADS_UP_STACKS = [60, 100]
+
+
+def _choose(rng, can_check, can_raise, min_raise_to, max_raise_to):
+    draw = rng.random()
+    if can_raise and draw < 0.25:
+        return PlayerAction.RAISE, min_raise_to if draw < 0.15 else max_raise_to
+    if can_check:
+        return PlayerAction.CHECK, 0
+    if draw > 0.85:
+        return PlayerAction.FOLD, 0
+    return PlayerAction.CALL, 0
+
+
+def _play_single_game(seed, num_hands, stacks):
+    game = SingleGame(big_blind_bet=4, seed=seed)
+    game.register_players(*[Player(i + 1, f"Bot {i}", stack) for i, stack in enumerate(stacks)])
+    rng = random.Random(1000 + seed)
+    hands = []
+    for _ in range(num_hands):
+        if game.current_betting_round != BettingRound.NOTSTARTED:
+            game.start_new_hand()
+        for player, stack in zip(game.all_players, stacks):
+            player.current_stack = stack
+        game.advance_betting_round()
+        player = game.advance_to_next_decision()
+        while player is not None:
+            legal_actions = game.get_legal_actions()
+            action, amount = _choose(
+                rng,
+                legal_actions.can_check,
+                legal_actions.can_raise,
+                legal_actions.min_raise_to,
+                legal_actions.max_raise_to,
+            )
+            game.process_player_action(player.player_id, action, amount)
+            player = game.advance_to_next_decision()
+        game.resolve_winner()
+        hands.append(
+            (
+                [player.get_hand_as_ints() for player in game.all_players],
+                game.community_cards.get_cards_as_ints(),
+                [player.current_stack for player in game.all_players],
+            )
+        )
+    return hands
+
+
+@pytest.mark.parametrize("stacks", [STACKS, HEADS_UP_STACKS])
+def test_batch_agrees_with_single_game_on_the_same_seeds(stacks):
+    num_games, num_hands = 40, 3
+    seeds = list(range(num_games))
+    batch = BatchGame(num_games, len(stacks), stacks, big_blind_bet=4, seeds=seeds)
+    rngs = [random.Random(1000 + seed) for seed in seeds]
+    expected = [_play_single_game(seed, num_hands, stacks) for seed in seeds]
+    for hand in range(num_hands):
+        batch.stacks[:] = stacks
+        batch.start_hands()
+        while not batch.is_done().all():
+            legal_actions = batch.get_legal_actions()
+            actions = np.zeros(num_games, dtype=np.int64)
+            amounts = np.zeros(num_games, dtype=np.int64)
+            for i in np.nonzero(legal_actions.seats != NO_SEAT)[0]:
+                action, amount = _choose(
+                    rngs[i],
+                    legal_actions.can_check[i],
+                    legal_actions.can_raise[i],
+                    int(legal_actions.min_raise_to[i]),
+                    int(legal_actions.max_raise_to[i]),
+                )
+                actions[i], amounts[i] = ACTION_CODES[action], amount
+            batch.step(actions, amounts)
+        for i in range(num_games):
+            hole_cards, board, final_stacks = expected[i][hand]
+            assert batch.hole_cards[i].tolist() == hole_cards
+            assert [card for card in batch.boards[i].tolist() if card >= 0] == board
+            assert batch.stacks[i].tolist() == final_stacks
+
+
+def test_first_decision_faces_the_big_blind():
+    batch = BatchGame(3, 3, 100, big_blind_bet=2, seed=1)
+    batch.start_hands()
+    legal_actions = batch.get_legal_actions()
+    assert legal_actions.seats.tolist() == [2, 2, 2]
+    assert legal_actions.amount_to_call.tolist() == [2, 2, 2]
+    assert legal_actions.min_raise_to.tolist() == [4, 4, 4]
+    assert legal_actions.max_raise_to.tolist() == [100, 100, 100]
+    assert batch.get_pots().tolist() == [3, 3, 3]
+
+
+def test_illegal_actions_are_rejected():
+    batch = BatchGame(2, 3, 100, big_blind_bet=2, seed=1)
+    batch.start_hands()
+    with pytest.raises(ValueError):
+        batch.step([CALL, RAISE], [0, 3])
+    batch.step([FOLD, RAISE], [0, 6])
+    assert batch.in_hand.tolist() == [[True, True, False], [True, True, True]]
+    assert batch.get_next_seats().tolist() == [0, 0]
+
+
+def test_chips_are_conserved_with_random_actions():
+    batch = BatchGame(500, 6, 100, big_blind_bet=4, seed=3)
+    rng = np.random.default_rng(3)
+    for _ in range(3):
+        batch.start_hands()
+        while not batch.is_done().all():
+            batch.step(*random_actions(batch.get_legal_actions(), rng, raise_probability=0.3))
+        assert (batch.stacks.sum(axis=1) == 600).all()
+        assert (batch.winnings.sum(axis=1) == batch.get_pots()).all()
+        batch.stacks[:] = 100
+
+
+def test_board_runs_out_after_an_all_in_is_called():
+    batch = BatchGame(2, 2, [10, 100], big_blind_bet=2, seed=1)
+    batch.start_hands()
+    assert batch.get_next_seats().tolist() == [0, 0]
+    batch.step(np.full(2, RAISE), np.full(2, 10))
+    batch.step(np.full(2, CALL), np.zeros(2, dtype=np.int64))
+    assert batch.is_done().all()
+    assert (batch.boards >= 0).all()
+    assert batch.stacks.sum(axis=1).tolist() == [110, 110]
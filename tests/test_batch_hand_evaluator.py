@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from engine.utils.BatchHandEvaluator import BatchHandEvaluator
+from engine.utils.HandEvaluator import HandEvaluator, HandRank
+
+
+@pytest.mark.parametrize("num_cards", [5, 6, 7])
+def test_batch_agrees_with_scalar_evaluator(num_cards):
+    rng = random.Random(num_cards)
+    hands = [rng.sample(range(52), num_cards) for _ in range(5000)]
+    strengths, categories = BatchHandEvaluator.evaluate(np.array(hands))
+    expected = [HandEvaluator.evaluate(hand) for hand in hands]
+    assert strengths.tolist() == expected
+    assert categories.tolist() == [
+        HandEvaluator.get_hand_rank(strength).value for strength in expected
+    ]
+
+
+def test_batch_flush_suits():
+    # Same ranks, one flush per suit (suit index = card & 3)
+    hands = [
+        [rank * 4 + suit for rank in (0, 3, 5, 8, 12)]
+        + [4 + (suit + 1) % 4, 8 + (suit + 2) % 4]
+        for suit in range(4)
+    ]
+    strengths, categories = BatchHandEvaluator.evaluate(hands)
+    assert BatchHandEvaluator.to_hand_ranks(categories) == [HandRank.FLUSH] * 4
+    assert len(set(strengths.tolist())) == 1
+
+
+def test_batch_reject_invalid_shape_and_cards():
+    with pytest.raises(ValueError):
+        BatchHandEvaluator.evaluate(np.zeros((3, 4), dtype=np.int64))
+    with pytest.raises(ValueError):
+        BatchHandEvaluator.evaluate(np.full((1, 7), 52))
+
+
+def test_batch_reject_duplicate_cards_with_their_rows():
+    cards = [[0, 4, 8, 12, 16, 20, 24], [48, 48, 48, 48, 44, 40, 36], [1, 5, 9, 13, 17, 21, 21]]
+    with pytest.raises(ValueError, match=r"\[1, 2\]"):
+        BatchHandEvaluator.evaluate(cards)
+    with pytest.raises(ValueError, match=r"\[1\]"):
+        BatchHandEvaluator.evaluate([[0, 4, 8, 12, 16], [0, 4, 8, 12, -1]])
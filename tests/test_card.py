@@ -1,5 +1,17 @@
+import copy
+import pickle
+
 import pytest
-from engine.classes.Card import Card, VALID_CARDS
+from engine.classes.Card import (
+    Card,
+    VALID_CARDS,
+    card_to_int,
+    int_to_card,
+    ints_to_mask,
+    mask_to_ints,
+    cards_to_mask,
+    mask_to_cards,
+)
 
 
 @pytest.mark.parametrize(
@@ -33,3 +45,68 @@ def test_card_str_representation(card_name, rank, suit):
     card = Card(card_name, rank, suit)
     expected_str = f'Card(card_name="{card_name}",rank={rank},suit="{suit}")'
     assert str(card) == expected_str
+
+
+@pytest.mark.parametrize(
+    "card_int,card_name",
+    [(card_int, card_name) for card_int, (card_name, _) in enumerate(VALID_CARDS)],
+)
+def test_card_int_roundtrip(card_int, card_name):
+    card = int_to_card(card_int)
+    assert card.verbose_name == card_name
+    assert card_to_int(card) == card_int
+    assert Card(card_name, card.rank, card.suit).to_int() == card_int
+
+
+def test_card_int_encoding_order():
+    assert Card("2 Club", 2, "C").to_int() == 0
+    assert Card("2 Spade", 2, "S").to_int() == 3
+    assert Card("A Spade", 14, "S").to_int() == 51
+
+
+def test_reject_invalid_card_int():
+    with pytest.raises(ValueError):
+        int_to_card(52)
+
+
+def test_card_mask_roundtrip():
+    card_ints = [0, 7, 33, 51]
+    mask = ints_to_mask(card_ints)
+    assert mask == (1 << 0) | (1 << 7) | (1 << 33) | (1 << 51)
+    assert mask_to_ints(mask) == card_ints
+    assert cards_to_mask(mask_to_cards(mask)) == mask
+    assert Card("A Spade", 14, "S").to_mask() == 1 << 51
+
+
+def test_cards_are_interned():
+    assert Card("A Spade", 14, "S") is Card("A Spade", 14, "S")
+    assert Card("A Spade", 14, "S") is int_to_card(51)
+
+
+def test_card_is_immutable():
+    card = Card("A Spade", 14, "S")
+    with pytest.raises(AttributeError):
+        card.rank = 2
+    with pytest.raises(AttributeError):
+        card.foo = "bar"
+
+
+def test_reject_card_name_not_matching_rank_and_suit():
+    with pytest.raises(ValueError):
+        Card("A Spade", 13, "S")
+
+
+def test_card_hash_and_ordering():
+    two_club = Card("2 Club", 2, "C")
+    two_spade = Card("2 Spade", 2, "S")
+    ace_club = Card("A Club", 14, "C")
+    assert len({two_club, Card("2 Club", 2, "C"), two_spade}) == 2
+    assert two_club < two_spade < ace_club
+    assert sorted([ace_club, two_spade, two_club]) == [two_club, two_spade, ace_club]
+
+
+def test_card_copy_and_pickle_keep_identity():
+    card = Card("Q Heart", 12, "H")
+    assert copy.copy(card) is card
+    assert copy.deepcopy(card) is card
+    assert pickle.loads(pickle.dumps(card)) is card
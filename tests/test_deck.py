@@ -1,3 +1,7 @@
+import copy
+import pickle
+import random
+
 import pytest
 from engine.classes.Deck import Deck
 from engine.classes.Card import Card
@@ -64,3 +68,80 @@ def test_get_deck_size():
     assert deck.get_deck_size() == 52
     deck.deal()
     assert deck.get_deck_size() == 51
+
+
+def test_get_cards_as_ints():
+    deck = Deck(do_not_shuffle=True)
+    assert deck.get_cards_as_ints() == list(range(52))
+    assert deck.get_cards_as_mask() == (1 << 52) - 1
+    card = deck.deal()
+    assert card.to_int() == 51
+    assert deck.get_cards_as_mask() == (1 << 51) - 1
+
+
+def test_decks_share_card_instances():
+    deck1 = Deck(do_not_shuffle=True)
+    deck2 = Deck(do_not_shuffle=True)
+    assert all(c1 is c2 for c1, c2 in zip(deck1.cards, deck2.cards))
+    assert deck1 == deck2
+    deck2.deal()
+    assert deck1 != deck2
+
+
+def test_seeded_decks_are_identical():
+    assert Deck(seed=42) == Deck(seed=42)
+    assert Deck(seed=42) != Deck(seed=43)
+
+
+def test_rng_instance():
+    deck1, deck2 = Deck(rng=random.Random(5)), Deck(rng=random.Random(5))
+    assert deck1 == deck2
+    deck1.reset()
+    deck2.reset()
+    assert deck1 == deck2
+
+
+def test_deal_from_the_end():
+    deck = Deck(seed=1)
+    expected = list(reversed(deck.get_cards()))
+    dealt = [deck.deal() for _ in range(52)]
+    assert dealt == expected
+    assert deck.empty()
+    assert deck.get_cards() == []
+
+
+def test_add_card_after_deal():
+    deck = Deck(do_not_shuffle=True)
+    card = deck.deal()
+    deck.deal()
+    deck.add_card(card)
+    assert deck.get_deck_size() == 51
+    assert deck.get_cards()[-1] is card
+
+
+def test_reset_reuses_storage_and_reshuffles():
+    deck = Deck(seed=3)
+    storage = deck.cards
+    first_order = list(storage)
+    for _ in range(10):
+        deck.deal()
+    deck.reset()
+    assert deck.cards is storage
+    assert deck.get_deck_size() == 52
+    assert set(deck.cards) == set(first_order)
+    assert deck.cards != first_order
+
+
+def test_clear():
+    deck = Deck()
+    deck.deal()
+    deck.clear()
+    assert deck.empty()
+
+
+def test_unseeded_deck_can_be_pickled_and_copied():
+    deck = Deck()
+    assert pickle.loads(pickle.dumps(deck)) == deck
+    assert copy.deepcopy(deck) == deck
+    deck.reset()
+    assert deck.get_deck_size() == 52
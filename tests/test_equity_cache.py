@@ -0,0 +1,55 @@
+import pytest
+from engine.utils.EquityCache import EquityCache, canonicalize
+from engine.utils.WinningHandProbability import WinningHandProbability
+from engine.utils.WinningHandSelector import SHORT_NAME_TO_INT
+
+
+def _ints(cards):
+    return [SHORT_NAME_TO_INT[card] for card in cards]
+
+
+def test_suit_isomorphic_spots_have_the_same_key():
+    first = canonicalize([_ints(["AH", "KH"]), _ints(["QS", "QD"])], _ints(["2H", "7C", "9S"]))
+    second = canonicalize([_ints(["AS", "KS"]), _ints(["QH", "QC"])], _ints(["2S", "7D", "9H"]))
+    assert first == second
+
+
+def test_card_order_does_not_change_the_key():
+    first = canonicalize([_ints(["AH", "KH"])], _ints(["2H", "7C", "9S"]))
+    second = canonicalize([_ints(["KH", "AH"])], _ints(["9S", "2H", "7C"]))
+    assert first == second
+
+
+def test_different_spots_have_different_keys():
+    suited = canonicalize([_ints(["AH", "KH"])], [])
+    offsuit = canonicalize([_ints(["AH", "KS"])], [])
+    assert suited != offsuit
+
+
+def test_cache_hits_on_isomorphic_spots():
+    cache = EquityCache()
+    first = cache.calculate_equities(
+        {"Hero": ["AH", "KH"], "Villain": ["QS", "QD"]}, ["2H", "7C", "9S"]
+    )
+    second = cache.calculate_equities(
+        {"Hero": ["AS", "KS"], "Villain": ["QH", "QC"]}, ["2S", "7D", "9H"]
+    )
+    info = cache.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    assert cache.get_hit_rate() == 0.5
+    assert second["Hero"] is first["Hero"]
+
+    expected = WinningHandProbability(
+        {"Hero": ["AS", "KS"], "Villain": ["QH", "QC"]}, ["2S", "7D", "9H"]
+    ).calculate_equities()
+    assert second["Hero"].to_dict() == expected["Hero"].to_dict()
+    assert second["Villain"].to_dict() == expected["Villain"].to_dict()
+
+
+def test_cache_is_bounded():
+    cache = EquityCache(maxsize=1)
+    cache.calculate_equities({"Hero": ["AH", "KH"], "Villain": ["QS", "QD"]}, ["2H", "7C", "9S", "3D", "4D"])
+    cache.calculate_equities({"Hero": ["AH", "KH"], "Villain": ["JS", "JD"]}, ["2H", "7C", "9S", "3D", "4D"])
+    assert cache.cache_info().currsize == 1
+    cache.clear()
+    assert cache.cache_info().currsize == 0
@@ -0,0 +1,86 @@
+import pytest
+from engine.classes.Player import Player
+from engine.classes.SingleGame import PlayerAction, SingleGame
+from engine.utils.GameSnapshot import GameSnapshot
+from engine.utils.HandSimulator import check_or_call_policy
+
+
+@pytest.fixture
+def flop_game():
+    game = SingleGame(id=7, big_blind_bet=2)
+    game.register_players(
+        Player(1, "John", 10), Player(2, "Jane", 10), Player(3, "Jim", 20)
+    )
+    game.advance_betting_round()  # notstarted to preflop
+    game.process_player_action(3, PlayerAction.CALL)
+    game.process_player_action(1, PlayerAction.FOLD)
+    game.advance_betting_round()  # preflop to flop
+    return game
+
+
+def _play_out(game):
+    player = game.advance_to_next_decision()
+    while player is not None:
+        action, amount = check_or_call_policy(game, player)
+        game.process_player_action(player.player_id, action, amount)
+        player = game.advance_to_next_decision()
+    return game.resolve_winner()
+
+
+def test_snapshot_round_trip(flop_game):
+    data = GameSnapshot.dump(flop_game)
+    restored = GameSnapshot.load(data)
+    assert restored.get_current_state() == flop_game.get_current_state()
+    assert restored.get_deck() == flop_game.get_deck()
+    assert restored.get_discard_pile() == flop_game.get_discard_pile()
+    assert (
+        restored.get_deck_order_as_list_of_verbose_names()
+        == flop_game.get_deck_order_as_list_of_verbose_names()
+    )
+    assert {k: [str(bet) for bet in v] for k, v in restored.get_bets().items()} == {
+        k: [str(bet) for bet in v] for k, v in flop_game.get_bets().items()
+    }
+    assert [player.player_id for player in restored.get_active_players()] == [2, 3]
+    assert restored.get_hand_ranks() == flop_game.get_hand_ranks()
+    assert GameSnapshot.dump(restored) == data
+
+
+def test_restored_game_plays_out_the_same(flop_game):
+    restored = GameSnapshot.load(GameSnapshot.dump(flop_game))
+    assert _play_out(restored) == _play_out(flop_game)
+    assert [player.current_stack for player in restored.get_players()] == [
+        player.current_stack for player in flop_game.get_players()
+    ]
+
+
+def test_snapshot_is_compact(flop_game):
+    # 52-card deck order, 3 players and 4 bets
+    assert len(GameSnapshot.dump(flop_game)) < 300
+
+
+def test_snapshot_of_a_new_game():
+    game = SingleGame()
+    restored = GameSnapshot.load(GameSnapshot.dump(game))
+    assert restored.get_betting_round() == "notstarted"
+    assert restored.get_deck() == game.get_deck()
+
+
+def test_load_rejects_other_data(flop_game):
+    with pytest.raises(ValueError):
+        GameSnapshot.load(b"XYZ" + GameSnapshot.dump(flop_game)[3:])
+
+
+def test_restored_seeded_game_deals_the_same_next_hand():
+    game = SingleGame(big_blind_bet=2, seed=11)
+    game.register_players(Player(1, "John", 10), Player(2, "Jane", 10), Player(3, "Jim", 20))
+    game.advance_betting_round()
+    restored = GameSnapshot.load(GameSnapshot.dump(game))
+    for played in (game, restored):
+        _play_out(played)
+        played.start_new_hand()
+        played.advance_betting_round()
+    assert restored.get_deck() == game.get_deck()
+    assert [player.get_hand_as_ints() for player in restored.get_players()] == [
+        player.get_hand_as_ints() for player in game.get_players()
+    ]
+    assert _play_out(restored) == _play_out(game)
@@ -0,0 +1,131 @@
+import itertools
+import random
+
+import pytest
+from engine.utils.HandEvaluator import (
+    HandEvaluator,
+    HandRank,
+    IncrementalHand,
+    evaluate,
+)
+
+
+def _reference_five_card_strength(cards):
+    """Slow but obvious 5-card evaluation, returns (HandRank.value, tiebreak values)"""
+    values = sorted([(card >> 2) + 2 for card in cards], reverse=True)
+    suits = set(card & 3 for card in cards)
+    counts = sorted(
+        [(values.count(v), v) for v in set(values)], reverse=True
+    )  # by count then value
+    is_flush = len(suits) == 1
+    straight_high = 0
+    if len(set(values)) == 5 and values[0] - values[4] == 4:
+        straight_high = values[0]
+    if set(values) == {14, 2, 3, 4, 5}:
+        straight_high = 5
+
+    if is_flush and straight_high == 14:
+        return (HandRank.ROYAL_FLUSH.value, [14])
+    if is_flush and straight_high:
+        return (HandRank.STRAIGHT_FLUSH.value, [straight_high])
+    if counts[0][0] == 4:
+        return (HandRank.FOUR_OF_A_KIND.value, [counts[0][1], counts[1][1]])
+    if counts[0][0] == 3 and counts[1][0] == 2:
+        return (HandRank.FULL_HOUSE.value, [counts[0][1], counts[1][1]])
+    if is_flush:
+        return (HandRank.FLUSH.value, values)
+    if straight_high:
+        return (HandRank.STRAIGHT.value, [straight_high])
+    if counts[0][0] == 3:
+        return (HandRank.THREE_OF_A_KIND.value, [c[1] for c in counts])
+    if counts[0][0] == 2 and counts[1][0] == 2:
+        return (HandRank.TWO_PAIR.value, [c[1] for c in counts])
+    if counts[0][0] == 2:
+        return (HandRank.PAIR.value, [c[1] for c in counts])
+    return (HandRank.HIGH_CARD.value, values)
+
+
+def _reference_strength(cards):
+    return max(
+        _reference_five_card_strength(five)
+        for five in itertools.combinations(cards, 5)
+    )
+
+
+def _card(short_name):
+    return "23456789TJQKA".index(short_name[0]) * 4 + "CDHS".index(short_name[1])
+
+
+@pytest.mark.parametrize("num_cards", [5, 6, 7])
+def test_evaluate_agrees_with_reference_ordering(num_cards):
+    rng = random.Random(num_cards)
+    hands = [rng.sample(range(52), num_cards) for _ in range(300)]
+    for a, b in zip(hands, hands[1:]):
+        reference_a, reference_b = _reference_strength(a), _reference_strength(b)
+        assert (evaluate(a) > evaluate(b)) == (reference_a > reference_b)
+        assert (evaluate(a) == evaluate(b)) == (reference_a == reference_b)
+
+
+@pytest.mark.parametrize(
+    "cards,hand_rank",
+    [
+        (["AS", "KS", "QS", "JS", "TS", "2C", "3D"], HandRank.ROYAL_FLUSH),
+        (["5H", "4H", "3H", "2H", "AH", "KC", "KD"], HandRank.STRAIGHT_FLUSH),
+        (["9C", "9D", "9H", "9S", "2C", "3D", "4H"], HandRank.FOUR_OF_A_KIND),
+        (["9C", "9D", "9H", "2S", "2C", "3D", "3H"], HandRank.FULL_HOUSE),
+        (["9C", "9D", "9H", "2S", "2C", "2D", "3H"], HandRank.FULL_HOUSE),
+        (["AC", "9C", "7C", "5C", "2C", "KD", "QH"], HandRank.FLUSH),
+        (["AC", "2D", "3H", "4S", "5C", "9D", "JH"], HandRank.STRAIGHT),
+        (["QC", "QD", "QH", "2S", "5C", "9D", "JH"], HandRank.THREE_OF_A_KIND),
+        (["QC", "QD", "5H", "5S", "2C", "2D", "JH"], HandRank.TWO_PAIR),
+        (["QC", "QD", "5H", "8S", "2C", "3D", "JH"], HandRank.PAIR),
+        (["QC", "7D", "5H", "8S", "2C", "3D", "JH"], HandRank.HIGH_CARD),
+    ],
+)
+def test_hand_rank(cards, hand_rank):
+    strength = HandEvaluator.evaluate([_card(c) for c in cards])
+    assert HandEvaluator.get_hand_rank(strength) == hand_rank
+
+
+def test_hand_values_break_ties_by_kickers():
+    two_pair_ace_kicker = HandEvaluator.evaluate(
+        [_card(c) for c in ["QC", "QD", "5H", "5S", "2C", "2D", "AH"]]
+    )
+    assert HandEvaluator.get_hand_values(two_pair_ace_kicker) == [12, 5, 14]
+    wheel = HandEvaluator.evaluate(
+        [_card(c) for c in ["AC", "2D", "3H", "4S", "5C"]]
+    )
+    six_high = HandEvaluator.evaluate(
+        [_card(c) for c in ["6C", "2D", "3H", "4S", "5C"]]
+    )
+    assert wheel < six_high
+
+
+def test_reject_wrong_number_of_cards():
+    with pytest.raises(ValueError):
+        HandEvaluator.evaluate([0, 1, 2, 3])
+    with pytest.raises(ValueError):
+        HandEvaluator.evaluate(list(range(8)))
+
+
+def test_evaluate_mask_matches_evaluate():
+    cards = [_card(c) for c in ["QC", "QD", "5H", "5S", "2C", "2D", "AH"]]
+    mask = 0
+    for card in cards:
+        mask |= 1 << card
+    assert HandEvaluator.evaluate_mask(mask) == HandEvaluator.evaluate(cards)
+
+
+def test_incremental_hand_matches_evaluate():
+    rng = random.Random(11)
+    for _ in range(2000):
+        cards = rng.sample(range(52), 7)
+        hand = IncrementalHand(cards[:2])
+        assert hand.get_strength() is None
+        assert hand.get_hand_rank() is None
+        for i in range(2, 7):
+            hand.add_card(cards[i])
+            if i >= 4:
+                assert hand.get_strength() == evaluate(cards[: i + 1])
+        with pytest.raises(ValueError):
+            hand.add_card(next(c for c in range(52) if c not in cards))
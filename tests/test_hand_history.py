@@ -0,0 +1,125 @@
+import struct
+
+import pytest
+from engine.classes.Player import Player
+from engine.utils.HandHistory import (
+    FILE_MAGIC,
+    HandHistoryWriter,
+    read_hand_history,
+)
+from engine.utils.HandSimulator import HandSimulator, RandomPolicy
+
+
+def _simulator(writer, num_players=3):
+    simulator = HandSimulator(
+        [Player(i, f"Bot {i}", 100) for i in range(1, num_players + 1)],
+        RandomPolicy(seed=1),
+        big_blind_bet=2,
+        reset_stacks=False,
+    )
+    simulator.game.set_hand_history_writer(writer)
+    return simulator
+
+
+def test_hands_are_recorded_and_read_back(tmp_path):
+    path = str(tmp_path / "hands.hhl")
+    played = []
+    with HandHistoryWriter(path, buffer_size=256) as writer:
+        simulator = _simulator(writer)
+        game = simulator.game
+        for _ in range(25):
+            winnings = simulator.play_hand()
+            played.append(
+                {
+                    "winnings": {k: v for k, v in winnings.items() if v},
+                    "deck_order": list(game.get_deck_order_as_list_of_verbose_names()),
+                    "community_cards": [
+                        card.verbose_name for card in game.get_community_cards().get_cards()
+                    ],
+                    "bets": {
+                        round_name: [(bet.player.player_id, bet.amount) for bet in round_bets]
+                        for round_name, round_bets in game.get_bets().items()
+                    },
+                    "stacks": {p.player_id: p.current_stack for p in game.get_players()},
+                    "hole_cards": {
+                        p.player_id: [card.verbose_name for card in p.get_hand().get_cards()]
+                        for p in game.get_players()
+                    },
+                }
+            )
+
+    records = list(read_hand_history(path))
+    assert len(records) == 25
+    for record, hand in zip(records, played):
+        assert record.big_blind_bet == 2
+        assert record.get_winnings() == hand["winnings"]
+        assert record.deck_order == hand["deck_order"]
+        assert record.community_cards == hand["community_cards"]
+        assert record.bets == hand["bets"]
+        assert {p["player_id"]: p["final_stack"] for p in record.players} == hand["stacks"]
+        assert {p["player_id"]: p["hole_cards"] for p in record.players} == hand["hole_cards"]
+
+
+def test_log_is_append_only(tmp_path):
+    path = str(tmp_path / "hands.hhl")
+    for _ in range(2):
+        with HandHistoryWriter(path) as writer:
+            simulator = _simulator(writer)
+            for _ in range(3):
+                simulator.play_hand()
+    with open(path, "rb") as f:
+        assert f.read(len(FILE_MAGIC)) == FILE_MAGIC
+    assert len(list(read_hand_history(path))) == 6
+
+
+def test_partial_last_record_is_skipped(tmp_path):
+    path = str(tmp_path / "hands.hhl")
+    with HandHistoryWriter(path) as writer:
+        simulator = _simulator(writer)
+        for _ in range(3):
+            simulator.play_hand()
+    with open(path, "ab") as f:
+        f.write(b"\xff\x00\x00\x00partial")
+    assert len(list(read_hand_history(path))) == 3
+
+
+def test_reopened_writer_cuts_off_a_partial_record(tmp_path):
+    path = str(tmp_path / "hands.hhl")
+    with HandHistoryWriter(path) as writer:
+        simulator = _simulator(writer)
+        for _ in range(3):
+            simulator.play_hand()
+    with open(path, "ab") as f:
+        f.write(b"\x40\x00\x00\x00part")
+    with HandHistoryWriter(path) as writer:
+        simulator = _simulator(writer)
+        for _ in range(3):
+            simulator.play_hand()
+    assert len(list(read_hand_history(path))) == 6
+
+
+def test_corrupt_record_raises_its_own_error(tmp_path):
+    path = tmp_path / "hands.hhl"
+    path.write_bytes(FILE_MAGIC + b"\x04\x00\x00\x00part")
+    with pytest.raises(struct.error):
+        list(read_hand_history(str(path)))
+
+
+def test_writer_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a hand history")
+    with pytest.raises(ValueError):
+        HandHistoryWriter(str(path))
+
+
+def test_empty_log(tmp_path):
+    path = str(tmp_path / "hands.hhl")
+    HandHistoryWriter(path).close()
+    assert list(read_hand_history(path)) == []
+
+
+def test_reject_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a hand history")
+    with pytest.raises(ValueError):
+        list(read_hand_history(str(path)))
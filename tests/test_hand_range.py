@@ -0,0 +1,52 @@
+import pytest
+from engine.utils.HandRange import HandRange, hand_class_combos
+
+
+@pytest.mark.parametrize(
+    "range_string,num_combos",
+    [
+        ("AA", 6),
+        ("QQ+", 18),
+        ("22-55", 24),
+        ("AKs", 4),
+        ("AKo", 12),
+        ("AK", 16),
+        ("ATs+", 16),
+        ("KQo-K9o", 48),
+        ("AsKs", 1),
+        ("random", 1326),
+        ("QQ+, AKs", 22),
+    ],
+)
+def test_range_combo_counts(range_string, num_combos):
+    assert HandRange(range_string).count_combos() == num_combos
+
+
+def test_range_weights():
+    hand_range = HandRange("QQ+, AKs 50%, AQs:0.25")
+    weights = sorted(set(hand_range.combos.values()))
+    assert weights == [0.25, 0.5, 1.0]
+    assert sum(hand_range.combos.values()) == 18 + 4 * 0.5 + 4 * 0.25
+
+
+def test_later_entries_override_earlier_ones():
+    hand_range = HandRange("22+, AA 0%")
+    assert hand_range.count_combos() == 72
+
+
+def test_get_combos_removes_dead_cards():
+    hand_range = HandRange("AA")
+    ace_of_spades = 51
+    assert len(hand_range.get_combos([ace_of_spades])) == 3
+
+
+def test_hand_class_combos():
+    assert len(hand_class_combos("AA")) == 6
+    assert len(hand_class_combos("AKs")) == 4
+    assert len(hand_class_combos("72o")) == 12
+
+
+@pytest.mark.parametrize("range_string", ["", "XX", "AKx", "AAs", "AK 150%", "AQ-KJ"])
+def test_reject_invalid_ranges(range_string):
+    with pytest.raises(ValueError):
+        HandRange(range_string)
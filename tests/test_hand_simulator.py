@@ -0,0 +1,113 @@
+import pytest
+from engine.classes.Player import Player
+from engine.classes.SingleGame import BettingRound, PlayerAction
+from engine.utils.HandSimulator import (
+    HandSimulator,
+    RandomPolicy,
+    check_or_call_policy,
+)
+from engine.utils.LoggingPolicy import LoggingPolicy
+
+
+def _players(num_players, starting_stack=1000):
+    return [Player(i, f"Bot {i}", starting_stack) for i in range(1, num_players + 1)]
+
+
+def test_check_or_call_hands_go_to_showdown():
+    simulator = HandSimulator(_players(3), check_or_call_policy, big_blind_bet=2)
+    winnings = simulator.play_hand()
+    game = simulator.game
+    assert game.current_betting_round == BettingRound.ENDED
+    assert game.get_community_cards().get_deck_size() == 5
+    assert game.count_active_players() == 3
+    assert sum(winnings.values()) == game.get_pot() == 6
+
+
+def test_folding_ends_the_hand():
+    def fold_policy(game, player):
+        if game.get_amount_to_call(player) == 0:
+            return PlayerAction.CHECK, 0
+        return PlayerAction.FOLD, 0
+
+    simulator = HandSimulator(_players(3), fold_policy, big_blind_bet=2)
+    winnings = simulator.play_hand()
+    # Both other players fold to the big blind
+    assert winnings == {2: 3}
+    assert simulator.game.get_community_cards().get_deck_size() == 0
+
+
+def test_chips_are_conserved_across_hands():
+    players = _players(4, starting_stack=50)
+    simulator = HandSimulator(
+        players, RandomPolicy(fold_probability=0.3, seed=7), big_blind_bet=10, reset_stacks=False
+    )
+    for _ in range(20):
+        if sum(player.current_stack > 0 for player in players) < 2:
+            break
+        simulator.play_hand()
+        assert sum(player.current_stack for player in players) == 200
+
+
+def test_chips_are_conserved_with_raises():
+    players = _players(5, starting_stack=100)
+    simulator = HandSimulator(
+        players,
+        RandomPolicy(fold_probability=0.2, seed=5, raise_probability=0.3),
+        big_blind_bet=4,
+        reset_stacks=False,
+        seed=9,
+    )
+    for _ in range(200):
+        if sum(player.current_stack > 0 for player in players) < 2:
+            break
+        simulator.play_hand()
+        assert sum(player.current_stack for player in players) == 500
+
+
+def test_run_reports_throughput_and_net_winnings():
+    simulator = HandSimulator(_players(6), RandomPolicy(seed=3))
+    result = simulator.run(50)
+    assert result.hands == 50
+    assert result.hands_per_second > 0
+    assert sum(result.net_winnings.values()) == 0
+    assert set(result.to_dict()) == {"hands", "seconds", "hands_per_second", "net_winnings"}
+
+
+def test_run_keeps_engine_logs_disabled_by_the_caller():
+    LoggingPolicy.disable_engine_logs()
+    try:
+        simulator = HandSimulator(_players(3), check_or_call_policy, big_blind_bet=2)
+        simulator.run(2)
+        assert not LoggingPolicy.are_engine_logs_enabled()
+    finally:
+        LoggingPolicy.enable_engine_logs()
+
+
+def test_every_player_needs_a_policy():
+    with pytest.raises(ValueError):
+        HandSimulator(_players(2), {1: check_or_call_policy})
+
+
+def test_invalid_fold_probability():
+    with pytest.raises(ValueError):
+        RandomPolicy(fold_probability=1.5)
+
+
+def test_short_all_in_player_only_wins_the_main_pot():
+    players = [Player(1, "Short", 5), Player(2, "Big blind", 100), Player(3, "Caller", 100)]
+    simulator = HandSimulator(players, check_or_call_policy, big_blind_bet=20)
+    winnings = simulator.play_hand()
+    assert [pot.to_dict() for pot in simulator.game.get_pots()] == [
+        {"amount": 15, "eligible_player_ids": [1, 2, 3]},
+        {"amount": 30, "eligible_player_ids": [2, 3]},
+    ]
+    assert winnings.get(1, 0) <= 15
+    assert sum(player.current_stack for player in players) == 205
+
+
+def test_seed_replays_the_same_hands():
+    results = []
+    for _ in range(2):
+        simulator = HandSimulator(_players(4), RandomPolicy(seed=2), seed=11)
+        results.append([simulator.play_hand() for _ in range(10)])
+    assert results[0] == results[1]
@@ -0,0 +1,74 @@
+from loguru import logger
+from engine.classes.Player import Player
+from engine.classes.SingleGame import SingleGame
+from engine.utils.LoggingPolicy import LoggingPolicy
+
+
+def _play_preflop():
+    game = SingleGame(big_blind_bet=2)
+    game.register_players(Player(1, "John", 10), Player(2, "Jane", 10))
+    game.advance_betting_round()
+    return game
+
+
+def test_configure_filters_by_level():
+    messages = []
+    try:
+        LoggingPolicy.configure("INFO", messages.append, format="{message}")
+        _play_preflop()
+        assert any("has placed a bet of 1" in message for message in messages)
+        assert not any(message.startswith("Pot:") for message in messages)
+
+        messages.clear()
+        LoggingPolicy.configure("DEBUG", messages.append, format="{message}")
+        _play_preflop()
+        assert any(message.startswith("Pot: 3") for message in messages)
+    finally:
+        LoggingPolicy.configure()
+
+
+def test_debug_state_is_not_computed_when_debug_is_off(monkeypatch):
+    calls = []
+    try:
+        LoggingPolicy.configure("INFO", lambda message: None)
+        game = _play_preflop()
+        monkeypatch.setattr(game, "get_pot", lambda: calls.append(1) or 0)
+        game._log_state_in_debug_mode()
+        assert calls == []
+    finally:
+        LoggingPolicy.configure()
+
+
+def test_configure_none_turns_logging_off():
+    try:
+        assert LoggingPolicy.configure(None) is None
+        _play_preflop()
+    finally:
+        LoggingPolicy.configure()
+
+
+def test_disable_engine_logs():
+    messages = []
+    try:
+        LoggingPolicy.configure("DEBUG", messages.append, format="{message}")
+        LoggingPolicy.disable_engine_logs()
+        _play_preflop()
+        logger.info("outside the engine")
+        assert [message.strip() for message in messages] == ["outside the engine"]
+    finally:
+        LoggingPolicy.enable_engine_logs()
+        LoggingPolicy.configure()
+
+
+def test_engine_logs_disabled_restores_the_previous_state():
+    try:
+        with LoggingPolicy.engine_logs_disabled():
+            assert not LoggingPolicy.are_engine_logs_enabled()
+        assert LoggingPolicy.are_engine_logs_enabled()
+
+        LoggingPolicy.disable_engine_logs()
+        with LoggingPolicy.engine_logs_disabled():
+            pass
+        assert not LoggingPolicy.are_engine_logs_enabled()
+    finally:
+        LoggingPolicy.enable_engine_logs()
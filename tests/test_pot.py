@@ -0,0 +1,50 @@
+import pytest
+from engine.classes.Pot import Pot, award_pots, build_pots
+
+
+def test_single_pot_without_all_ins():
+    assert build_pots({1: 20, 2: 20, 3: 20}, [1, 2, 3]) == [Pot(60, [1, 2, 3])]
+
+
+def test_side_pots_from_all_ins():
+    pots = build_pots({1: 5, 2: 50, 3: 100, 4: 100}, [1, 2, 3, 4])
+    assert pots == [Pot(20, [1, 2, 3, 4]), Pot(135, [2, 3, 4]), Pot(100, [3, 4])]
+
+
+def test_folded_chips_join_the_pot_they_reach():
+    # Player 2 folded after putting in 30, more than the all-in player 1
+    pots = build_pots({1: 10, 2: 30, 3: 100, 4: 100}, [1, 3, 4])
+    assert pots == [Pot(40, [1, 3, 4]), Pot(200, [3, 4])]
+    assert sum(pot.amount for pot in pots) == 240
+
+
+def test_uncalled_bet_goes_back_to_the_bettor():
+    pots = build_pots({1: 50, 2: 200}, [1, 2])
+    assert pots == [Pot(100, [1, 2]), Pot(150, [2])]
+
+
+def test_live_players_who_put_nothing_in():
+    pots = build_pots({1: 10, 2: 20}, [2, 3])
+    assert pots == [Pot(30, [2])]
+
+
+def test_award_pots_to_best_eligible_hand():
+    pots = [Pot(20, [1, 2, 3, 4]), Pot(135, [2, 3, 4]), Pot(100, [3, 4])]
+    winnings = award_pots(pots, {1: 900, 2: 500, 3: 100, 4: 100})
+    # Player 1 wins the main pot, 2 the first side pot, 3 and 4 split the last one
+    assert winnings == {1: 20, 2: 135, 3: 50, 4: 50}
+
+
+def test_split_pot_odd_chips_go_to_earliest_seats():
+    winnings = award_pots([Pot(7, [3, 1, 2])], {1: 10, 2: 5, 3: 10})
+    assert winnings == {3: 4, 1: 3}
+
+
+@pytest.mark.parametrize("num_players", [2, 3, 6, 9])
+def test_pots_add_up_to_contributions(num_players):
+    contributions = {i: 10 * (i % 4) + 5 * i for i in range(1, num_players + 1)}
+    live = [i for i in contributions if i % 3]
+    pots = build_pots(contributions, live)
+    assert sum(pot.amount for pot in pots) == sum(contributions.values())
+    for pot in pots:
+        assert set(pot.eligible_player_ids) <= set(live)
@@ -0,0 +1,57 @@
+import random
+
+import pytest
+from engine.utils.PreflopEquityTable import (
+    PreflopEquityTable,
+    get_hand_class,
+    get_hand_classes,
+    simulate_equity_vs_random,
+)
+from engine.utils.WinningHandProbability import WinningHandProbability
+
+
+def test_169_hand_classes():
+    hand_classes = get_hand_classes()
+    assert len(hand_classes) == len(set(hand_classes)) == 169
+    assert hand_classes[0] == "AA"
+    assert hand_classes[-1] == "22"
+
+
+@pytest.mark.parametrize(
+    "hole_cards,hand_class",
+    [(["AS", "AD"], "AA"), (["KD", "AS"], "AKo"), (["7H", "2H"], "72s")],
+)
+def test_get_hand_class(hole_cards, hand_class):
+    assert get_hand_class(hole_cards) == hand_class
+
+
+def test_table_has_every_hand_class_and_player_count():
+    for hand_class in get_hand_classes():
+        for num_players in range(2, 7):
+            assert 0 < PreflopEquityTable.get_equity(hand_class, num_players) < 1
+
+
+def test_table_equities_are_plausible():
+    # Known heads-up equities vs a random hand: AA 85.2%, 72o 34.6%
+    assert PreflopEquityTable.get_equity("AA") == pytest.approx(0.852, abs=0.01)
+    assert PreflopEquityTable.get_equity("72o") == pytest.approx(0.346, abs=0.01)
+    assert PreflopEquityTable.get_equity("AA", 6) < PreflopEquityTable.get_equity("AA")
+
+
+def test_preflop_lookup_from_probability_module():
+    assert WinningHandProbability.get_preflop_equity_vs_random(
+        ["KD", "AS"], 3
+    ) == PreflopEquityTable.get_equity("AKo", 3)
+
+
+def test_simulate_equity_vs_random_is_reproducible():
+    first = simulate_equity_vs_random([51, 50], 2, 200, random.Random(1))
+    second = simulate_equity_vs_random([51, 50], 2, 200, random.Random(1))
+    assert first == second
+
+
+def test_reject_invalid_lookups():
+    with pytest.raises(ValueError):
+        PreflopEquityTable.get_equity("AAs")
+    with pytest.raises(ValueError):
+        PreflopEquityTable.get_equity("AA", 7)
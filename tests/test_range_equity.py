@@ -0,0 +1,68 @@
+import pytest
+from engine.utils.RangeEquity import RangeEquity
+from engine.utils.WinningHandProbability import WinningHandProbability
+
+
+def test_single_combo_ranges_match_hand_equity():
+    community_cards = ["2C", "7H", "9D"]
+    range_equity = RangeEquity({"Hero": "AsAd", "Villain": "KsKd"}, community_cards)
+    hand_equity = WinningHandProbability(
+        {"Hero": ["AS", "AD"], "Villain": ["KS", "KD"]}, community_cards
+    )
+    assert range_equity.is_exact()
+    assert range_equity.calculate_equity("Hero").equity == pytest.approx(
+        hand_equity.calculate_equity("Hero").equity
+    )
+
+
+def test_exact_range_equity_matches_average_over_combos():
+    community_cards = ["2C", "7H", "9D"]
+    range_equity = RangeEquity({"Hero": "AA", "Villain": "KK, AKs"}, community_cards)
+    results = range_equity.calculate_equities()
+    assert results["Hero"].is_exact
+    assert results["Hero"].equity + results["Villain"].equity == pytest.approx(1.0)
+
+    hero_combos = ["AdAc", "AhAc", "AsAc", "AhAd", "AsAd", "AsAh"]
+    villain_combos = ["KcKd", "KcKh", "KcKs", "KdKh", "KdKs", "KhKs"] + [
+        f"A{s}K{s}" for s in "cdhs"
+    ]
+    total, matchups = 0.0, 0
+    for hero in hero_combos:
+        for villain in villain_combos:
+            hero_cards = [hero[0:2].upper(), hero[2:4].upper()]
+            villain_cards = [villain[0:2].upper(), villain[2:4].upper()]
+            if set(hero_cards) & set(villain_cards + community_cards):
+                continue
+            total += WinningHandProbability(
+                {"Hero": hero_cards, "Villain": villain_cards}, community_cards
+            ).calculate_equity("Hero").equity
+            matchups += 1
+    assert results["Hero"].equity == pytest.approx(total / matchups)
+    assert set(results["Hero"].combo_equities) == set(hero_combos)
+
+
+def test_multiway_ranges_are_sampled():
+    range_equity = RangeEquity(
+        {"Hero": "QQ+", "Villain1": "random", "Villain2": "22+"},
+        ["2C", "7H", "9D"],
+        num_samples=2000,
+        seed=1,
+    )
+    assert not range_equity.is_exact()
+    results = range_equity.calculate_equities()
+    assert sum(r.equity for r in results.values()) == pytest.approx(1.0)
+    low, high = results["Hero"].confidence_interval
+    assert low < results["Hero"].equity < high
+
+
+def test_reject_range_blocked_by_board():
+    with pytest.raises(ValueError):
+        RangeEquity({"Hero": "AsKs", "Villain": "random"}, ["AS", "7H", "9D"])
+
+
+def test_reject_ranges_that_always_share_cards():
+    # Sampled preflop, the exact path would raise the same error
+    range_equity = RangeEquity({"Hero": "AsKs", "Villain": "AsKd"}, [], max_exact_evaluations=0)
+    assert not range_equity.is_exact()
+    with pytest.raises(ValueError):
+        range_equity.calculate_equities()
@@ -0,0 +1,93 @@
+from engine.classes.SeatRing import SeatRing
+
+
+def test_next_seat_wraps_around():
+    mask = 0b10110
+    assert SeatRing.next_seat(mask, -1) == 1
+    assert SeatRing.next_seat(mask, 1) == 2
+    assert SeatRing.next_seat(mask, 2) == 4
+    assert SeatRing.next_seat(mask, 4) == 1
+    assert SeatRing.next_seat(0, 3) == -1
+
+
+def test_blinds_follow_the_button():
+    ring = SeatRing(4)
+    ring.start_hand(0b1111)
+    assert (ring.get_small_blind_seat(), ring.get_big_blind_seat()) == (0, 1)
+    ring.rotate_button()
+    ring.rotate_button()
+    ring.start_hand(0b1111)
+    assert (ring.get_small_blind_seat(), ring.get_big_blind_seat()) == (2, 3)
+    # Seats sitting the hand out are skipped
+    ring.start_hand(0b1011)
+    assert (ring.get_small_blind_seat(), ring.get_big_blind_seat()) == (3, 0)
+
+
+def test_street_order_skips_folded_and_all_in_seats():
+    ring = SeatRing(5)
+    ring.start_hand(0b11111)
+    ring.start_street()
+    assert ring.get_seats_to_act() == [0, 1, 2, 3, 4]
+    ring.act(0)
+    ring.fold(1)
+    ring.go_all_in(2)
+    assert ring.get_next_to_act() == 3
+    assert ring.get_seats_to_act() == [3, 4]
+    ring.act(3)
+    ring.act(4)
+    assert ring.is_street_complete()
+    assert ring.get_next_to_act() == -1
+
+    ring.start_street()
+    assert ring.get_seats_to_act() == [0, 3, 4]
+    assert ring.count_in_hand() == 4
+
+
+def test_remove_seat_shifts_the_seats_after_it():
+    ring = SeatRing(4)
+    ring.button = 2
+    ring.start_hand(0b1101)
+    ring.remove_seat(1)
+    assert ring.num_seats == 3
+    assert ring.in_hand == 0b111
+    assert ring.button == 1
+    ring.rotate_button()
+    ring.rotate_button()
+    assert ring.button == 0
+
+
+def test_heads_up_button_posts_the_small_blind():
+    ring = SeatRing(2)
+    ring.start_hand(0b11)
+    assert ring.button == 0
+    assert (ring.get_small_blind_seat(), ring.get_big_blind_seat()) == (0, 1)
+    ring.rotate_button()
+    ring.start_hand(0b11)
+    assert (ring.get_small_blind_seat(), ring.get_big_blind_seat()) == (1, 0)
+    # Down to two players, the button moves onto the next seat still in the hand
+    ring = SeatRing(3)
+    ring.button = 1
+    ring.start_hand(0b101)
+    assert (ring.get_small_blind_seat(), ring.get_big_blind_seat()) == (2, 0)
+
+
+def test_heads_up_button_acts_first_preflop_and_last_after():
+    ring = SeatRing(2)
+    ring.rotate_button()
+    ring.start_hand(0b11)
+    ring.start_street()
+    # The big blind posts last, so the button is next to act preflop
+    ring.last_seat = ring.get_big_blind_seat()
+    assert ring.get_next_to_act() == 0
+    ring.start_street()
+    assert ring.get_seats_to_act() == [1, 0]
+
+
+def test_no_one_acts_when_only_one_player_can_bet():
+    ring = SeatRing(3)
+    ring.start_hand(0b111)
+    ring.go_all_in(0)
+    ring.fold(1)
+    ring.start_street()
+    assert ring.is_street_complete()
+    assert ring.get_next_to_act() == -1
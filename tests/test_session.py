@@ -0,0 +1,133 @@
+import pytest
+from engine.classes.Player import Player
+from engine.session import Table, Tournament
+from engine.utils.HandSimulator import RandomPolicy, check_or_call_policy
+from engine.utils.LoggingPolicy import LoggingPolicy
+
+
+def _players(num_players, starting_stack=100):
+    return [Player(i, f"Bot {i}", starting_stack) for i in range(1, num_players + 1)]
+
+
+def _policies(players, policy):
+    return {player.player_id: policy for player in players}
+
+
+def test_players_are_seated_evenly():
+    players = _players(20)
+    tournament = Tournament(players, _policies(players, check_or_call_policy), table_size=9)
+    assert [table.count_players() for table in tournament.tables] == [7, 7, 6]
+
+
+def test_table_keeps_stacks_and_rotates_the_button():
+    players = _players(3)
+    table = Table(0, players, _policies(players, check_or_call_policy), big_blind_bet=2)
+    table.play_hand()
+    assert sum(player.current_stack for player in players) == 300
+    assert table.game.get_bets()["preflop"][0].player.player_id == 1
+    table.play_hand()
+    # Seats stay put, the small blind moves one seat to the left
+    assert [player.player_id for player in table.get_players()] == [1, 2, 3]
+    assert table.game.get_bets()["preflop"][0].player.player_id == 2
+    assert table.stats.hands == 2
+    assert table.stats.max_latency >= table.stats.mean_latency > 0
+
+
+def test_rebalance_breaks_and_evens_out_tables():
+    players = _players(12)
+    tournament = Tournament(players, _policies(players, check_or_call_policy), table_size=6)
+    # Knock out 7 players from the first table's side
+    for table in tournament.tables:
+        for player in list(table.get_players()):
+            if player.player_id <= 7:
+                table.unseat_player(player.player_id)
+    tournament.rebalance()
+    assert len(tournament.tables) == 1
+    assert tournament.count_remaining_players() == 5
+
+    players = _players(10)
+    tournament = Tournament(players, _policies(players, check_or_call_policy), table_size=6)
+    tournament.tables[0].unseat_player(1)
+    tournament.tables[0].unseat_player(3)
+    tournament.tables[0].unseat_player(5)
+    tournament.rebalance()
+    assert sorted(table.count_players() for table in tournament.tables) == [3, 4]
+
+
+def test_tournament_runs_to_a_single_winner():
+    players = _players(12, starting_stack=20)
+    tournament = Tournament(
+        players,
+        _policies(players, RandomPolicy(fold_probability=0.1, seed=5)),
+        table_size=6,
+        big_blind_bet=10,
+        max_workers=4,
+    )
+    result = tournament.run(max_rounds=5000)
+    assert tournament.is_finished()
+    assert sorted(result.standings) == list(range(1, 13))
+    winner = next(player for player in players if player.player_id == result.standings[0])
+    assert winner.current_stack == 12 * 20
+    assert result.hands == sum(stats["hands"] for stats in result.table_stats.values())
+    assert result.hands >= result.rounds
+    assert set(result.table_stats) == {0, 1}
+
+
+def test_max_rounds():
+    players = _players(4)
+    tournament = Tournament(players, _policies(players, check_or_call_policy), table_size=2)
+    result = tournament.run(max_rounds=3)
+    assert result.rounds == 3
+    assert sum(player.current_stack for player in players) == 400
+
+
+def test_tables_sharded_across_processes_play_the_same():
+    results = []
+    for processes in (1, 2):
+        players = _players(12, starting_stack=40)
+        tournament = Tournament(
+            players,
+            _policies(players, check_or_call_policy),
+            table_size=4,
+            big_blind_bet=10,
+            seed=3,
+            processes=processes,
+        )
+        result = tournament.run(max_rounds=30)
+        results.append(
+            (result.standings, [player.current_stack for player in players], result.hands)
+        )
+    assert results[0] == results[1]
+    assert sum(results[1][1]) == 12 * 40
+
+
+def test_tournament_in_processes_runs_to_a_single_winner():
+    players = _players(8, starting_stack=20)
+    tournament = Tournament(
+        players,
+        _policies(players, RandomPolicy(fold_probability=0.1, seed=5)),
+        table_size=4,
+        big_blind_bet=10,
+        processes=2,
+    )
+    result = tournament.run(max_rounds=5000)
+    assert tournament.is_finished()
+    winner = next(player for player in players if player.player_id == result.standings[0])
+    assert winner.current_stack == 8 * 20
+
+
+def test_run_keeps_engine_logs_disabled_by_the_caller():
+    players = _players(4)
+    tournament = Tournament(players, _policies(players, check_or_call_policy), table_size=2)
+    LoggingPolicy.disable_engine_logs()
+    try:
+        tournament.run(max_rounds=1)
+        assert not LoggingPolicy.are_engine_logs_enabled()
+    finally:
+        LoggingPolicy.enable_engine_logs()
+
+
+def test_tournament_needs_two_players():
+    players = _players(1)
+    with pytest.raises(ValueError):
+        Tournament(players, _policies(players, check_or_call_policy))
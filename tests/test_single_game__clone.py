@@ -0,0 +1,93 @@
+import random
+
+import pytest
+from engine.classes.Player import Player
+from engine.classes.SingleGame import PlayerAction, SingleGame
+from engine.utils.GameSnapshot import GameSnapshot
+
+
+@pytest.fixture
+def preflop_game():
+    game = SingleGame(big_blind_bet=2, seed=4)
+    game.register_players(
+        Player(player_id=1, player_name="John", starting_stack=40),
+        Player(player_id=2, player_name="Jane", starting_stack=100),
+        Player(player_id=3, player_name="Jim", starting_stack=15),
+        Player(player_id=4, player_name="Jill", starting_stack=100),
+    )
+    game.advance_betting_round()
+    return game
+
+
+def _random_action(game, rng):
+    legal_actions = game.get_legal_actions()
+    action = rng.choice(legal_actions.get_actions())
+    if action == PlayerAction.RAISE:
+        return action, rng.choice([legal_actions.min_raise_to, legal_actions.max_raise_to])
+    return action, 0
+
+
+def test_clone_is_independent(preflop_game):
+    snapshot = GameSnapshot.dump(preflop_game)
+    clone = preflop_game.clone()
+    assert GameSnapshot.dump(clone) == snapshot
+    player = clone.advance_to_next_decision()
+    while player is not None:
+        clone.process_player_action(player.player_id, PlayerAction.CALL)
+        player = clone.advance_to_next_decision()
+    clone.resolve_winner()
+    assert clone.get_community_cards().get_deck_size() == 5
+    assert GameSnapshot.dump(preflop_game) == snapshot
+
+
+def test_clone_shuffles_independently(preflop_game):
+    clone = preflop_game.clone()
+    clone.deck.reset()
+    preflop_game.deck.reset()
+    assert clone.deck == preflop_game.deck
+    clone.deck.reset()
+    assert clone.deck != preflop_game.deck
+
+
+def test_make_action_matches_process_player_action(preflop_game):
+    clone = preflop_game.clone()
+    rng = random.Random(1)
+    player = preflop_game.advance_to_next_decision()
+    while player is not None:
+        action, amount = _random_action(preflop_game, rng)
+        player = preflop_game.make_action(player.player_id, action, amount)
+        clone.process_player_action(clone.get_next_actionable_player().player_id, action, amount)
+        clone.advance_to_next_decision()
+        assert GameSnapshot.dump(preflop_game) == GameSnapshot.dump(clone)
+    assert preflop_game.resolve_winner() == clone.resolve_winner()
+
+
+def _get_state(game):
+    strengths = {
+        player_id: game.get_player_hand_strength(player_id) for player_id in game.hand_states
+    }
+    return GameSnapshot.dump(game), strengths
+
+
+def test_unmake_action_restores_every_state(preflop_game):
+    rng = random.Random(2)
+    for _ in range(50):
+        snapshots = []
+        player = preflop_game.advance_to_next_decision()
+        while player is not None:
+            snapshots.append(_get_state(preflop_game))
+            player = preflop_game.make_action(player.player_id, *_random_action(preflop_game, rng))
+        preflop_game.resolve_winner()
+        while snapshots:
+            preflop_game.unmake_action()
+            assert _get_state(preflop_game) == snapshots.pop()
+    with pytest.raises(ValueError):
+        preflop_game.unmake_action()
+
+
+def test_illegal_make_action_saves_nothing(preflop_game):
+    with pytest.raises(ValueError):
+        preflop_game.make_action(1, PlayerAction.CALL)
+    with pytest.raises(ValueError):
+        preflop_game.make_action(4, PlayerAction.RAISE, 3)
+    assert preflop_game.action_stack == []
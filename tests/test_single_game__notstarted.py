@@ -1,3 +1,5 @@
+import copy
+import pickle
 import pytest
 from engine.classes.Player import Player
 from engine.classes.Deck import Deck
@@ -152,6 +154,18 @@ def test_reject_game_start_when_less_than_two_players_are_registered():
         game.advance_betting_round()
 
 
+def test_register_players_in_batches(notstarted_game):
+    players = [Player(player_id=i, player_name=f"Bot {i}", starting_stack=20) for i in range(3, 7)]
+    registered = notstarted_game.register_players(*players)
+    # Player 3 is already seated
+    assert [player.player_id for player in registered] == [4, 5, 6]
+    assert notstarted_game.count_players() == 6
+    assert notstarted_game.seats == {1: 0, 2: 1, 3: 2, 4: 3, 5: 4, 6: 5}
+    assert [player_id for player_id, _ in notstarted_game.initial_stack_sizes] == [
+        1, 2, 3, 4, 5, 6
+    ]
+
+
 """
 PART 4: Pot, Bets
 """
@@ -174,3 +188,21 @@ def test_notstarted_game_has_no_players_bets(notstarted_game):
 def test_reject_odd_numbered_big_blind():
     with pytest.raises(ValueError):
         SingleGame(big_blind_bet=5)
+
+
+def test_seeded_games_deal_the_same_deck():
+    game1, game2 = SingleGame(seed=9), SingleGame(seed=9)
+    assert (
+        game1.get_deck_order_as_list_of_verbose_names()
+        == game2.get_deck_order_as_list_of_verbose_names()
+    )
+
+
+def test_unseeded_game_can_be_pickled_and_copied(notstarted_game):
+    game = copy.deepcopy(pickle.loads(pickle.dumps(notstarted_game)))
+    assert (
+        game.get_deck_order_as_list_of_verbose_names()
+        == notstarted_game.get_deck_order_as_list_of_verbose_names()
+    )
+    game.advance_betting_round()
+    assert game.get_betting_round() != notstarted_game.get_betting_round()
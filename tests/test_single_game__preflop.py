@@ -90,3 +90,114 @@ def test_pot_amount_after_blinds_are_posted(preflop_game):
     big_blind: int = preflop_game.get_big_blind_bet()
     small_blind: int = int(big_blind / 2)
     assert preflop_game.get_pot() == big_blind + small_blind
+
+
+def test_no_hand_rank_before_the_flop(preflop_game):
+    for player in preflop_game.get_players():
+        assert preflop_game.get_player_hand_rank(player.player_id) is None
+
+
+def test_blinds_are_posted_by_the_first_two_players(preflop_game):
+    players = preflop_game.get_players()
+    assert players[0].current_stack == 10 - preflop_game.get_small_blind_bet()
+    assert players[1].current_stack == 10 - preflop_game.get_big_blind_bet()
+    assert preflop_game.get_next_actionable_player() == players[2]
+
+
+def test_preflop_call_call_completes_the_street(preflop_game):
+    preflop_game.process_player_action(3, PlayerAction.CALL)
+    assert preflop_game.get_next_actionable_player().player_id == 1
+    with pytest.raises(ValueError):
+        preflop_game.process_player_action(1, PlayerAction.CHECK)
+    preflop_game.process_player_action(1, PlayerAction.CALL)
+    assert not preflop_game.is_betting_street_complete()
+    assert preflop_game.get_next_actionable_player().player_id == 2
+    preflop_game.process_player_action(2, PlayerAction.CHECK)
+    assert preflop_game.is_betting_street_complete()
+    assert preflop_game.get_pot() == 6
+
+
+def test_big_blind_can_raise_a_limped_pot(preflop_game):
+    preflop_game.process_player_action(3, PlayerAction.CALL)
+    preflop_game.process_player_action(1, PlayerAction.CALL)
+    assert preflop_game.get_legal_actions().can_raise
+    preflop_game.process_player_action(2, PlayerAction.RAISE, 6)
+    assert preflop_game.get_remaining_betting_street() == [3, 1]
+    preflop_game.process_player_action(3, PlayerAction.CALL)
+    preflop_game.process_player_action(1, PlayerAction.FOLD)
+    assert preflop_game.is_betting_street_complete()
+    assert preflop_game.get_pot() == 14
+
+
+def test_preflop_fold(preflop_game):
+    preflop_game.process_player_action(3, PlayerAction.FOLD)
+    assert preflop_game.count_active_players() == 2
+    assert preflop_game.get_next_actionable_player().player_id == 1
+    with pytest.raises(ValueError):
+        preflop_game.process_player_action(3, PlayerAction.CALL)
+
+
+def test_out_of_turn_action_is_rejected(preflop_game):
+    with pytest.raises(ValueError):
+        preflop_game.process_player_action(1, PlayerAction.CALL)
+
+
+def test_street_bets_are_tracked_per_player(preflop_game):
+    assert preflop_game.get_current_bet() == 2
+    assert preflop_game.get_player_street_bet(1) == 1
+    assert preflop_game.get_player_street_bet(2) == 2
+    assert preflop_game.get_player_street_bet(3) == 0
+    preflop_game.process_player_action(3, PlayerAction.CALL)
+    preflop_game.process_player_action(1, PlayerAction.CALL)
+    assert [preflop_game.get_player_total_bet(i) for i in (1, 2, 3)] == [2, 2, 2]
+    assert preflop_game.get_pot() == sum(
+        bet.amount for bet in preflop_game.get_bets()["preflop"]
+    )
+
+
+def test_next_hand_moves_the_blinds_one_seat(preflop_game):
+    preflop_game.start_new_hand()
+    preflop_game.advance_betting_round()
+    players = preflop_game.get_players()
+    assert [player.player_id for player in players] == [1, 2, 3]
+    assert [player.player_id for player in preflop_game.get_active_players()] == [2, 3, 1]
+    assert preflop_game.get_player_street_bet(2) == 1
+    assert preflop_game.get_player_street_bet(3) == 2
+    assert preflop_game.get_remaining_betting_street() == [1, 2, 3]
+
+
+def test_heads_up_button_is_the_small_blind():
+    game = SingleGame(big_blind_bet=2)
+    game.register_players(
+        Player(player_id=1, player_name="John", starting_stack=10),
+        Player(player_id=2, player_name="Jane", starting_stack=10),
+    )
+    game.advance_betting_round()
+    assert game.get_player_street_bet(1) == 1
+    assert game.get_player_street_bet(2) == 2
+    assert game.get_next_actionable_player().player_id == 1
+    game.process_player_action(1, PlayerAction.RAISE, 4)
+    game.process_player_action(2, PlayerAction.CALL)
+    game.advance_betting_round()
+    assert game.get_next_actionable_player().player_id == 2
+    assert game.get_remaining_betting_street() == [2, 1]
+
+    game.start_new_hand()
+    game.advance_betting_round()
+    assert game.get_player_street_bet(2) == 1
+    assert game.get_player_street_bet(1) == 2
+    assert game.get_next_actionable_player().player_id == 2
+
+
+def test_board_runs_out_after_an_all_in_is_called():
+    game = SingleGame(big_blind_bet=2)
+    game.register_players(
+        Player(player_id=1, player_name="John", starting_stack=10),
+        Player(player_id=2, player_name="Jane", starting_stack=100),
+    )
+    game.advance_betting_round()
+    game.process_player_action(1, PlayerAction.RAISE, 10)
+    game.process_player_action(2, PlayerAction.CALL)
+    # Jane is the only one left who can bet, so she gets no more decisions
+    assert game.advance_to_next_decision() is None
+    assert game.get_community_cards().get_deck_size() == 5
@@ -5,3 +5,106 @@ from engine.classes.SingleGame import SingleGame, PlayerAction
 
 from engine.classes.Card import VERBOSE_NAMES
 from loguru import logger
+
+
+@pytest.fixture
+def preflop_game():
+    game = SingleGame(big_blind_bet=2)
+    player1 = Player(player_id=1, player_name="John", starting_stack=10)
+    player2 = Player(player_id=2, player_name="Jane", starting_stack=10)
+    player3 = Player(player_id=3, player_name="Jim", starting_stack=20)
+    game.register_players(player1, player2, player3)
+    game.advance_betting_round()  # notstarted to preflop
+    return game
+
+
+@pytest.fixture
+def short_stack_game():
+    game = SingleGame(big_blind_bet=2)
+    game.register_players(
+        Player(player_id=1, player_name="John", starting_stack=100),
+        Player(player_id=2, player_name="Jane", starting_stack=100),
+        Player(player_id=3, player_name="Jim", starting_stack=100),
+        Player(player_id=4, player_name="Jill", starting_stack=13),
+    )
+    game.advance_betting_round()
+    return game
+
+
+def test_legal_actions_facing_the_big_blind(preflop_game):
+    legal_actions = preflop_game.get_legal_actions()
+    assert legal_actions.player.player_id == 3
+    assert legal_actions.get_actions() == [
+        PlayerAction.FOLD,
+        PlayerAction.CALL,
+        PlayerAction.RAISE,
+    ]
+    assert legal_actions.amount_to_call == 2
+    assert (legal_actions.min_raise_to, legal_actions.max_raise_to) == (4, 20)
+    assert not legal_actions.is_legal(PlayerAction.CHECK)
+    assert not legal_actions.is_legal(PlayerAction.RAISE, 3)
+    assert legal_actions.is_legal(PlayerAction.RAISE, 20)
+
+
+def test_raise_reopens_the_betting_for_the_big_blind(preflop_game):
+    preflop_game.process_player_action(3, PlayerAction.RAISE, 6)
+    assert preflop_game.get_current_bet() == 6
+    preflop_game.process_player_action(1, PlayerAction.CALL)
+    legal_actions = preflop_game.get_legal_actions()
+    assert legal_actions.player.player_id == 2
+    assert legal_actions.amount_to_call == 4
+    # The big blind can only go all-in, short of the minimum raise to 10
+    assert (legal_actions.min_raise_to, legal_actions.max_raise_to) == (10, 10)
+    preflop_game.process_player_action(2, PlayerAction.CALL)
+    assert preflop_game.is_betting_street_complete()
+    assert preflop_game.get_legal_actions() is None
+    assert preflop_game.get_pot() == 18
+
+
+def test_reraise_sets_the_minimum_raise(preflop_game):
+    preflop_game.process_player_action(3, PlayerAction.RAISE, 5)
+    legal_actions = preflop_game.get_legal_actions()
+    assert legal_actions.player.player_id == 1
+    assert legal_actions.min_raise_to == 8
+    preflop_game.process_player_action(1, PlayerAction.RAISE, 8)
+    assert preflop_game.get_remaining_betting_street() == [2, 3]
+    assert preflop_game.get_legal_actions().min_raise_to == 10
+
+
+def test_illegal_raises_are_rejected(preflop_game):
+    with pytest.raises(ValueError):
+        preflop_game.process_player_action(3, PlayerAction.RAISE, 3)
+    with pytest.raises(ValueError):
+        preflop_game.process_player_action(3, PlayerAction.RAISE, 21)
+    assert preflop_game.get_pot() == 3
+
+
+def test_short_all_in_does_not_reopen_the_raising(short_stack_game):
+    short_stack_game.process_player_action(3, PlayerAction.RAISE, 10)
+    legal_actions = short_stack_game.get_legal_actions()
+    assert (legal_actions.min_raise_to, legal_actions.max_raise_to) == (13, 13)
+    short_stack_game.process_player_action(4, PlayerAction.RAISE, 13)
+    assert short_stack_game.get_players()[3].is_all_in
+    # The minimum raise is still 8 on top of the largest bet
+    assert short_stack_game.get_legal_actions().min_raise_to == 21
+    short_stack_game.process_player_action(1, PlayerAction.CALL)
+    short_stack_game.process_player_action(2, PlayerAction.CALL)
+    legal_actions = short_stack_game.get_legal_actions()
+    assert legal_actions.player.player_id == 3
+    assert legal_actions.amount_to_call == 3
+    assert not legal_actions.can_raise
+    with pytest.raises(ValueError):
+        short_stack_game.process_player_action(3, PlayerAction.RAISE, 21)
+    short_stack_game.process_player_action(3, PlayerAction.CALL)
+    assert short_stack_game.is_betting_street_complete()
+
+
+def test_minimum_bet_on_the_flop_is_the_big_blind(preflop_game):
+    preflop_game.process_player_action(3, PlayerAction.RAISE, 6)
+    preflop_game.process_player_action(1, PlayerAction.CALL)
+    preflop_game.process_player_action(2, PlayerAction.CALL)
+    preflop_game.advance_betting_round()
+    legal_actions = preflop_game.get_legal_actions()
+    assert legal_actions.player.player_id == 1
+    assert legal_actions.can_check
+    assert (legal_actions.min_raise_to, legal_actions.max_raise_to) == (2, 4)
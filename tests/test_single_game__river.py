@@ -4,6 +4,7 @@ from engine.classes.Deck import Deck
 from engine.classes.SingleGame import SingleGame, PlayerAction
 
 from engine.classes.Card import VERBOSE_NAMES
+from engine.utils.HandEvaluator import evaluate, get_hand_rank
 from loguru import logger
 
 
@@ -43,3 +44,13 @@ PART 3: Players (all players, active players)
 """
 PART 4: Pot, Bets
 """
+
+
+def test_river_hand_ranks_match_full_evaluation(river_game):
+    community_cards = river_game.get_community_cards().get_cards_as_ints()
+    assert len(community_cards) == 5
+    for player in river_game.get_players():
+        strength = evaluate(player.get_hand_as_ints() + community_cards)
+        assert river_game.get_player_hand_strength(player.player_id) == strength
+        assert river_game.get_player_hand_rank(player.player_id) == get_hand_rank(strength)
+    assert set(river_game.get_hand_ranks()) == {1, 2, 3}
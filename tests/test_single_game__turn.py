@@ -42,3 +42,10 @@ PART 3: Players (all players, active players)
 """
 PART 4: Pot, Bets
 """
+
+
+def test_street_bets_reset_on_a_new_street(turn_game):
+    assert turn_game.get_current_bet() == 0
+    assert turn_game.get_player_street_bet(2) == 0
+    assert turn_game.get_player_total_bet(2) == 2
+    assert turn_game.get_pot() == 3
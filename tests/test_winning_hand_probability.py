@@ -0,0 +1,163 @@
+import pytest
+from engine.utils.WinningHandProbability import WinningHandProbability
+from engine.utils.LoggingPolicy import LoggingPolicy
+
+
+@pytest.fixture
+def flop_probability():
+    return WinningHandProbability(
+        {"Player1": ["AS", "AD"], "Player2": ["KS", "KD"]}, ["2C", "7H", "9D"]
+    )
+
+
+def test_flop_is_enumerated_exactly(flop_probability):
+    assert flop_probability.count_runouts() == 990
+    assert flop_probability.is_exact()
+    equity = flop_probability.calculate_equity("Player1")
+    assert equity.is_exact
+    assert equity.runouts == 990
+    # Player2 only wins when a king comes without an ace: 2 * 41 + 1 runouts
+    assert equity.lose == pytest.approx(83 / 990)
+    assert equity.confidence_interval == (equity.equity, equity.equity)
+
+
+def test_equities_sum_to_one(flop_probability):
+    equities = flop_probability.calculate_equities()
+    assert sum(e.equity for e in equities.values()) == pytest.approx(1.0)
+    for equity in equities.values():
+        assert equity.win + equity.tie + equity.lose == pytest.approx(1.0)
+
+
+def test_win_probability_on_the_river():
+    probability = WinningHandProbability(
+        {"Player1": ["AS", "AD"], "Player2": ["KS", "KD"]},
+        ["2C", "7H", "9D", "KH", "3S"],
+    )
+    assert probability.calculate_win_probability("Player1") == 0.0
+    assert probability.calculate_win_probability("Player2") == 1.0
+
+
+def test_split_pot_on_the_river():
+    probability = WinningHandProbability(
+        {"Player1": ["2S", "3D"], "Player2": ["2H", "3C"]},
+        ["AC", "KH", "QD", "JS", "TC"],
+    )
+    equity = probability.calculate_equity("Player1")
+    assert equity.tie == 1.0
+    assert equity.equity == 0.5
+    assert probability.calculate_all_probabilities() == {
+        "Player1": 0.0,
+        "Player2": 0.0,
+    }
+
+
+def test_preflop_uses_monte_carlo_with_confidence_interval():
+    probability = WinningHandProbability(
+        {"Player1": ["AS", "AD"], "Player2": ["KS", "KD"]},
+        [],
+        num_samples=5000,
+        seed=7,
+    )
+    assert not probability.is_exact()
+    equity = probability.calculate_equity("Player1")
+    assert not equity.is_exact
+    assert equity.runouts == 5000
+    low, high = equity.confidence_interval
+    assert low < equity.equity < high
+    # Exact AA vs KK preflop equity is 0.8264
+    assert low - 0.01 < 0.8264 < high + 0.01
+
+
+def test_monte_carlo_is_reproducible_with_seed():
+    hands = {"Player1": ["AS", "KD"], "Player2": ["QS", "QD"], "Player3": ["7H", "8H"]}
+    first = WinningHandProbability(hands, [], num_samples=1000, seed=3)
+    second = WinningHandProbability(hands, [], num_samples=1000, seed=3)
+    assert first.calculate_all_probabilities() == second.calculate_all_probabilities()
+
+
+def test_reject_unknown_player(flop_probability):
+    with pytest.raises(ValueError):
+        flop_probability.calculate_win_probability("Player3")
+
+
+def test_reject_duplicate_cards():
+    with pytest.raises(ValueError):
+        WinningHandProbability(
+            {"Player1": ["AS", "AD"], "Player2": ["AS", "KD"]}, ["2C", "7H", "9D"]
+        )
+
+
+def test_process_pool_is_identical_to_single_process():
+    hands = {"Player1": ["AS", "KD"], "Player2": ["QS", "QD"], "Player3": ["7H", "8H"]}
+    community_cards = ["2C", "9H", "TH"]
+    single = WinningHandProbability(hands, community_cards).calculate_equities()
+    pooled = WinningHandProbability(
+        hands, community_cards, processes=2
+    ).calculate_equities()
+    for player in hands:
+        assert pooled[player].to_dict() == single[player].to_dict()
+
+
+def test_process_pool_enumerates_preflop():
+    hands = {"Player1": ["AS", "KD"], "Player2": ["QS", "QD"]}
+    assert not WinningHandProbability(hands, []).is_exact()
+    assert WinningHandProbability(hands, [], processes=2).is_exact()
+
+
+def test_sampling_with_a_process_pool_logs_a_warning():
+    messages = []
+    probability = WinningHandProbability(
+        {"Player1": ["AS", "KD"], "Player2": ["QS", "QD"]},
+        [],
+        num_samples=100,
+        max_exact_runouts=1000,
+        processes=2,
+    )
+    try:
+        LoggingPolicy.configure("WARNING", messages.append, format="{message}")
+        probability.calculate_equities()
+    finally:
+        LoggingPolicy.configure()
+    assert any("instead of using 2 processes" in message for message in messages)
+
+
+def test_hand_type_probability_on_the_river():
+    probability = WinningHandProbability(
+        {"Player1": ["AS", "AD"], "Player2": ["KS", "KD"]},
+        ["2C", "7H", "9D", "KH", "3S"],
+    )
+    hand_types = probability.calculate_hand_type_probability("Player2")
+    assert hand_types["Three of a Kind"] == 1.0
+    assert sum(hand_types.values()) == 1.0
+    assert probability.calculate_hand_type_probability("Player1")["One Pair"] == 1.0
+
+
+def test_hand_type_probability_on_the_turn():
+    probability = WinningHandProbability(
+        {"Player1": ["AS", "AD"], "Player2": ["KS", "KD"]}, ["2C", "7H", "9D", "3S"]
+    )
+    hand_types = probability.calculate_hand_type_probability("Player1")
+    # 44 rivers: 2 aces make a set, 12 pair the board for two pair, the rest one pair
+    assert hand_types["Three of a Kind"] == pytest.approx(2 / 44)
+    assert hand_types["Two Pair"] == pytest.approx(12 / 44)
+    assert hand_types["One Pair"] == pytest.approx(30 / 44)
+
+
+def test_hand_types_are_only_counted_when_asked(flop_probability):
+    equities = {name: e.to_dict() for name, e in flop_probability.calculate_equities().items()}
+    assert flop_probability._hand_type_counts is None
+    assert sum(
+        flop_probability.calculate_hand_type_probability("Player1").values()
+    ) == pytest.approx(1.0)
+    assert {
+        name: e.to_dict() for name, e in flop_probability.calculate_equities().items()
+    } == equities
+
+
+def test_hand_type_pass_samples_the_same_runouts():
+    probability = WinningHandProbability(
+        {"Player1": ["AS", "KD"], "Player2": ["QH", "QC"]}, [], max_exact_runouts=0, seed=2
+    )
+    equities = {name: e.to_dict() for name, e in probability.calculate_equities().items()}
+    probability.calculate_hand_type_probability("Player2")
+    assert {name: e.to_dict() for name, e in probability.calculate_equities().items()} == equities
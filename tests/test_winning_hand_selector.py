@@ -0,0 +1,85 @@
+import pytest
+from engine.utils.WinningHandSelector import (
+    WinningHandSelector,
+    HandRank,
+    SHORT_NAME_TO_INT,
+)
+
+
+# Common test data
+@pytest.fixture
+def valid_hands():
+    return {"Player1": ["AS", "KS"], "Player2": ["JH", "JD"]}
+
+
+@pytest.fixture
+def valid_community():
+    return ["JS", "JC", "4H", "8D", "2C"]
+
+
+def test_valid_hands(valid_hands, valid_community):
+    assert WinningHandSelector.validate_hands(valid_hands, valid_community) == True
+
+
+def test_invalid_card_format(valid_community):
+    invalid_format_hands = {"Player1": ["ASS", "KS"], "Player2": ["JH", "JD"]}
+    with pytest.raises(ValueError, match="Invalid card format"):
+        WinningHandSelector.validate_hands(invalid_format_hands, valid_community)
+
+
+def test_invalid_card_face(valid_community):
+    invalid_face_hands = {"Player1": ["XS", "KS"], "Player2": ["JH", "JD"]}
+    with pytest.raises(ValueError, match="Invalid card face"):
+        WinningHandSelector.validate_hands(invalid_face_hands, valid_community)
+
+
+def test_invalid_card_suit(valid_community):
+    invalid_suit_hands = {"Player1": ["AX", "KS"], "Player2": ["JH", "JD"]}
+    with pytest.raises(ValueError, match="Invalid card suit"):
+        WinningHandSelector.validate_hands(invalid_suit_hands, valid_community)
+
+
+def test_duplicate_cards_with_community(valid_hands):
+    duplicate_community = ["AS", "JC", "4H", "8D", "2C"]  # AS is duplicated
+    with pytest.raises(ValueError, match="Duplicate cards found"):
+        WinningHandSelector.validate_hands(valid_hands, duplicate_community)
+
+
+def test_wrong_number_of_community_cards(valid_hands):
+    with pytest.raises(
+        ValueError, match="Number of community cards must be 0, 3, 4, or 5"
+    ):
+        WinningHandSelector.validate_hands(valid_hands, ["2H", "3H"])
+
+
+def test_evaluate_hands_single_winner(valid_hands, valid_community):
+    assert WinningHandSelector.evaluate_hands(valid_hands, valid_community) == [
+        "Player2"
+    ]
+
+
+def test_evaluate_hands_split_pot():
+    player_hands = {"Player1": ["AS", "2D"], "Player2": ["AH", "3C"]}
+    community_cards = ["KS", "KC", "QH", "QD", "JC"]
+    assert WinningHandSelector.evaluate_hands(player_hands, community_cards) == [
+        "Player1",
+        "Player2",
+    ]
+
+
+def test_get_hand_rank(valid_hands, valid_community):
+    assert (
+        WinningHandSelector.get_hand_rank(valid_hands["Player2"] + valid_community)
+        == HandRank.FOUR_OF_A_KIND
+    )
+
+
+def test_evaluate_int_hands_matches_evaluate_hands(valid_hands, valid_community):
+    int_hands = {
+        player: [SHORT_NAME_TO_INT[card] for card in cards]
+        for player, cards in valid_hands.items()
+    }
+    int_community = [SHORT_NAME_TO_INT[card] for card in valid_community]
+    assert WinningHandSelector.evaluate_int_hands(
+        int_hands, int_community
+    ) == WinningHandSelector.evaluate_hands(valid_hands, valid_community)